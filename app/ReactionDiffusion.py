@@ -15,9 +15,10 @@ Limitations:
 """
 
 import numpy as np
-import time
 import random
 
+from scheduler import FrameScheduler
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -42,6 +43,7 @@ BRIGHTNESS = 200                    # Max brightness for patterns (0-255)
 
 # Pattern change settings
 FRAMES_PER_PATTERN = 700  # Frames before switching to new seed pattern
+FRAME_TIME_MS = 0         # Minimum time between frames (0 = as fast as the Pi can compute)
 
 # ============================================================================
 # GLOBAL PATTERN TRACKING
@@ -330,35 +332,44 @@ class ReactionDiffusion:
         return pixels
 
 
-def RunReactionDiffusion(disp):
+def PrepareReactionDiffusion(width=64, height=64, pattern=None):
+    """
+    Create and seed a ReactionDiffusion ahead of time.
+
+    Args:
+        pattern: One of PATTERN_TYPES (None = the next one in turn)
+
+    Returns:
+        (pattern_name, ReactionDiffusion)
+    """
+    global CURRENT_PATTERN_INDEX
+    
+    if pattern is None:
+        CURRENT_PATTERN_INDEX = (CURRENT_PATTERN_INDEX + 1) % len(PATTERN_TYPES)
+        pattern = PATTERN_TYPES[CURRENT_PATTERN_INDEX]
+    
+    rd = ReactionDiffusion(width, height)
+    rd._seed_pattern(pattern)
+    return pattern, rd
+
+
+def RunReactionDiffusion(disp, state=None, runtime_seconds=None):
     """
     Run one reaction-diffusion pattern, then return.
     Pattern is selected at the START of each call.
     
     Args:
         disp: Display object with clear(), set_pixel(), and show() methods
+        state: Result of PrepareReactionDiffusion() (built here if None)
+        runtime_seconds: Stop after this long instead of FRAMES_PER_PATTERN frames
     """
-    global CURRENT_PATTERN_INDEX
-    
     print("Running Reaction-Diffusion")
     
-    # Update to next pattern at the start
-    CURRENT_PATTERN_INDEX = (CURRENT_PATTERN_INDEX + 1) % len(PATTERN_TYPES)
-    pattern_name = PATTERN_TYPES[CURRENT_PATTERN_INDEX]
+    # Create instance and seed with the next pattern
+    pattern_name, rd = state if state is not None else PrepareReactionDiffusion(disp.width, disp.height)
     print(f"  Running pattern: {pattern_name}")
     
-    # Create instance and seed with the selected pattern
-    rd = ReactionDiffusion(disp.width, disp.height)
-    rd._seed_pattern(pattern_name)
-    
-    frame_count = 0
-    start_time = time.time()
-    
-    # Run until one pattern completes (FRAMES_PER_PATTERN frames)
-    while frame_count < FRAMES_PER_PATTERN:
-        # Update simulation
-        rd.update()
-        
+    def draw():
         # Get pixel data
         pixel_list = rd.get_pixels()
         
@@ -371,16 +382,11 @@ def RunReactionDiffusion(disp):
         
         # Show frame
         disp.show()
-        
-        # Performance monitoring (every 100 frames)
-        frame_count += 1
-        # if frame_count % 100 == 0:
-        #     elapsed = time.time() - start_time
-        #     fps = 100 / elapsed
-        #     print(f"FPS: {fps:.2f}")
-        #     start_time = time.time()
-        
-        # Small delay to prevent maxing out CPU
-        time.sleep(0.001)
     
-    return
\ No newline at end of file
+    # Run until one pattern completes (FRAMES_PER_PATTERN frames)
+    scheduler = FrameScheduler(FRAME_TIME_MS / 1000.0)
+    if runtime_seconds is None:
+        scheduler.run(lambda dt: rd.update(), draw, frames=FRAMES_PER_PATTERN)
+    else:
+        scheduler.run(lambda dt: rd.update(), draw, duration=runtime_seconds)
+    print(f"  {scheduler.summary()}")
@@ -0,0 +1,200 @@
+"""
+Startup-time benchmark for main.py.
+
+Runs fresh interpreters with `python -X importtime` and reports what
+main.py's imports cost before the first frame, and what each effect module
+costs when the playlist first needs it (effect modules are imported lazily,
+on the prewarm worker, see playlist.EffectRegistry).
+
+Both lists are read from main.py itself (its top-level imports and the
+EFFECTS registry), so the report follows the code.  Every measurement is
+repeated and the fastest run is kept - after a power cycle the first run is
+the cold-cache number, the rest are warm.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --effects --repeat 10 --top 20
+    python bench_startup.py --json startup.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+DEFAULT_REPEAT = 5        # Fresh interpreters per measurement (fastest is kept)
+DEFAULT_TOP = 15          # Heaviest individual imports to list
+# ============================================================================
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN_PATH = os.path.join(APP_DIR, 'main.py')
+
+# Imports `modules` one by one in the child, reporting failures (e.g. no
+# rgbmatrix off the Pi) without importing anything else itself
+CHILD_CODE = """
+for name in {modules!r}:
+    try:
+        __import__(name)
+    except Exception as e:
+        print("FAILED", name, type(e).__name__ + ": " + str(e))
+"""
+
+
+def startup_modules(main_path=MAIN_PATH):
+    """Modules main.py imports at the top level, in order"""
+    with open(main_path) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def effect_modules(main_path=MAIN_PATH):
+    """Modules named in main.py's EFFECTS registry, in order"""
+    with open(main_path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'EFFECTS'
+                                                for t in node.targets):
+            effects = ast.literal_eval(node.value)
+            return list(dict.fromkeys(module for module, _ in effects.values()))
+    return []
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        [(self_us, cumulative_us, name, depth)] in the order printed
+        (children before their parent)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue            # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((int(fields[0]), int(fields[1]), stripped, depth))
+    return entries
+
+
+def run_child(modules, python=sys.executable):
+    """One fresh interpreter importing modules; returns (wall_s, entries, failures)"""
+    start = time.perf_counter()
+    result = subprocess.run([python, '-X', 'importtime', '-c', CHILD_CODE.format(modules=modules)],
+                            cwd=APP_DIR, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    failures = {}
+    for line in result.stdout.splitlines():
+        if line.startswith("FAILED "):
+            _, name, error = line.split(" ", 2)
+            failures[name] = error
+    return wall, parse_importtime(result.stderr), failures
+
+
+def measure(modules, preload=(), repeat=DEFAULT_REPEAT, python=sys.executable):
+    """
+    Import cost of `modules` after `preload` has been imported.
+
+    Returns:
+        dict with the fastest wall time (interpreter included), the baseline
+        of an interpreter that imports nothing, each module's incremental
+        cumulative time and all the individual imports under them
+    """
+    names = list(preload) + list(modules)
+    baseline = min(run_child([], python)[0] for _ in range(repeat))
+    best = None
+    for _ in range(repeat):
+        wall, entries, failures = run_child(names, python)
+        if best is None or wall < best[0]:
+            best = (wall, entries, failures)
+    wall, entries, failures = best
+
+    # Top-level entries are the modules themselves (or the first thing they
+    # pulled in, if it was not loaded yet); the rest are what they imported
+    per_module = {}
+    breakdown = []
+    current = []
+    for self_us, cumulative_us, name, depth in entries:
+        current.append((self_us, cumulative_us, name, depth))
+        if depth == 0:
+            if name in modules:
+                per_module[name] = cumulative_us
+                breakdown += current
+            current = []
+
+    return {
+        'wall_ms': wall * 1000,
+        'baseline_ms': baseline * 1000,
+        'modules': {name: per_module.get(name, 0) / 1000 for name in modules},
+        'failures': failures,
+        'imports': [{'name': name, 'self_ms': s / 1000, 'cumulative_ms': c / 1000, 'depth': d}
+                    for s, c, name, d in breakdown],
+    }
+
+
+def print_report(title, report, top=DEFAULT_TOP):
+    print("=" * 50)
+    print(title)
+    total = sum(report['modules'].values())
+    print(f"  Interpreter + imports: {report['wall_ms']:.0f} ms "
+          f"(empty interpreter {report['baseline_ms']:.0f} ms)")
+    print(f"  Import time: {total:.1f} ms")
+    for name, ms in sorted(report['modules'].items(), key=lambda item: -item[1]):
+        failed = report['failures'].get(name)
+        print(f"    {name:<24} {ms:8.1f} ms" + (f"  (FAILED: {failed})" if failed else ""))
+    heaviest = sorted(report['imports'], key=lambda item: -item['self_ms'])[:top]
+    if heaviest:
+        print(f"  Heaviest imports (self time):")
+        for item in heaviest:
+            print(f"    {item['name']:<40} {item['self_ms']:8.1f} ms"
+                  f"  (cumulative {item['cumulative_ms']:.1f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="main.py startup / import time benchmark")
+    parser.add_argument('--effects', action='store_true',
+                        help="also measure each effect module's first-use import cost")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="fresh interpreters per measurement (default %(default)s)")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help="heaviest imports to list (default %(default)s)")
+    parser.add_argument('--json', metavar='PATH',
+                        help="also write the results as JSON to PATH")
+    args = parser.parse_args(argv)
+
+    startup = startup_modules()
+    results = {'startup': measure(startup, repeat=args.repeat)}
+    print_report("Startup (main.py imports, before the first frame)", results['startup'], args.top)
+
+    if args.effects:
+        results['effects'] = {}
+        for module in effect_modules():
+            report = measure([module], preload=startup, repeat=args.repeat)
+            results['effects'][module] = report
+            print_report(f"Effect module '{module}' (first use, on the prewarm worker)",
+                         report, args.top)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
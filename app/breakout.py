@@ -2,6 +2,10 @@ import random
 import time
 import math
 
+from physics import FAR, FixedTimestep, lerp, move_ball, reflect
+from scheduler import FrameScheduler
+from trajectory import predict_intercept
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -18,13 +22,21 @@ BRICK_COLS = 8            # Number of brick columns
 BRICK_WIDTH = 8           # Width of each brick
 BRICK_HEIGHT = 3          # Height of each brick
 BRICK_START_Y = 2         # Y position where bricks start
+AI_REACTION_TIME = 0.1    # How often (seconds of game time) the AI re-aims the paddle
+SUBSTEPS = 4              # Physics substeps per frame (collisions are swept either way)
+RENDER_TIME_MS = 20       # Time between drawn frames; the ball is interpolated between steps
 # ============================================================================
 
 class BreakoutGame:
-    def __init__(self, width=64, height=64):
+    def __init__(self, width=64, height=64, paddle_speed=PADDLE_SPEED,
+                 reaction_time=AI_REACTION_TIME):
         self.width = width
         self.height = height
         
+        # AI tuning (defaults come from the parameters above)
+        self.paddle_speed = paddle_speed
+        self.reaction_time = reaction_time
+        
         # Paddle position (x, y) - centered
         self.paddle_x = (width - PADDLE_WIDTH) // 2
         self.paddle_y = PADDLE_Y
@@ -34,40 +46,53 @@ class BreakoutGame:
         self.ball_y = height / 2.0
         self.ball_vx = random.choice([-BALL_SPEED, BALL_SPEED])
         self.ball_vy = -BALL_SPEED * 0.7  # Start moving upward
+        self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
         
-        # Bricks grid - True = exists, False = destroyed
+        # Bricks grid - bricks[row][col]: True = exists, False = destroyed
         self.bricks = self._create_bricks()
+        self.bricks_remaining = BRICK_ROWS * BRICK_COLS
         
         # Game state
         self.score = 0
+        self.paddle_hits = 0
         self.game_over = False
         self.winner = False
         self.reason = ""
         
         # AI state
         self.paddle_target_x = self.paddle_x
-        self.last_target_update = time.time()
+        # Game time advances by fixed steps so the AI does not depend on frame rate
+        self.sim_time = 0.0
+        self.last_target_update = self.sim_time
         
         # Ball just lost (for reset)
         self.ball_lost = False
     
     def _create_bricks(self):
         """Create brick grid - fit bricks to screen width with gaps"""
-        bricks = []
         # Calculate spacing to fit all bricks on screen with 1-pixel gaps
         gap = 1  # Visual separation between bricks
         total_brick_width = BRICK_COLS * BRICK_WIDTH + (BRICK_COLS - 1) * gap
-        available_width = self.width - 2  # Leave 1 pixel margin on each side
         
         # Center the brick grid horizontally
-        brick_start_x = (self.width - total_brick_width) // 2
+        self.brick_start_x = (self.width - total_brick_width) // 2
         
-        for row in range(BRICK_ROWS):
-            for col in range(BRICK_COLS):
-                x = brick_start_x + col * (BRICK_WIDTH + gap)
-                y = BRICK_START_Y + row * (BRICK_HEIGHT + 1)
-                bricks.append({'x': x, 'y': y, 'alive': True})
-        return bricks
+        # Distance from one brick to the next (brick plus gap)
+        self.brick_pitch_x = BRICK_WIDTH + gap
+        self.brick_pitch_y = BRICK_HEIGHT + 1
+        
+        return [[True] * BRICK_COLS for _ in range(BRICK_ROWS)]
+    
+    def _brick_origin(self, row, col):
+        """Top-left pixel of the brick at (row, col)"""
+        return (self.brick_start_x + col * self.brick_pitch_x,
+                BRICK_START_Y + row * self.brick_pitch_y)
+    
+    def _brick_range(self, low, high, start, pitch, count):
+        """Grid indices whose cells overlap the coordinate span [low, high]"""
+        first = max(0, int((low - start) // pitch))
+        last = min(count - 1, int((high - start) // pitch))
+        return range(first, last + 1)
     
     def _clamp(self, value, min_val, max_val):
         """Clamp value to range"""
@@ -78,25 +103,8 @@ class BreakoutGame:
         Predict where the ball will be when it reaches paddle height.
         Returns x coordinate, or None if ball is moving away.
         """
-        # Check if ball is moving downward
-        if self.ball_vy <= 0:
-            return None  # Ball moving up, away from paddle
-        
-        # Calculate frames until ball reaches paddle
-        dy = self.paddle_y - self.ball_y
-        frames_to_paddle = dy / self.ball_vy if self.ball_vy > 0 else 0
-        
-        # Predict ball x position at that time
-        predicted_x = self.ball_x + self.ball_vx * frames_to_paddle
-        
-        # Handle wall bounces
-        while predicted_x < 0 or predicted_x >= self.width:
-            if predicted_x < 0:
-                predicted_x = -predicted_x
-            elif predicted_x >= self.width:
-                predicted_x = 2 * self.width - predicted_x
-        
-        return predicted_x
+        return predict_intercept(self.ball_y, self.ball_vy, self.ball_x, self.ball_vx,
+                                 self.paddle_y, 0, self.width)
     
     def _move_paddle(self):
         """Move paddle toward predicted ball position"""
@@ -107,8 +115,8 @@ class BreakoutGame:
             return
         
         # Update target occasionally to prevent jiggling
-        current_time = time.time()
-        if current_time - self.last_target_update > 0.1:
+        current_time = self.sim_time
+        if current_time - self.last_target_update > self.reaction_time:
             self.last_target_update = current_time
             
             # Aim for center of paddle on predicted ball
@@ -118,10 +126,10 @@ class BreakoutGame:
         
         # Move toward target
         if self.paddle_x < self.paddle_target_x:
-            new_x = self.paddle_x + PADDLE_SPEED
+            new_x = self.paddle_x + self.paddle_speed
             new_x = min(new_x, self.paddle_target_x)
         elif self.paddle_x > self.paddle_target_x:
-            new_x = self.paddle_x - PADDLE_SPEED
+            new_x = self.paddle_x - self.paddle_speed
             new_x = max(new_x, self.paddle_target_x)
         else:
             new_x = self.paddle_x
@@ -129,101 +137,74 @@ class BreakoutGame:
         # Clamp to bounds
         self.paddle_x = self._clamp(new_x, 0, self.width - PADDLE_WIDTH)
     
-    def _check_paddle_collision(self):
-        """Check if ball collides with paddle"""
-        prev_ball_y = self.ball_y - self.ball_vy
-        
-        # Check if ball crossed from above paddle to below it
-        if self.ball_vy > 0 and prev_ball_y <= self.paddle_y and self.ball_y >= self.paddle_y:
-            # Check if ball is within paddle width
-            if self.paddle_x <= self.ball_x < self.paddle_x + PADDLE_WIDTH:
-                # Reflect ball
-                self.ball_vy = -abs(self.ball_vy)
-                
-                # Add spin based on where ball hit paddle
-                hit_pos = (self.ball_x - self.paddle_x) / PADDLE_WIDTH
-                hit_pos = self._clamp(hit_pos, 0, 1)
-                
-                # Ball hits left side = leftward angle, right side = rightward
-                angle_factor = (hit_pos - 0.5) * 1.2
-                self.ball_vx = self.ball_vx * 0.8 + angle_factor * BALL_SPEED
-                
-                # Speed up ball (up to max)
-                speed = math.sqrt(self.ball_vx ** 2 + self.ball_vy ** 2)
-                if speed < MAX_BALL_SPEED:
-                    scale = (speed + 0.3) / speed
-                    self.ball_vx *= scale
-                    self.ball_vy *= scale
-                
-                # Push ball above paddle
-                self.ball_y = self.paddle_y - 0.5
+    def _ball_boxes(self, x, y, dx, dy):
+        """Walls, paddle and the bricks under the ball's swept segment"""
+        boxes = [
+            (-FAR, -FAR, 0, FAR, 'wall'),                       # Left wall
+            (self.width, -FAR, FAR, FAR, 'wall'),               # Right wall
+            (-FAR, -FAR, FAR, 0, 'wall'),                       # Top wall
+            (self.paddle_x, self.paddle_y,
+             self.paddle_x + PADDLE_WIDTH, self.paddle_y + PADDLE_HEIGHT, 'paddle'),
+        ]
+        
+        # Only the grid cells under the segment can be hit
+        rows = self._brick_range(min(y, y + dy), max(y, y + dy),
+                                 BRICK_START_Y, self.brick_pitch_y, BRICK_ROWS)
+        cols = self._brick_range(min(x, x + dx), max(x, x + dx),
+                                 self.brick_start_x, self.brick_pitch_x, BRICK_COLS)
+        for row in rows:
+            for col in cols:
+                if self.bricks[row][col]:
+                    left, top = self._brick_origin(row, col)
+                    boxes.append((left, top, left + BRICK_WIDTH, top + BRICK_HEIGHT, (row, col)))
+        return boxes
     
-    def _check_brick_collision(self):
-        """Check if ball collides with bricks using trajectory-based detection"""
-        prev_ball_x = self.ball_x - self.ball_vx
-        prev_ball_y = self.ball_y - self.ball_vy
-        
-        for brick in self.bricks:
-            if not brick['alive']:
-                continue
-            
-            # Brick bounds
-            brick_left = brick['x']
-            brick_right = brick['x'] + BRICK_WIDTH
-            brick_top = brick['y']
-            brick_bottom = brick['y'] + BRICK_HEIGHT
-            
-            # Check if ball trajectory crossed into brick area
-            # We need to check if the ball crossed any of the four sides
+    def _on_ball_hit(self, key, nx, ny, x, y, vx, vy):
+        """Collision response for move_ball(): returns the new ball velocity"""
+        vx, vy = reflect(nx, ny, vx, vy)
+        
+        if key == 'paddle':
+            if ny >= 0:
+                # Sides and underside of the paddle just reflect
+                return vx, vy
             
-            # Check top side collision (ball coming from above)
-            if (prev_ball_y < brick_top and self.ball_y >= brick_top and
-                brick_left <= self.ball_x < brick_right):
-                brick['alive'] = False
-                self.score += 10
-                self.ball_vy = -abs(self.ball_vy)
-                self.ball_y = brick_top - 0.1
-                return
+            self.paddle_hits += 1
             
-            # Check bottom side collision (ball coming from below)
-            if (prev_ball_y >= brick_bottom and self.ball_y < brick_bottom and
-                brick_left <= self.ball_x < brick_right):
-                brick['alive'] = False
-                self.score += 10
-                self.ball_vy = abs(self.ball_vy)
-                self.ball_y = brick_bottom + 0.1
-                return
+            # Add spin based on where ball hit paddle
+            hit_pos = (x - self.paddle_x) / PADDLE_WIDTH
+            hit_pos = self._clamp(hit_pos, 0, 1)
             
-            # Check left side collision (ball coming from left)
-            if (prev_ball_x < brick_left and self.ball_x >= brick_left and
-                brick_top <= self.ball_y < brick_bottom):
-                brick['alive'] = False
-                self.score += 10
-                self.ball_vx = -abs(self.ball_vx)
-                self.ball_x = brick_left - 0.1
-                return
+            # Ball hits left side = leftward angle, right side = rightward
+            angle_factor = (hit_pos - 0.5) * 1.2
+            vx = vx * 0.8 + angle_factor * BALL_SPEED
             
-            # Check right side collision (ball coming from right)
-            if (prev_ball_x >= brick_right and self.ball_x < brick_right and
-                brick_top <= self.ball_y < brick_bottom):
-                brick['alive'] = False
-                self.score += 10
-                self.ball_vx = abs(self.ball_vx)
-                self.ball_x = brick_right + 0.1
-                return
+            # Speed up ball, never past the max (spin can push it over too)
+            speed = math.hypot(vx, vy)
+            scale = min(speed + 0.3, MAX_BALL_SPEED) / speed
+            vx *= scale
+            vy *= scale
+        elif key != 'wall':
+            row, col = key
+            self.bricks[row][col] = False
+            self.bricks_remaining -= 1
+            self.score += 10
+        return vx, vy
     
-    def _check_wall_collision(self):
-        """Check if ball collides with left/right walls and top"""
-        if self.ball_x < 0:
-            self.ball_x = -self.ball_x
-            self.ball_vx = abs(self.ball_vx)
-        elif self.ball_x >= self.width:
-            self.ball_x = 2 * self.width - self.ball_x
-            self.ball_vx = -abs(self.ball_vx)
-        
-        if self.ball_y < 0:
-            self.ball_y = -self.ball_y
-            self.ball_vy = abs(self.ball_vy)
+    def _on_substep_hit(self, key, nx, ny, x, y, vx, vy):
+        """move_ball() sees substep velocities; the hit response works per frame"""
+        vx, vy = self._on_ball_hit(key, nx, ny, x, y, vx * SUBSTEPS, vy * SUBSTEPS)
+        return vx / SUBSTEPS, vy / SUBSTEPS
+    
+    def _move_ball(self):
+        """Sweep the ball through this frame in SUBSTEPS, bouncing off anything it meets"""
+        x, y = self.ball_x, self.ball_y
+        vx, vy = self.ball_vx, self.ball_vy
+        for _ in range(SUBSTEPS):
+            x, y, svx, svy = move_ball(x, y, vx / SUBSTEPS, vy / SUBSTEPS,
+                                       self._ball_boxes, self._on_substep_hit)
+            vx, vy = svx * SUBSTEPS, svy * SUBSTEPS
+        self.ball_x, self.ball_y = x, y
+        self.ball_vx, self.ball_vy = vx, vy
     
     def _check_loss(self):
         """Check if ball fell below paddle (loss condition)"""
@@ -233,7 +214,7 @@ class BreakoutGame:
     
     def _check_win(self):
         """Check if all bricks are destroyed"""
-        return all(not brick['alive'] for brick in self.bricks)
+        return self.bricks_remaining == 0
     
     def _reset_ball(self):
         """Reset ball to center with random direction"""
@@ -241,24 +222,21 @@ class BreakoutGame:
         self.ball_y = self.height / 2.0
         self.ball_vx = random.choice([-BALL_SPEED, BALL_SPEED])
         self.ball_vy = -BALL_SPEED * 0.7
+        self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
         self.ball_lost = False
     
     def update(self):
-        """Update game state"""
+        """Advance the game by one fixed step (FRAME_TIME_MS of game time)"""
         if self.game_over or self.winner:
             return
+        self.sim_time += FRAME_TIME_MS / 1000.0
         
         # Move paddle
         self._move_paddle()
         
-        # Update ball position
-        self.ball_x += self.ball_vx
-        self.ball_y += self.ball_vy
-        
-        # Check collisions
-        self._check_wall_collision()
-        self._check_brick_collision()
-        self._check_paddle_collision()
+        # Move the ball, resolving wall, brick and paddle bounces along the way
+        self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
+        self._move_ball()
         
         # Check loss condition
         if self._check_loss():
@@ -272,8 +250,14 @@ class BreakoutGame:
             self.reason = "All bricks destroyed!"
             return
     
-    def get_pixels(self):
-        """Return list of pixels to draw: [(x, y, r, g, b), ...]"""
+    def get_pixels(self, alpha=1.0):
+        """
+        Return list of pixels to draw: [(x, y, r, g, b), ...]
+        
+        Args:
+            alpha: How far real time is between the previous and current
+                   step (0-1); the ball is drawn interpolated between them
+        """
         pixels = []
         
         # Draw paddle - cyan (dimmed)
@@ -293,57 +277,59 @@ class BreakoutGame:
             (0, 0, 127),      # Blue
         ]
         
-        for brick in self.bricks:
-            if not brick['alive']:
-                continue
-            
-            row = (brick['y'] - BRICK_START_Y) // (BRICK_HEIGHT + 1)
+        for row in range(BRICK_ROWS):
             color = colors[row % len(colors)]
-            
-            for dx in range(BRICK_WIDTH):
-                for dy in range(BRICK_HEIGHT):
-                    x = int(brick['x'] + dx)
-                    y = int(brick['y'] + dy)
-                    if 0 <= x < self.width and 0 <= y < self.height:
-                        pixels.append((x, y, color[0], color[1], color[2]))
+            for col in range(BRICK_COLS):
+                if not self.bricks[row][col]:
+                    continue
+                
+                brick_x, brick_y = self._brick_origin(row, col)
+                for dx in range(BRICK_WIDTH):
+                    for dy in range(BRICK_HEIGHT):
+                        x = brick_x + dx
+                        y = brick_y + dy
+                        if 0 <= x < self.width and 0 <= y < self.height:
+                            pixels.append((x, y, color[0], color[1], color[2]))
         
         # Draw ball - gray (dimmed white)
-        ball_x = int(self.ball_x)
-        ball_y = int(self.ball_y)
+        ball_x = int(lerp(self.prev_ball_x, self.ball_x, alpha))
+        ball_y = int(lerp(self.prev_ball_y, self.ball_y, alpha))
         if 0 <= ball_x < self.width and 0 <= ball_y < self.height:
             pixels.append((ball_x, ball_y, 255, 255, 255))
         
         return pixels
 
 
-def RunBreakoutGame(disp):
-    """Main game loop for Breakout game"""
+def RunBreakoutGame(disp, state=None, runtime_seconds=GAME_TIME_SECONDS):
+    """Main game loop for Breakout game (state: a BreakoutGame built ahead of time)"""
     print("Running Breakout Game")
-    print(f"Game duration: {GAME_TIME_SECONDS} seconds")
+    print(f"Game duration: {runtime_seconds} seconds")
     
     start_time = time.time()
-    game = BreakoutGame(disp.width, disp.height)
+    game = state if state is not None else BreakoutGame(disp.width, disp.height)
     
-    next_turn_time = time.time() + (FRAME_TIME_MS / 1000.0)
+    # Game logic runs in fixed FRAME_TIME_MS steps; drawing runs at RENDER_TIME_MS
+    clock = FixedTimestep(FRAME_TIME_MS / 1000.0)
+    scheduler = FrameScheduler(RENDER_TIME_MS / 1000.0, max_catch_up=0)
+    last_time = time.time()
     
     while True:
-        # Update game state
-        game.update()
+        # Run however many logic steps real time calls for
+        now = time.time()
+        for _ in range(clock.advance(now - last_time)):
+            game.update()
+        last_time = now
         
         # Clear and draw
         disp.clear()
-        pixel_list = game.get_pixels()
+        pixel_list = game.get_pixels(clock.alpha)
         for x, y, r, g, b in pixel_list:
             disp.set_pixel(x, y, r, g, b)
         
         disp.show()
         
-        # Frame timing
-        current_time = time.time()
-        sleep_time = next_turn_time - current_time
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-        next_turn_time = time.time() + (FRAME_TIME_MS / 1000.0)
+        # Frame timing (game steps catch up through the FixedTimestep instead)
+        scheduler.wait()
         
         # Check end conditions
         if game.game_over:
@@ -364,10 +350,9 @@ def RunBreakoutGame(disp):
         
         # Check time limit
         elapsed = time.time() - start_time
-        if elapsed >= GAME_TIME_SECONDS:
-            print(f"Time limit ({GAME_TIME_SECONDS}s) reached")
+        if elapsed >= runtime_seconds:
+            print(f"Time limit ({runtime_seconds}s) reached")
             print(f"Final score: {game.score}")
-            remaining_bricks = sum(1 for brick in game.bricks if brick['alive'])
-            print(f"Bricks remaining: {remaining_bricks}/{len(game.bricks)}")
+            print(f"Bricks remaining: {game.bricks_remaining}/{BRICK_ROWS * BRICK_COLS}")
             time.sleep(3.0)
             return
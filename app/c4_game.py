@@ -3,8 +3,9 @@ from display import Display
 import time
 import random
 
+import sprites
+
 from c4_common import NUMROWS,NUMCOLS,GetFirstOpenRow,CheckForWinner,CheckForDraw,CheckForValidMove
-from c4_ollama import GetOllamaMove
 
 
 
@@ -42,6 +43,10 @@ def RunGame( disp ):
     disp.text_loadFont('5x8.bdf')
     GenerateOverlay(disp)
 
+    # Placed chips live in their own layer under the board overlay, so they
+    # are drawn once instead of on every frame
+    disp.layer_add('chips')
+
     # Reset game board at start
     for col in range(NUMCOLS):
         for row in range(NUMROWS):
@@ -77,6 +82,8 @@ def RunGame( disp ):
         DropChip(disp,col,row, player_color[player] )
 
         PlaceChip(col,row,player)
+        DrawChip(disp, col, row, player_color[player])
+        RefreshDisplay(disp)
 
         time.sleep(2)
 
@@ -172,7 +179,6 @@ def DropChip( disp, final_col, final_row, color ):
 
         y = y+1
 
-        DrawChips(disp)
         disp.show()
         time.sleep(FALL_DELAY)
 #end DropChip
@@ -185,26 +191,20 @@ def PlaceChip( col, row, player ):
         raise IndexError("Row or column out of range")
 
 
-def DrawChips(disp):
-    for row in range(NUMROWS):
-        for col in range(NUMCOLS):
-
-            player = game_board[col][row]
+#Draw one chip into the chips layer (it stays there)
+def DrawChip(disp, col, row, color):
 
-            if ( player is not None ):
+    x = STARTING_X + col * CHIP_OFFSET
 
-                x = STARTING_X + col * CHIP_OFFSET
+    y = STARTING_Y + (NUMROWS-1 - row) * CHIP_OFFSET
 
-                y = STARTING_Y + (NUMROWS-1 - row) * CHIP_OFFSET
+    disp.layer_get('chips').draw_sprite(sprites.circle_sprite(CHIP_RADIUS), x, y, color)
 
-                disp.draw_circle(x,y,CHIP_RADIUS, player_color[player] )
+#END DrawChip
 
-#END DrawChips
-
-#Refresh display
+#Refresh display (placed chips and the board are layers)
 def RefreshDisplay(disp):
     disp.clear()          
-    DrawChips(disp) 
     disp.show()
 
 
@@ -231,17 +231,11 @@ def BlinkWinningChips(disp, winning_positions, player):
             # Calculate adjusted color with gain multiplier
             adjusted_color = tuple(min(255, int(c * gain)) for c in base_color)
             
-            disp.clear()
-            
-            DrawChips(disp)
-            
-            # Draw winning chips with adjusted color
+            # Redraw winning chips with adjusted color
             for col, row in winning_positions:
-                x = STARTING_X + col * CHIP_OFFSET
-                y = STARTING_Y + (NUMROWS-1 - row) * CHIP_OFFSET
-                disp.draw_circle(x, y, CHIP_RADIUS, adjusted_color)
+                DrawChip(disp, col, row, adjusted_color)
             
-            disp.show()
+            RefreshDisplay(disp)
             time.sleep(BLINK_DELAY)
 #End BlinkWinningChips   
 
@@ -303,6 +297,9 @@ def GetNextMove(mode, player):
          
         print(f"AI ({player_name}) is thinking...")
         
+        # Imported here so requests is only loaded when Ollama actually plays
+        from c4_ollama import GetOllamaMove
+
         try:
             col = GetOllamaMove(game_board, player)
             row = GetFirstOpenRow(game_board, col)
@@ -0,0 +1,93 @@
+"""
+Gamma and brightness correction as the last stage of Display.show().
+
+A ColorCorrection is a 256-entry lookup table per channel:
+    out = round(255 * brightness * gain * (value / 255) ** gamma)
+stored flat (red, green, blue) so a whole frame is corrected with one
+NumPy gather - frame values plus a per-channel offset of 0/256/512 index
+the table - about 60 microseconds for a 64x64 panel.  Effects can emit
+linear values and leave dimming to the panel-wide brightness, which can
+change at any time (night mode): only the 768-entry table is rebuilt.
+
+With the defaults the table is the identity and apply() does nothing.
+The rgbmatrix library already applies CIE1931 luminance correction of its
+own, so GAMMA stays 1.0 unless that is turned off.
+
+Usage (Display does this):
+    correction = ColorCorrection(gamma=2.2)
+    correction.set_brightness(0.3)
+    shown = correction.apply(frame, out)
+"""
+
+import numpy as np
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+GAMMA = 1.0                   # Scalar or (r, g, b); 1.0 = linear
+BRIGHTNESS = 1.0              # 0.0 - 1.0, whole panel
+WHITE_BALANCE = (1.0, 1.0, 1.0)  # Per-channel gain (e.g. tame a blue-heavy panel)
+NIGHT_BRIGHTNESS = 0.3        # Brightness during NIGHT_HOURS (night mode)
+NIGHT_HOURS = (22, 7)         # From, until (local hours; may wrap midnight)
+# ============================================================================
+
+# Start of each channel's table in the flat LUT
+_OFFSETS = np.array([0, 256, 512], dtype=np.uint16)
+
+
+def build_lut(gamma=GAMMA, brightness=BRIGHTNESS, white_balance=WHITE_BALANCE):
+    """(3, 256) uint8 table: lut[channel, value]"""
+    gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (3,))[:, None]
+    gain = np.asarray(white_balance, dtype=float)[:, None] * brightness
+    levels = np.arange(256, dtype=float) / 255
+    lut = np.rint(255 * gain * levels ** gamma)
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+
+def scheduled_brightness(hour, day=BRIGHTNESS, night=NIGHT_BRIGHTNESS,
+                         night_hours=NIGHT_HOURS):
+    """Brightness for an hour of the day: night during night_hours, else day"""
+    start, end = night_hours
+    if start <= end:
+        is_night = start <= hour < end
+    else:
+        is_night = hour >= start or hour < end
+    return night if is_night else day
+
+
+class ColorCorrection:
+    """Per-channel gamma / white balance / brightness lookup table"""
+
+    def __init__(self, gamma=GAMMA, brightness=BRIGHTNESS, white_balance=WHITE_BALANCE):
+        self.gamma = gamma
+        self.white_balance = white_balance
+        self._index = None              # Scratch frame of table indices
+        self.set_brightness(brightness)
+
+    def set_brightness(self, brightness):
+        """Change the panel-wide brightness (0.0 - 1.0) from the next frame on"""
+        self.brightness = max(0.0, min(1.0, brightness))
+        lut = build_lut(self.gamma, self.brightness, self.white_balance)
+        identity = bool((lut == np.arange(256)).all())
+        # One assignment, so a frame never sees a table and a stale flag
+        self._table = (lut.reshape(-1), identity)
+
+    @property
+    def lut(self):
+        return self._table[0].reshape(3, 256)
+
+    def apply(self, frame, out):
+        """
+        Correct frame (height x width x 3 uint8) into out.
+
+        Returns:
+            out, or frame itself when the table is the identity
+        """
+        flat, identity = self._table
+        if identity:
+            return frame
+        if self._index is None or self._index.shape != frame.shape:
+            self._index = np.empty(frame.shape, dtype=np.uint16)
+        np.add(frame, _OFFSETS, out=self._index)
+        np.take(flat, self._index, out=out)
+        return out
@@ -0,0 +1,64 @@
+"""
+Dirty-rectangle tracking for the matrix canvases.
+
+The matrix is double buffered: SwapOnVSync hands back the canvas that was
+on the panel before, which still holds the frame from two swaps ago.  The
+CanvasTracker remembers what each canvas holds, so a new frame only needs
+the rectangle that differs from that canvas's contents pushed onto it -
+e.g. the four pixels a maze agent moved, instead of the whole panel.
+"""
+
+import numpy as np
+
+
+def dirty_rect(old, new):
+    """
+    Bounding box of the pixels that differ between two frames.
+
+    Returns:
+        (x0, y0, x1, y1), or None when the frames are identical
+    """
+    diff = np.any(old != new, axis=2)
+    rows = np.flatnonzero(diff.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+class CanvasTracker:
+    """Contents of the canvases the matrix swaps between"""
+
+    def __init__(self, width, height, canvases=2):
+        self.full = (0, 0, width, height)
+        self._frames = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(canvases)]
+        self._valid = [False] * canvases       # Contents known
+        self._current = 0                      # Canvas being drawn into
+        self.pixels_pushed = 0
+
+    def update(self, frame):
+        """
+        Record frame as the new contents of the current canvas.
+
+        Returns:
+            The rectangle to push onto the canvas, or None if it already
+            holds this frame
+        """
+        i = self._current
+        if not self._valid[i]:
+            rect = self.full
+        else:
+            rect = dirty_rect(self._frames[i], frame)
+        self._frames[i][:] = frame
+        self._valid[i] = True
+        if rect is not None:
+            self.pixels_pushed += (rect[2] - rect[0]) * (rect[3] - rect[1])
+        return rect
+
+    def swapped(self):
+        """The canvases were swapped - drawing continues on the next one"""
+        self._current = (self._current + 1) % len(self._frames)
+
+    def invalidate(self):
+        """Contents unknown (e.g. drawn on directly) - push everything next time"""
+        self._valid = [False] * len(self._valid)
@@ -7,49 +7,127 @@
 #       |
 #    +Y |
 #
-from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
+# Everything is drawn into a NumPy framebuffer (self.frame, height x width
+# x RGB uint8) and pushed to the matrix canvas once per show(), so clears,
+# fills and shapes are slice assignments instead of per-pixel SetPixel calls.
+#
+# Layers (see layers.py) sit on top of the framebuffer and are composited
+# in show() only when something changed; the overlay and the text are two
+# of them.  Text is rasterized once per (font, text, color) with the BDF
+# fonts in fonts.py and only redrawn into its layer when it changes.
+#
+# The finished frame goes through a gamma / brightness lookup table
+# (correction.py), so effects draw linear values and the whole panel can
+# be dimmed at runtime with set_brightness().
+#
+# A frame identical to the one on the panel is not presented at all, and
+# otherwise only the rectangle that changed is pushed (see dirty.py).
+#
+# Shown frames can be recorded to a file (start_recording, see
+# recording.py).  With headless=True there is no panel (and rgbmatrix is
+# not needed): frames are composed and recorded, but not shown.
+#
+import numpy as np
+
+import correction
+import dirty
+import fonts
+import layers
+import sprites
+import transitions
+from render_thread import RenderThread, TripleBuffer
+
+try:
+    # Lets show() hand the whole frame to the canvas in one call (SetImage)
+    from PIL import Image
+except ImportError:
+    Image = None
 
 class Display:
-    def __init__(self):
-        options = RGBMatrixOptions()
-        options.rows = 64
-        options.cols = 64
-        options.chain_length = 1
-        options.parallel = 1
-
-        #No need for a high refresh rate 
-        options.pwm_lsb_nanoseconds = 200
-        #options.pwm_dither_bits = 0
-        #options.pwm_bits = 7
-
-
-        self.matrix = RGBMatrix(options=options)
-        self.canvas = self.matrix.CreateFrameCanvas()
-        self.width = self.canvas.width
-        self.height = self.canvas.height
-
-        self.font = graphics.Font()
-        # self.font.LoadFont("fonts/5x7.bdf")
-        self.font.LoadFont("fonts/5x8.bdf")
-        # self.font.LoadFont("fonts/4x6.bdf")
-
-        #Overlay settings
+    DEFAULT_FONT = "5x8.bdf"   #Also "5x7.bdf", "4x6.bdf"
+
+    def __init__(self, render_thread=False, headless=False):
+        """
+        Args:
+            render_thread: Present frames from a dedicated thread so show()
+                           does not wait for vsync (see render_thread.py)
+            headless: No panel - e.g. to record effects on a machine
+                      without one
+        """
+        self.matrix = self.canvas = None
+        self.width = self.height = 64
+        if not headless:
+            from rgbmatrix import RGBMatrix, RGBMatrixOptions
+
+            options = RGBMatrixOptions()
+            options.rows = 64
+            options.cols = 64
+            options.chain_length = 1
+            options.parallel = 1
+
+            #No need for a high refresh rate 
+            options.pwm_lsb_nanoseconds = 200
+            #options.pwm_dither_bits = 0
+            #options.pwm_bits = 7
+
+
+            self.matrix = RGBMatrix(options=options)
+            self.canvas = self.matrix.CreateFrameCanvas()
+            self.width = self.canvas.width
+            self.height = self.canvas.height
+
+        #Framebuffer: a bytearray so set_pixel() stays cheap, viewed as an array
+        self._buf  = bytearray(self.width * self.height * 3)
+        self.frame = np.frombuffer(self._buf, dtype=np.uint8).reshape(self.height, self.width, 3)
+
+        #Layers over the frame (see layer_add); the overlay is the 'overlay' layer
+        self.layers = layers.Compositor(self.width, self.height)
+
+        #Transition output (see begin_transition) and the last frame shown
+        self._out = np.zeros_like(self.frame)
+        self._shown = self.frame
+        self._transition = None
+
+        #Gamma / brightness table applied to every frame (see set_brightness)
+        self.correction = correction.ColorCorrection()
+        self._corrected = np.zeros_like(self.frame)
+
+        #Last frame presented (the panel starts black), to skip identical
+        #frames, and what each canvas holds, to push only the part that changed
+        self._presented = np.zeros_like(self.frame)
+        self._canvases = dirty.CanvasTracker(self.width, self.height)
+        self.frames_skipped = 0
+
+        #Frame recorder (see start_recording)
+        self._recorder = None
+
+        #Loaded on first use (DEFAULT_FONT unless text_loadFont() picks one)
+        self.font = None
+
+        #Overlay settings (applied to the overlay layer once it exists)
         self.overlay_type  = 1          #0=subtractive, 1=additive    
         self.overlay_color = (0,0,0)
-        self.overlay = [[0 for _ in range(self.width)] for _ in range(self.height)]
 
-        #Text
-        self.font_color = graphics.Color(0, 0, 0)
+        #Text (drawn into the 'text' layer by text_render)
+        self.font_color = (0, 0, 0)
         self.font_pos   = (0,0)
         self.font_text  = ""
+        self._ticker    = None
+        self._text_drawn = None         #Text state the layer holds
+
+        #Render thread (see start_render_thread)
+        self._handoff  = None
+        self._renderer = None
+
+        #Called with no arguments at the end of every show() (e.g. telemetry)
+        self.frame_hooks = []
+        if render_thread:
+            self.start_render_thread()
 
 
     # ---- Base drawing ----
     def background(self, color=(0, 0, 0)):
-        r, g, b = color
-        for x in range(self.width):
-            for y in range(self.height):
-                self.canvas.SetPixel(x, y, r, g, b)
+        self.frame[:] = color
 
     def clear(self):
         self.background((0, 0, 0))   
@@ -57,208 +135,382 @@ class Display:
     def reset(self):
         #Clear Everything!
         self.background((0, 0, 0))
-        # Clear the overlay canvas
-        self.overlay = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        # Drop all layers, the overlay included
+        self.layers.clear()
         self.overlay_type  = 1 
         self.overlay_color = (0,0,0)
         # Clear text
         self.font_text = ""
         self.font_pos = (0, 0)
-        self.font_color = graphics.Color(0, 0, 0)          
+        self.font_color = (0, 0, 0)
+        self._ticker = None
+        self._text_drawn = None
 
     def set_pixel(self, x, y, r, g, b):
-        self.canvas.SetPixel(x, y, r, g, b)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (y * self.width + x) * 3
+            buf = self._buf
+            buf[i] = r
+            buf[i + 1] = g
+            buf[i + 2] = b
+
+
+    # ---- Retained drawing ----
+    # The framebuffer keeps its contents between frames, so an effect that
+    # only changes a few pixels can skip clear() and draw just what changed
+    # since its last frame.
+    def retained_begin(self, static_pixels):
+        """
+        Paint a static layer once before switching to delta drawing
+
+        Args:
+            static_pixels: List of (x, y, r, g, b) that never change
+                           (e.g. obstacles)
+        """
+        self.clear()
+        for x, y, r, g, b in static_pixels:
+            self.set_pixel(x, y, r, g, b)
+
 
+    def _clip(self, x, y, width, height):
+        """Clip a rectangle to the panel: (x0, y0, x1, y1) or None if off-panel"""
+        return layers.clip(x, y, width, height, self.width, self.height)
 
     def draw_square(self, x, y, size, color):
-        r, g, b = color
-        for yy in range(y, y + size):
-            for xx in range(x, x + size):
-                if 0 <= xx < self.width and 0 <= yy < self.height:
-                    self.canvas.SetPixel(xx, yy, r, g, b)
+        self.draw_rectangle(x, y, size, size, color)
 
     def draw_rectangle(self, x, y, width, height, color):
-        r, g, b = color
-        for yy in range(y, y + height):
-            for xx in range(x, x + width):
-                if 0 <= xx < self.width and 0 <= yy < self.height:
-                    self.canvas.SetPixel(xx, yy, r, g, b)
+        rect = self._clip(x, y, width, height)
+        if rect:
+            x0, y0, x1, y1 = rect
+            self.frame[y0:y1, x0:x1] = color
+
+    def blit(self, image, x=0, y=0):
+        """
+        Copy an RGB array (height x width x 3) onto the frame at (x, y)
+        """
+        h, w = image.shape[:2]
+        rect = self._clip(x, y, w, h)
+        if rect:
+            x0, y0, x1, y1 = rect
+            self.frame[y0:y1, x0:x1] = image[y0 - y:y1 - y, x0 - x:x1 - x]
 
     def draw_circle(self, cx, cy, radius, color):
-        r, g, b = color
-        for y in range(-radius, radius + 1):
-            for x in range(-radius, radius + 1):
-                if x*x + y*y < radius*radius:
-                    px, py = cx + x, cy + y
-                    if 0 <= px < self.width and 0 <= py < self.height:
-                        self.canvas.SetPixel(px, py, r, g, b)
-    
+        self.draw_sprite(sprites.circle_sprite(radius), cx, cy, color)
+
 
     def draw_o(self, cx, cy, outer_radius, width, color):
         """
         Draw an 'O' shape - a circle with a hollow center
-        
+
         Args:
             cx, cy: Center coordinates
             outer_radius: Outer radius of the O
             width: Width of the ring/stroke
             color: RGB color tuple
         """
-        inner_radius = outer_radius - width
-        r, g, b = color
-        for y in range(-outer_radius, outer_radius + 1):
-            for x in range(-outer_radius, outer_radius + 1):
-                distance_squared = x*x + y*y
-                # Check if point is within outer circle but outside inner circle
-                if (distance_squared < outer_radius*outer_radius and 
-                    distance_squared >= inner_radius*inner_radius):
-                    px, py = cx + x, cy + y
-                    if 0 <= px < self.width and 0 <= py < self.height:
-                        self.canvas.SetPixel(px, py, r, g, b)
+        self.draw_sprite(sprites.ring_sprite(outer_radius, width), cx, cy, color)
 
     def draw_line(self, x1, y1, x2, y2, color):
         """
         Draw a line between two points using Bresenham's line algorithm
-        
+
         Args:
             x1, y1: Starting point coordinates
             x2, y2: Ending point coordinates
             color: RGB color tuple
         """
         r, g, b = color
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        x, y = x1, y1
-        
-        # Determine direction of line
-        x_inc = 1 if x1 < x2 else -1
-        y_inc = 1 if y1 < y2 else -1
-        
-        # Bresenham's algorithm
-        if dx > dy:
-            # Line is more horizontal than vertical
-            error = dx / 2
-            while x != x2:
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    self.canvas.SetPixel(x, y, r, g, b)
-                error -= dy
-                if error < 0:
-                    y += y_inc
-                    error += dx
-                x += x_inc
-        else:
-            # Line is more vertical than horizontal
-            error = dy / 2
-            while y != y2:
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    self.canvas.SetPixel(x, y, r, g, b)
-                error -= dx
-                if error < 0:
-                    x += x_inc
-                    error += dy
-                y += y_inc
-        
+        for x, y in sprites.line_points(x1, y1, x2, y2):
+            self.set_pixel(x, y, r, g, b)
+
     def draw_x(self, center_x, center_y, height, line_width, color):
         """
         Draw an 'X' shape using two diagonal lines
-        
+
         Args:
             center_x, center_y: Center coordinates of the X
             height: Height (and width) of the X
             line_width: Width of each line stroke
             color: RGB color tuple
         """
-        half_up = height // 2
-        half_down = height - half_up + 1  # Add 1 to account for center pixel
-        
-        # Calculate the four corner points
-        x1, y1 = center_x - half_up, center_y - half_up      # Top-left
-        x2, y2 = center_x + half_down, center_y + half_down  # Bottom-right
-        x3, y3 = center_x + half_down, center_y - half_up    # Top-right
-        x4, y4 = center_x - half_up, center_y + half_down    # Bottom-left
-    
-        
-        # Draw multiple parallel lines to create line width
-        for i in range(line_width):
-            offset = i - line_width // 2
-            
-            # First diagonal: top-left to bottom-right
-            self.draw_line(x1 + offset, y1, x2 + offset, y2, color)
-            self.draw_line(x1, y1 + offset, x2, y2 + offset, color)
-            
-            # Second diagonal: top-right to bottom-left  
-            self.draw_line(x3 - offset, y3, x4 - offset, y4, color)
-            self.draw_line(x3, y3 + offset, x4, y4 + offset, color)
+        self.draw_sprite(sprites.x_sprite(height, line_width), center_x, center_y, color)
+
+    def draw_sprite(self, sprite, x, y, color):
+        """
+        Stamp a pre-rasterized sprite (see sprites.py) with its anchor at (x, y)
+
+        Args:
+            sprite: sprites.Sprite
+            x, y: Where the sprite's anchor lands on the panel
+            color: RGB color tuple
+        """
+        if len(sprite):
+            layers.stamp(self.frame, layers.sprite_mask(sprite),
+                         x + sprite.left, y + sprite.top, color)
 
 
 
 
 
     # ---- Text ----
+    # Text sits in a layer above the overlay.  The strip for a given
+    # (font, text, color) is rendered once (fonts.text_strip) and the layer
+    # is only redrawn when the text changes or a ticker is scrolling.
+    TEXT_Z = 2000
+
     def text_set(self,x,y,color,text):
-        r, g, b = color
+        if self.font is None:
+            self.text_loadFont(self.DEFAULT_FONT)
         self.font_pos   = (x,y)
-        self.font_color = graphics.Color(r,g,b)
+        self.font_color = tuple(color)
         self.font_text  = text
 
+    def text_scroll(self, y, color, text, speed=fonts.TICKER_SPEED):
+        """
+        Scroll text right to left across the panel, repeating
+
+        Args:
+            y: Baseline (as for text_set)
+            color: RGB color tuple
+            text: Text to scroll ("" stops the ticker)
+            speed: Pixels per second
+        """
+        if self.font is None:
+            self.text_loadFont(self.DEFAULT_FONT)
+        self._ticker = fonts.Ticker(self.font, text, color, y, width=self.width,
+                                    speed=speed) if text else None
+        self._text_drawn = None
+
+    def _text_state(self):
+        return (self.font, self.font_pos, self.font_color, self.font_text)
+
     def text_render(self):
-        x,y = self.font_pos
-        graphics.DrawText(self.canvas, self.font, x,y, self.font_color, self.font_text)
+        """Draw the text (and ticker) into the 'text' layer if it changed"""
+        state = self._text_state()
+        if state == self._text_drawn and self._ticker is None:
+            return
+        self._text_drawn = state
+        if not self.font_text and self._ticker is None:
+            self.layers.remove('text')
+            return
+
+        layer = self.layers.get('text')
+        if layer is None:
+            layer = self.layers.add('text', self.TEXT_Z)
+        layer.clear()
+        font, (x, y), color, text = state
+        if text:
+            layer.blit(fonts.text_strip(font, text, color), x, y - font.ascent)
+        if self._ticker is not None:
+            self._ticker.draw(layer)
 
     def text_loadFont(self,fontname):
-        self.font.LoadFont("fonts/"+fontname)
+        # Parsed once per process - switching back and forth is free
+        self.font = fonts.load(fontname)
+
+
+    # ---- Layers ----
+    def layer_add(self, name, z=0, opacity=1.0, blend='normal'):
+        """
+        Add a transparent layer over the frame (replacing any of that name)
+
+        Args:
+            name: Name to find it again with layer_get()
+            z: Stacking order - higher is on top (the overlay is OVERLAY_Z)
+            opacity: 0.0 - 1.0
+            blend: normal, add, multiply or mask (see layers.py)
+
+        Returns:
+            layers.Layer to draw into; it stays on screen until removed
+        """
+        return self.layers.add(name, z, opacity, blend)
+
+    def layer_get(self, name):
+        return self.layers.get(name)
+
+    def layer_remove(self, name):
+        self.layers.remove(name)
 
 
     # ---- Overlay drawing ----
+    # The overlay is a layer on top of everything: additive overlays are a
+    # normal layer in overlay_color, subtractive ones a mask layer whose
+    # drawn shapes become holes.
+    OVERLAY_Z = 1000
+
+    def _overlay_layer(self):
+        layer = self.layers.get('overlay')
+        if layer is None:
+            layer = self.layers.add('overlay', self.OVERLAY_Z)
+            layer.set_color(self.overlay_color)
+            layer.blend = 'normal' if self.overlay_type == 1 else 'mask'
+        return layer
+
     def overlay_set_color(self, color):
         self.overlay_color = color
+        if self.layers.get('overlay') is not None:
+            self._overlay_layer().set_color(color)
 
     def overlay_set_type(self, overlay_type):
         self.overlay_type = overlay_type
-    
+        self._overlay_layer().blend = 'normal' if overlay_type == 1 else 'mask'
+
     def overlay_set_pixel(self, x, y):
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.overlay[y][x] = 1
+        self._overlay_layer().set_pixel(x, y, self.overlay_color)
 
     def overlay_circle(self, cx, cy, radius):
-        for y in range(-radius, radius + 1):
-            for x in range(-radius, radius + 1):
-                if x*x + y*y < radius*radius:
-                    px, py = cx + x, cy + y
-                    if 0 <= px < self.width and 0 <= py < self.height:
-                        self.overlay[py][px] = 1
+        self._overlay_layer().stamp_alpha(sprites.circle_sprite(radius), cx, cy)
 
     def overlay_square(self, x, y, size):
-        for yy in range(y, y + size):
-            for xx in range(x, x + size):
-                if 0 <= xx < self.width and 0 <= yy < self.height:
-                    self.overlay[yy][xx] = 1
+        self.overlay_rectangle(x, y, size, size)
 
     def overlay_rectangle(self, x, y, width, height):
-        for yy in range(y, y + height):
-            for xx in range(x, x + width):
-                if 0 <= xx < self.width and 0 <= yy < self.height:
-                    self.overlay[yy][xx] = 1
+        self._overlay_layer().fill_alpha(x, y, width, height)
 
     def overlay_render(self):
-        r, g, b = self.overlay_color
-        for y in range(self.height):
-            for x in range(self.width):
+        """
+        Composite the layers (overlay included) over the frame
+
+        Returns:
+            The frame to show: self.frame itself when there are no layers
+        """
+        flat = self.layers.flatten(self.frame)
+        return self.frame if flat is None else flat
 
-                if self.overlay[y][x]:
-                    if self.overlay_type == 1:
-                        #Additive
-                        self.canvas.SetPixel(x, y, r, g, b)
-                else:
-                    if self.overlay_type == 0:
-                        #subtractive
-                        self.canvas.SetPixel(x, y, r, g, b)         
 
 
+    def _push_frame(self, buf, rect=None):
+        """
+        Copy a frame (RGB bytes, row-major) onto the canvas
 
-    # Draw overlay on canvas then write to display
+        Args:
+            rect: (x0, y0, x1, y1) - only copy this part (default: all of it)
+        """
+        x0, y0, x1, y1 = rect or (0, 0, self.width, self.height)
+        if Image is not None:
+            image = Image.frombuffer('RGB', (self.width, self.height), buf, 'raw', 'RGB', 0, 1)
+            if (x1 - x0, y1 - y0) != image.size:
+                image = image.crop((x0, y0, x1, y1))
+            self.canvas.SetImage(image, x0, y0)
+            return
+        # No Pillow - fall back to one SetPixel per pixel
+        set_pixel = self.canvas.SetPixel
+        for y in range(y0, y1):
+            i = (y * self.width + x0) * 3
+            for x in range(x0, x1):
+                set_pixel(x, y, buf[i], buf[i + 1], buf[i + 2])
+                i += 3
+
+    def _present(self, buf, extra=None):
+        """Frame onto the canvas, then swap (render thread or caller)"""
+        if self.canvas is None:
+            return
+        frame = np.frombuffer(buf, dtype=np.uint8).reshape(self.frame.shape)
+        rect = self._canvases.update(frame)
+        if rect is not None:
+            self._push_frame(buf, rect)
+        self._swap()
+
+    def _swap(self):
+        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        self._canvases.swapped()
+
+
+    # ---- Transitions ----
+    def begin_transition(self, kind='fade', duration=transitions.TRANSITION_SECONDS):
+        """
+        Blend from the frame on the panel now into the frames shown next
+        (call before reset() when switching effects)
+
+        Args:
+            kind: fade, wipe, dissolve or random (see transitions.py)
+            duration: Seconds, from the first show() after this call
+        """
+        self._transition = transitions.Transition(self._shown, kind, duration)
+
+
+    # ---- Brightness ----
+    def set_brightness(self, brightness):
+        """
+        Dim the whole panel (e.g. night mode) from the next show() on
+
+        Args:
+            brightness: 0.0 - 1.0
+        """
+        self.correction.set_brightness(brightness)
+
+
+    # ---- Recording ----
+    def start_recording(self, path, compress=True):
+        """
+        Write every frame shown from now on to a file (see recording.py)
+
+        Args:
+            path: Recording file (overwritten)
+            compress: Store frames as deltas where that is smaller
+
+        Returns:
+            recording.Recorder
+        """
+        import recording
+
+        self.stop_recording()
+        self._recorder = recording.Recorder(path, self.width, self.height, compress)
+        return self._recorder
+
+    def stop_recording(self):
+        """Finish the recording file (if recording)"""
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+
+    # ---- Render thread ----
+    def start_render_thread(self):
+        """Hand frames to a render thread that owns the canvas from now on"""
+        if self._renderer is not None:
+            return
+        self._handoff = TripleBuffer(len(self._buf))
+        self._renderer = RenderThread(self._handoff, self._present)
+        self._renderer.start()
+
+    def stop_render_thread(self):
+        """Go back to presenting frames from show() itself"""
+        if self._renderer is None:
+            return
+        self._renderer.stop()
+        self._renderer = None
+        self._handoff = None
+
+    # Draw overlay on the frame, then write it to the display
+    # (directly, or through the render thread)
     def show(self):
-        self.overlay_render()
+        # Layers and transitions go into separate buffers - the effect's
+        # frame stays as drawn
         self.text_render()
-        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        shown = self.overlay_render()
+        if self._transition is not None:
+            if self._transition.blend(shown, self._out):
+                shown = self._out
+            else:
+                self._transition = None
+        self._shown = shown
+        if self._recorder is not None:
+            self._recorder.add(shown)
+
+        # Gamma / brightness last, so layers and transitions blend linear values
+        shown = self.correction.apply(shown, self._corrected)
+
+        # Same frame as the one on the panel - nothing to present
+        if np.array_equal(shown, self._presented):
+            self.frames_skipped += 1
+        else:
+            self._presented[:] = shown
+            buf = self._buf if shown is self.frame else shown.reshape(-1).data
+            if self._renderer is not None:
+                self._handoff.publish(buf)
+            else:
+                self._present(buf)
+        for hook in self.frame_hooks:
+            hook()
@@ -0,0 +1,25 @@
+"""Stand-ins shared by the unit tests"""
+
+
+class FakeClock:
+    """
+    Manual time source: tests set or advance .now, sleep() advances it
+    (and records the requested sleeps).
+
+    Args:
+        start: Initial time
+        tick: Added on every reading, so a loop spinning on the clock ends
+    """
+
+    def __init__(self, start=0.0, tick=0.0):
+        self.now = start
+        self.tick = tick
+        self.sleeps = []
+
+    def __call__(self):
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
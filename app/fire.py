@@ -1,5 +1,6 @@
 import random
-import time
+
+from scheduler import FrameScheduler
 
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
@@ -37,7 +38,8 @@ def _build_palette():
     return palette
 
 
-_PALETTE = _build_palette()
+# Drawn at half brightness - halved here once instead of per pixel
+_PALETTE = [(r >> 1, g >> 1, b >> 1) for r, g, b in _build_palette()]
 
 
 class Fire:
@@ -115,35 +117,30 @@ class Fire:
                 v = row[x]
                 if v > 0:
                     r, g, b = _PALETTE[v]
-                    pixels.append((x, y, r >> 1, g >> 1, b >> 1))
+                    pixels.append((x, y, r, g, b))
         return pixels
 
 
 # ---------------------------------------------------------------------------
 # Game loop
 # ---------------------------------------------------------------------------
-def RunFire(disp):
-    """Run the fire simulation on *disp* until RUNTIME_SECONDS elapses."""
-
-    print("Running Fire")
+def RunFire(disp, state=None, runtime_seconds=RUNTIME_SECONDS):
+    """Run the fire simulation on *disp* until *runtime_seconds* elapses.
 
-    start_time = time.time()
-    fire = Fire(disp.width, disp.height)
+    *state* is an already built Fire (see playlist.py); one is made if not given.
+    """
 
-    while True:
-        fire.update()
+    print("Running Fire")
 
-        pixel_list = fire.get_pixels()
+    fire = state if state is not None else Fire(disp.width, disp.height)
 
+    def draw():
         disp.clear()
-
-        for x, y, r, g, b in pixel_list:
+        for x, y, r, g, b in fire.get_pixels():
             disp.set_pixel(x, y, r, g, b)
-
         disp.show()
-        time.sleep(FRAME_DELAY)
 
-        elapsed = time.time() - start_time
-        if elapsed >= RUNTIME_SECONDS:
-            print(f"Fire runtime limit ({RUNTIME_SECONDS} seconds) reached")
-            return
+    scheduler = FrameScheduler(FRAME_DELAY)
+    scheduler.run(lambda dt: fire.update(), draw, duration=runtime_seconds)
+    print(f"Fire runtime limit ({runtime_seconds} seconds) reached")
+    print(f"   {scheduler.summary()}")
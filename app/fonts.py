@@ -0,0 +1,187 @@
+"""
+BDF fonts parsed once and text rendered into cached bitmap strips.
+
+The rgbmatrix library draws text glyph by glyph onto the canvas on every
+frame.  Here a BDF file is parsed once per process (load() is cached), a
+string is rasterized once per (font, text, color) into an RGBA strip
+(text_strip() is cached), and Display blits that strip into its 'text'
+layer only when the text changes.
+
+Glyphs are placed the way rgbmatrix places them, so text_set(x, y, ...)
+puts the text where graphics.DrawText did: y is the baseline and a glyph's
+top row lands at y - glyph height - glyph y offset.
+
+A Ticker scrolls text by sliding a window over one pre-rendered strip:
+    ticker = Ticker(font, "HELLO WORLD", (255, 200, 0), y=63, width=64)
+    ticker.draw(layer)          # once per frame
+"""
+
+import os
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+import layers
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+FONT_DIR = "fonts"            # Where load() looks for .bdf files
+STRIP_CACHE_SIZE = 256        # Rendered text strips kept (least recently used go)
+TICKER_SPEED = 20.0           # Pixels per second a Ticker scrolls
+TICKER_GAP = 16               # Blank pixels between repeats of a Ticker's text
+# ============================================================================
+
+# bitmap: bool array (height x width); offsets and advance as in the BDF file
+Glyph = namedtuple('Glyph', 'bitmap x_offset y_offset advance')
+
+
+class BDFFont:
+    """Glyphs of a BDF font, by code point"""
+
+    def __init__(self, glyphs, height, ascent, default_char=None):
+        """
+        Args:
+            glyphs: {code point: Glyph}
+            height: Rows of a text strip (font bounding box height)
+            ascent: Rows above the baseline (strip row of the baseline)
+            default_char: Code point drawn for characters the font lacks
+        """
+        self.glyphs = glyphs
+        self.height = height
+        self.ascent = ascent
+        self.default = glyphs.get(default_char)
+
+    @classmethod
+    def parse(cls, lines):
+        """Build a font from the lines of a BDF file"""
+        glyphs = {}
+        height = ascent = 0
+        default_char = None
+        lines = iter(lines)
+        for line in lines:
+            words = line.split()
+            if not words:
+                continue
+            if words[0] == 'FONTBOUNDINGBOX':
+                height = int(words[2])
+                ascent = height + int(words[4])
+            elif words[0] == 'DEFAULT_CHAR':
+                default_char = int(words[1])
+            elif words[0] == 'STARTCHAR':
+                code, glyph = cls._parse_glyph(lines)
+                if code >= 0:
+                    glyphs[code] = glyph
+        return cls(glyphs, height, ascent, default_char)
+
+    @staticmethod
+    def _parse_glyph(lines):
+        """Read one glyph, up to and including ENDCHAR: (code point, Glyph)"""
+        code = -1
+        advance = width = height = x_offset = y_offset = 0
+        rows = []
+        for line in lines:
+            words = line.split()
+            if not words:
+                continue
+            if words[0] == 'ENCODING':
+                code = int(words[1])
+            elif words[0] == 'DWIDTH':
+                advance = int(words[1])
+            elif words[0] == 'BBX':
+                width, height, x_offset, y_offset = map(int, words[1:5])
+            elif words[0] == 'BITMAP':
+                rows = [next(lines).strip() for _ in range(height)]
+            elif words[0] == 'ENDCHAR':
+                break
+        # Rows are hex, MSB = leftmost pixel, padded to whole bytes
+        bits = np.zeros((height, 0), dtype=np.uint8)
+        if height and rows[0]:
+            data = np.frombuffer(bytes.fromhex(''.join(rows)), dtype=np.uint8)
+            bits = np.unpackbits(data.reshape(height, -1), axis=1)
+        bitmap = np.zeros((height, width), dtype=bool)
+        bitmap[:, :bits.shape[1]] = bits[:, :width]
+        return code, Glyph(bitmap, x_offset, y_offset, advance)
+
+    def glyph(self, char):
+        return self.glyphs.get(ord(char), self.default)
+
+    def text_width(self, text):
+        return sum(glyph.advance for glyph in map(self.glyph, text) if glyph)
+
+    def render(self, text):
+        """Boolean mask (height x text_width) of text, baseline at row ascent"""
+        mask = np.zeros((self.height, self.text_width(text)), dtype=bool)
+        x = 0
+        for glyph in map(self.glyph, text):
+            if glyph is None:
+                continue
+            top = self.ascent - glyph.bitmap.shape[0] - glyph.y_offset
+            layers.stamp(mask, glyph.bitmap, x + glyph.x_offset, top, True)
+            x += glyph.advance
+        return mask
+
+
+@lru_cache(maxsize=None)
+def load(name, font_dir=FONT_DIR):
+    """Parse a BDF font from font_dir (once - later calls return the same font)"""
+    with open(os.path.join(font_dir, name), encoding='latin-1') as f:
+        return BDFFont.parse(f)
+
+
+@lru_cache(maxsize=STRIP_CACHE_SIZE)
+def text_strip(font, text, color):
+    """
+    Text rendered as an RGBA strip (font.height x text width x 4): color
+    where a glyph has a pixel, transparent elsewhere.  Shared between
+    callers, so read-only.
+    """
+    mask = font.render(text)
+    strip = np.zeros(mask.shape + (4,), dtype=np.uint8)
+    strip[mask] = (*color, 255)
+    strip.flags.writeable = False
+    return strip
+
+
+class Ticker:
+    """Text scrolling right to left, repeating, within a band of the panel"""
+
+    def __init__(self, font, text, color, y, x=0, width=64,
+                 speed=TICKER_SPEED, gap=TICKER_GAP, clock=time.monotonic):
+        """
+        Args:
+            font: BDFFont
+            y: Baseline, as for Display.text_set()
+            x, width: Columns the ticker occupies
+            speed: Pixels per second
+            gap: Blank pixels between the end of the text and its next repeat
+            clock: Time source
+        """
+        strip = text_strip(font, text, tuple(color))
+        self.period = strip.shape[1] + gap
+        # Enough repeats that any window of width columns is one slice
+        copies = -(-width // self.period) + 1
+        self.tape = np.zeros((font.height, self.period * copies, 4), dtype=np.uint8)
+        for i in range(copies):
+            start = i * self.period
+            self.tape[:, start:start + strip.shape[1]] = strip
+        self.x = x
+        self.top = y - font.ascent
+        self.width = width
+        self.speed = speed
+        self.clock = clock
+        self.start_time = None
+
+    def offset(self):
+        """Column of the tape at the left edge of the window (0 at the first draw)"""
+        now = self.clock()
+        if self.start_time is None:
+            self.start_time = now
+        return int((now - self.start_time) * self.speed) % self.period
+
+    def draw(self, layer):
+        """Copy the current window of the tape into a layers.Layer"""
+        offset = self.offset()
+        layer.blit(self.tape[:, offset:offset + self.width], self.x, self.top)
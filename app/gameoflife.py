@@ -1,6 +1,8 @@
 import random
 import time
 
+from scheduler import FrameScheduler
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -123,47 +125,34 @@ class GameOfLife:
         return sum(sum(row) for row in self.board)
 
 
-def RunGameOfLife(disp, runtime_seconds=RUNTIME_SECONDS, frame_time_ms=FRAME_TIME_MS):
+def RunGameOfLife(disp, state=None, runtime_seconds=RUNTIME_SECONDS, frame_time_ms=FRAME_TIME_MS):
     """
     Run Conway's Game of Life
+    (state: an already seeded GameOfLife, e.g. built ahead by the playlist)
     """
 
     print("Running Game Of Life")
     
-    start_time = time.time()
-    last_update_time = start_time
+    game = state if state is not None else GameOfLife(disp.width, disp.height, density=STARTING_DENSITY)
+    
+    def draw():
+        disp.clear()
+        
+        # Draw each pixel
+        for x, y, r, g, b in game.get_pixels():
+            disp.set_pixel(x, y, r, g, b)
+        
+        disp.show()
+        
+        #population = game.count_population()
+        #print(f"Generation {game.generation}: {population} cells alive")
     
-    game = GameOfLife(disp.width, disp.height, density=STARTING_DENSITY)
+    # One generation per frame
+    scheduler = FrameScheduler(frame_time_ms / 1000.0)
+    scheduler.run(lambda dt: game.update(), draw, duration=runtime_seconds)
     
-    while True:
-        current_time = time.time()
-        
-        # Update game state based on frame time
-        if (current_time - last_update_time) >= (frame_time_ms / 1000.0):
-            game.update()
-            last_update_time = current_time
-            
-            # Get pixels and draw only after update
-            pixel_list = game.get_pixels()
-            
-            disp.clear()
-            
-            # Draw each pixel
-            for x, y, r, g, b in pixel_list:
-                disp.set_pixel(x, y, r, g, b)
-            
-            disp.show()
-            
-            #population = game.count_population()
-            #print(f"Generation {game.generation}: {population} cells alive")
-        else:
-            # Small sleep to prevent busy-waiting when waiting for next frame
-            time.sleep(0.1)
-        
-        # Check if runtime limit exceeded
-        if current_time >= start_time + runtime_seconds:
-            population = game.count_population()
-            print(f"Game of Life runtime limit ({runtime_seconds} seconds) reached")
-            print(f"   Final generation: {game.generation}: {population} cells alive")
-            time.sleep(3.0)
-            return
+    population = game.count_population()
+    print(f"Game of Life runtime limit ({runtime_seconds} seconds) reached")
+    print(f"   Final generation: {game.generation}: {population} cells alive")
+    print(f"   {scheduler.summary()}")
+    time.sleep(3.0)
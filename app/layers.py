@@ -0,0 +1,205 @@
+"""
+Layered compositor for Display.
+
+Each Layer is an RGBA uint8 array (height x width x 4) with a z-order, an
+opacity and a blend mode.  The Compositor puts the visible layers over the
+effect's framebuffer in z-order (lowest first) when a frame is shown:
+
+    normal    alpha blend: out = out * (1 - a) + rgb * a
+    add       out = min(255, out + rgb * a)
+    multiply  out = out * lerp(1, rgb / 255, a)
+    mask      alpha is a stencil: where it is opaque the layers below show
+              through, elsewhere they are replaced by the layer's rgb
+
+(a = pixel alpha x layer opacity.)  The result is cached: flattening only
+happens when a layer was drawn into or re-configured, or the frame under
+the layers changed, so static layers (a game board, placed pieces) cost
+nothing on the frames where nothing moves.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+BLEND_MODES = ('normal', 'add', 'multiply', 'mask')
+
+
+@lru_cache(maxsize=None)
+def sprite_mask(sprite):
+    """Boolean mask array of a sprites.Sprite"""
+    mask = np.frombuffer(bytes(sprite.mask), dtype=np.uint8)
+    return mask.reshape(sprite.height, sprite.width).astype(bool)
+
+
+def clip(x, y, width, height, max_width, max_height):
+    """Clip a rectangle to (0, 0, max_width, max_height): (x0, y0, x1, y1) or None"""
+    x0 = max(x, 0)
+    y0 = max(y, 0)
+    x1 = min(x + width, max_width)
+    y1 = min(y + height, max_height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def stamp(target, mask, left, top, value):
+    """Set target[y, x] = value wherever mask is set, with mask placed at (left, top)"""
+    h, w = mask.shape
+    rect = clip(left, top, w, h, target.shape[1], target.shape[0])
+    if rect:
+        x0, y0, x1, y1 = rect
+        region = target[y0:y1, x0:x1]
+        region[mask[y0 - top:y1 - top, x0 - left:x1 - left]] = value
+
+
+class Layer:
+    """One RGBA layer; drawing into it marks it dirty"""
+
+    def __init__(self, width, height, z=0, opacity=1.0, blend='normal'):
+        if blend not in BLEND_MODES:
+            raise ValueError(f"Unknown blend mode: {blend}")
+        self.width = width
+        self.height = height
+        self.rgba = np.zeros((height, width, 4), dtype=np.uint8)
+        self.z = z
+        self.opacity = opacity
+        self.blend = blend
+        self.visible = True
+        self.dirty = True
+
+    def clear(self, color=(0, 0, 0), alpha=0):
+        self.rgba[:] = (*color, alpha)
+        self.dirty = True
+
+    def set_color(self, color):
+        """Change the rgb of every pixel, keeping the alpha (e.g. an overlay's color)"""
+        self.rgba[..., :3] = color
+        self.dirty = True
+
+    def set_pixel(self, x, y, color, alpha=255):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.rgba[y, x] = (*color, alpha)
+            self.dirty = True
+
+    def fill_rect(self, x, y, width, height, color, alpha=255):
+        rect = clip(x, y, width, height, self.width, self.height)
+        if rect:
+            x0, y0, x1, y1 = rect
+            self.rgba[y0:y1, x0:x1] = (*color, alpha)
+            self.dirty = True
+
+    def draw_sprite(self, sprite, x, y, color, alpha=255):
+        """Stamp a sprites.Sprite with its anchor at (x, y)"""
+        if len(sprite):
+            stamp(self.rgba, sprite_mask(sprite), x + sprite.left, y + sprite.top,
+                  (*color, alpha))
+            self.dirty = True
+
+    def stamp_alpha(self, sprite, x, y, alpha=255):
+        """Set only the alpha under a sprite (stencils for the mask mode)"""
+        if len(sprite):
+            stamp(self.rgba[..., 3], sprite_mask(sprite), x + sprite.left, y + sprite.top, alpha)
+            self.dirty = True
+
+    def fill_alpha(self, x, y, width, height, alpha=255):
+        rect = clip(x, y, width, height, self.width, self.height)
+        if rect:
+            x0, y0, x1, y1 = rect
+            self.rgba[y0:y1, x0:x1, 3] = alpha
+            self.dirty = True
+
+    def blit(self, image, x=0, y=0):
+        """Copy an RGBA array (height x width x 4) into the layer at (x, y)"""
+        h, w = image.shape[:2]
+        rect = clip(x, y, w, h, self.width, self.height)
+        if rect:
+            x0, y0, x1, y1 = rect
+            self.rgba[y0:y1, x0:x1] = image[y0 - y:y1 - y, x0 - x:x1 - x]
+            self.dirty = True
+
+
+def composite(out, layer):
+    """Blend one layer onto out (uint32 work array, values 0-255) in place, rounding"""
+    op = int(round(max(0.0, min(1.0, layer.opacity)) * 255))
+    alpha = layer.rgba[..., 3:4].astype(np.uint32)
+    rgb = layer.rgba[..., :3].astype(np.uint32)
+
+    if layer.blend == 'mask':
+        # How much of what is below stays (the stencil, faded by opacity)
+        keep = 255 - (255 - alpha) * op // 255
+        out *= keep
+        out += rgb * (255 - keep) + 127
+        out //= 255
+        return
+
+    a = alpha * op // 255
+    if layer.blend == 'normal':
+        out *= 255 - a
+        out += rgb * a + 127
+        out //= 255
+    elif layer.blend == 'add':
+        out += (rgb * a + 127) // 255
+        np.minimum(out, 255, out=out)
+    elif layer.blend == 'multiply':
+        out *= 65025 - a * (255 - rgb)
+        out += 32512
+        out //= 65025
+
+
+class Compositor:
+    """Named layers flattened over a base frame"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.layers = {}                # name -> Layer
+        self.flattens = 0               # Times the layers were actually composited
+        self._out = np.zeros((height, width, 3), dtype=np.uint8)
+        self._work = np.zeros((height, width, 3), dtype=np.uint32)
+        self._base = np.zeros((height, width, 3), dtype=np.uint8)
+        self._key = None
+
+    def add(self, name, z=0, opacity=1.0, blend='normal'):
+        """Create (or replace) a transparent layer"""
+        layer = Layer(self.width, self.height, z, opacity, blend)
+        self.layers[name] = layer
+        return layer
+
+    def remove(self, name):
+        self.layers.pop(name, None)
+
+    def clear(self):
+        self.layers.clear()
+
+    def get(self, name):
+        return self.layers.get(name)
+
+    def flatten(self, base):
+        """
+        Composite the visible layers over base (height x width x 3).
+
+        Returns:
+            The flattened frame (owned by the compositor, valid until the
+            next call), or None when no layer is visible
+        """
+        visible = sorted((layer.z, i, name, layer) for i, (name, layer)
+                         in enumerate(self.layers.items()) if layer.visible)
+        if not visible:
+            return None
+
+        key = tuple((name, id(layer), layer.z, layer.opacity, layer.blend)
+                    for _, _, name, layer in visible)
+        if (key == self._key and not any(layer.dirty for *_, layer in visible)
+                and np.array_equal(base, self._base)):
+            return self._out
+
+        self._base[:] = base
+        work = self._work
+        work[:] = base
+        for *_, layer in visible:
+            composite(work, layer)
+            layer.dirty = False
+        self._out[:] = work
+        self._key = key
+        self.flattens += 1
+        return self._out
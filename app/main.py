@@ -1,69 +1,118 @@
 from display import Display
-from c4_game import RunGame
-from starfield import RunStarfield
-from ttt_game import ttt_RunGame
-from ReactionDiffusion import RunReactionDiffusion
-from gameoflife import RunGameOfLife
-from snake import RunSnakeGame
-from matrix import RunMatrix
-from pong import RunPongGame
-from breakout import RunBreakoutGame
-from maze import RunMazeGame
-from fire import RunFire
+import telemetry
+import profiling
+import playlist
+import correction
+import argparse
+import os
 import time
 
-disp = Display()
+# Present frames from a dedicated thread so effects never wait on vsync
+RENDER_THREAD = True
 
-disp.clear()
+# Per-stage frame timing: periodic log line, telemetry.json and
+# http://127.0.0.1:9108/metrics (see telemetry.py)
+TELEMETRY = True
 
-# Run games in an infinite loop
-# Each game runs until it completes, then the next game starts
-while True:
+# Blend between effects: fade, wipe, dissolve or random (None = hard cut)
+TRANSITION = 'random'
+TRANSITION_SECONDS = 1.0
 
+# Dim the panel during correction.NIGHT_HOURS (checked as each effect starts)
+NIGHT_MODE = False
 
-    print("="*50)
-    disp.reset()
-    RunFire(disp)
+# Effects to play (see playlist.py); DEFAULT_PLAYLIST is used when it is missing
+PLAYLIST_PATH = "playlist.json"
 
-    print("="*50)
-    disp.reset()
-    RunSnakeGame(disp)
+# Every effect the playlist can name: {run function: (module, function or
+# class that builds its state ahead of time, None = nothing to build)}.
+# Modules are only imported when the playlist first needs them.
+EFFECTS = {
+    'RunFire':              ('fire', 'Fire'),
+    'RunSnakeGame':         ('snake', 'SnakeGame'),
+    'RunMazeGame':          ('maze', 'PrepareMazeGame'),
+    'RunScrollingMaze':     ('maze', 'PrepareScrollingMaze'),
+    'RunBreakoutGame':      ('breakout', 'BreakoutGame'),
+    'RunPongGame':          ('pong', 'PongGame'),
+    'RunMatrix':            ('matrix', 'MatrixRain'),
+    'RunGameOfLife':        ('gameoflife', 'GameOfLife'),
+    'RunGame':              ('c4_game', None),
+    'RunReactionDiffusion': ('ReactionDiffusion', 'PrepareReactionDiffusion'),
+    'RunStarfield':         ('starfield', 'StarField'),
+    'ttt_RunGame':          ('ttt_game', 'ttt_Prepare'),
+    'RunRecording':         ('recording', 'PrepareRecording'),
+}
 
-    print("="*50)
-    disp.reset()
-    RunMazeGame(disp)
+# Where each effect spends its update and pixel generation time, hooked up
+# when the effect's module is imported ('module.Class' or 'module': methods)
+INSTRUMENT = {
+    'fire.Fire':                           dict(update='update', get_pixels='pixels'),
+    'snake.SnakeGame':                     dict(update='update', get_changed_pixels='pixels'),
+    'maze.ScrollingMaze':                  dict(step='update', get_pixels='pixels'),
+    'breakout.BreakoutGame':               dict(update='update', get_pixels='pixels'),
+    'pong.PongGame':                       dict(update='update', get_pixels='pixels'),
+    'gameoflife.GameOfLife':               dict(update='update', get_pixels='pixels'),
+    'ReactionDiffusion.ReactionDiffusion': dict(update='update', get_pixels='pixels'),
+    'starfield.StarField':                 dict(update='update', get_pixels='pixels'),
+    'matrix.MatrixRain':                   dict(update='update', get_pixels='pixels'),
+    'ttt_game':                            dict(Get_Next_Move='update'),
+}
 
-    print("="*50)
-    disp.reset()
-    RunBreakoutGame(disp)
+DEFAULT_PLAYLIST = ['RunFire', 'RunSnakeGame', 'RunMazeGame', 'RunScrollingMaze',
+                    'RunBreakoutGame', 'RunPongGame', 'RunGameOfLife', 'RunGame',
+                    'RunReactionDiffusion', 'RunStarfield', 'ttt_RunGame']
 
-    print("="*50)
-    disp.reset()
-    RunPongGame(disp)
+parser = argparse.ArgumentParser(description="Run the LED matrix effects")
+parser.add_argument('--playlist', default=PLAYLIST_PATH,
+                    help="playlist file (default %(default)s)")
+profiling.add_arguments(parser)
+args = parser.parse_args()
 
-    # Eh, kinda dumb looking
-    # print("="*50)
-    # disp.reset()
-    # RunMatrix(disp)
+# Profile one effect on demand (see profiling.py)
+profiler = profiling.from_args(args)
 
-    print("="*50)
-    disp.reset()
-    RunGameOfLife(disp)
+disp = Display(render_thread=RENDER_THREAD)
 
-    print("="*50)
-    disp.reset()
-    RunGame(disp)  
+disp.clear()
 
+stats = None
+if TELEMETRY:
+    stats = telemetry.Telemetry()
+    stats.install(disp)
+
+
+def instrument(module):
+    """Add the INSTRUMENT timing hooks for a freshly imported effect module"""
+    if not stats:
+        return
+    for target, methods in INSTRUMENT.items():
+        module_name, _, attr = target.partition('.')
+        if module_name == module.__name__:
+            stats.instrument(getattr(module, attr) if attr else module, **methods)
+
+
+def run_effect(effect, **kwargs):
     print("="*50)
+    if TRANSITION:
+        disp.begin_transition(TRANSITION, TRANSITION_SECONDS)
     disp.reset()
-    RunReactionDiffusion(disp)
-    
-    print("="*50)
-    disp.reset()
-    RunStarfield(disp)
-    
-    print("="*50)
-    disp.reset()
-    ttt_RunGame(disp)
+    if NIGHT_MODE:
+        disp.set_brightness(correction.scheduled_brightness(time.localtime().tm_hour))
+    if stats:
+        stats.begin_effect(effect.__name__)
+    if profiler and profiler.wants(effect):
+        profiler.run(effect, disp, **kwargs)
+    else:
+        effect(disp, **kwargs)
+
 
+registry = playlist.EffectRegistry(EFFECTS, on_import=instrument)
+if os.path.exists(args.playlist):
+    effects = playlist.load(args.playlist, registry)
+else:
+    print(f"No playlist file ({args.playlist}) - playing the default order")
+    effects = playlist.Playlist([playlist.PlaylistEntry(name) for name in DEFAULT_PLAYLIST], registry)
 
+# Run effects in an infinite loop
+# Each effect runs until it completes, then the next one (already built) starts
+playlist.PlaylistPlayer(effects, disp, run_effect).play()
@@ -1,8 +1,10 @@
 import random
-import time
+
+from scheduler import FrameScheduler
 
 RUNTIME_SECONDS = 60
 DEFAULT_NUM_COLUMNS = 15
+FRAME_TIME_MS = 20
 
 class MatrixRain:
     def __init__(self, width=64, height=64, num_columns=15):
@@ -84,32 +86,18 @@ class MatrixRain:
         return pixels
 
 
-def RunMatrix(disp):
+def RunMatrix(disp, state=None, runtime_seconds=RUNTIME_SECONDS):
     print("Running Matrix Rain")
     
-    start_time = time.time()
-    last_update = time.time()
-    
-    matrix_rain = MatrixRain(disp.width, disp.height, num_columns=DEFAULT_NUM_COLUMNS)
+    matrix_rain = state if state is not None else MatrixRain(disp.width, disp.height, num_columns=DEFAULT_NUM_COLUMNS)
     
-    while True:
-        current_time = time.time()
-        delta_time = current_time - last_update
-        last_update = current_time
-        
-        matrix_rain.update(delta_time)
-        
-        pixel_list = matrix_rain.get_pixels()
-        
+    def draw():
         disp.clear()
-        
-        for x, y, r, g, b in pixel_list:
+        for x, y, r, g, b in matrix_rain.get_pixels():
             disp.set_pixel(x, y, r, g, b)
-        
         disp.show()
-        time.sleep(0.01)
-        
-        elapsed = current_time - start_time
-        if elapsed >= RUNTIME_SECONDS:
-            print(f"Matrix runtime limit ({RUNTIME_SECONDS} seconds) reached")
-            return
\ No newline at end of file
+    
+    scheduler = FrameScheduler(FRAME_TIME_MS / 1000.0)
+    scheduler.run(matrix_rain.update, draw, duration=runtime_seconds)
+    print(f"Matrix runtime limit ({runtime_seconds} seconds) reached")
+    print(f"   {scheduler.summary()}")
@@ -1,348 +1,293 @@
-import random
 import time
+from collections import deque
+
+import maze_gen
+import maze_solver
+from scheduler import FrameScheduler
 
 # =========================================================================
 # USER-ADJUSTABLE PARAMETERS
 # =========================================================================
 FRAME_TIME_MS = 100  # Time between frames (in milliseconds)
 RUNTIME_SECONDS = 90 # How long the game runs (in seconds)
+MAZE_ALGORITHM = 'backtracker'  # backtracker, wilson, kruskal or eller
+MAZE_AGENTS = ['shortest', 'wall_follower', 'tremaux']  # Racing solvers (see maze_solver)
+MOVE_MS = 100                   # Time between solver steps in the race
+SCROLL_RUNTIME_SECONDS = 120    # How long the scrolling maze runs (0 = forever)
+SCROLL_MOVE_MS = 80             # Time between solver steps in the scrolling maze
 # =========================================================================
 
-def generate_maze(width, height):
+# Agent colors in MAZE_AGENTS order; trails use a quarter of the brightness
+AGENT_COLORS = [(0, 255, 0), (0, 150, 255), (255, 200, 0), (255, 0, 255)]
+
+def generate_maze(width, height, algorithm='backtracker'):
     """
-    Generate a random solvable maze using recursive backtracking.
+    Generate a random solvable maze (iteratively - no recursion limit).
 
     Args:
         width: Width of the maze (in pixels)
         height: Height of the maze (in pixels)
+        algorithm: Any of maze_gen.ALGORITHMS
 
     Returns:
         A 2D list representing the maze (True = wall, False = path).
     """
-    maze = [[True for _ in range(width)] for _ in range(height)]
+    return maze_gen.generate(width, height, algorithm).to_rows()
 
-    def carve_passages(x, y):
-        directions = [(0, -2), (0, 2), (-2, 0), (2, 0)]
-        random.shuffle(directions)
+# Maze with odd dimensions (31x31) that is scaled up 2x on the panel
+MAZE_SIZE = 31
 
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < width and 0 <= ny < height and maze[ny][nx]:
-                maze[ny][nx] = False
-                maze[y + dy // 2][x + dx // 2] = False
-                carve_passages(nx, ny)
+def PrepareMazeGame(width=64, height=64, algorithm=MAZE_ALGORITHM, agents=MAZE_AGENTS):
+    """
+    Generate the race maze and its solver agents (the slow part of the maze
+    game), so it can be done ahead of time.
 
-    # Start carving from the top-left corner
-    maze[1][1] = False
-    carve_passages(1, 1)
+    Returns:
+        (grid, dist, agents)
+    """
+    grid = maze_gen.generate(MAZE_SIZE, MAZE_SIZE, algorithm)
 
-    return maze
+    # One BFS from the goal; every agent then moves in O(1) per step
+    dist = maze_solver.distance_map(grid, MAZE_SIZE - 2, MAZE_SIZE - 2)
+    return grid, dist, [maze_solver.make_agent(name, grid, dist, 1, 1) for name in agents]
 
-def RunMazeGame(disp):
+def RunMazeGame(disp, state=None, runtime_seconds=RUNTIME_SECONDS):
     """
     Main game loop for the Maze game with 2-pixel wide walls and paths.
-    Player attempts to traverse the maze, making random choices at intersections.
-    Never backtracks - won't go the way it came.
-    Moves one step at a time for smooth animation.
-    Tracks visited paths to avoid redundant exploration (memory/mapping behavior).
+    Several solver agents (see maze_solver) race from the top-left corner to
+    the goal in the bottom-right, each leaving a trail in its own color.
+    The game ends when every agent has reached the goal or time runs out.
+    state is the result of PrepareMazeGame(); it is built here if not given.
     """
     print("Running Maze Game")
 
-    # Generate a smaller maze with odd dimensions (31x31) that will be scaled up 2x
-    maze_size = 31
-    maze = generate_maze(maze_size, maze_size)
+    maze_size = MAZE_SIZE
+    grid, dist, agents = state if state is not None else PrepareMazeGame(disp.width, disp.height)
     
     # Define start and goal positions (in maze coordinates)
     start_x, start_y = 1, 1
     goal_x, goal_y = maze_size - 2, maze_size - 2
-    
-    # Player starts at the start position
-    player_x, player_y = start_x, start_y
-    player_dir_x, player_dir_y = 1, 0  # Initial direction (moving right)
-    reached_goal = False
-    
-    # Track visited paths: set of (from_x, from_y, to_x, to_y) tuples
-    visited_paths = set()
+    print(f"  Shortest path: {dist[start_y * maze_size + start_x]} steps")
 
     start_time = time.time()
     display_maze_time = 3.0  # Show maze for 3 seconds before starting movement
     last_move_time = start_time
-    move_interval = 0.1  # Move every 0.1 seconds (one step)
+    move_interval = MOVE_MS / 1000.0
     
-    def get_valid_moves(x, y):
-        """Get all valid moves from position (x, y) - paths that are not walls"""
-        valid = []
-        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-            new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < maze_size and 0 <= new_y < maze_size:
-                if not maze[new_y][new_x]:  # 0 = path, 1 = wall
-                    valid.append((dx, dy))
-        return valid
+    def cell_pixels(x, y):
+        """Panel pixels of maze cell (x, y): scaled 2x, offset by 1 to center"""
+        return [(x * 2 + 1, y * 2 + 1), (x * 2 + 2, y * 2 + 1),
+                (x * 2 + 1, y * 2 + 2), (x * 2 + 2, y * 2 + 2)]
     
-    def get_unvisited_moves(x, y, exclude_dir_x=None, exclude_dir_y=None):
-        """Get moves that haven't been visited yet"""
-        valid_moves = get_valid_moves(x, y)
-        unvisited = []
-        
-        for dx, dy in valid_moves:
-            # Skip the direction we came from
-            if exclude_dir_x is not None and dx == -exclude_dir_x and dy == -exclude_dir_y:
-                continue
-            
-            new_x, new_y = x + dx, y + dy
-            # Check if this path has been visited
-            if (x, y, new_x, new_y) not in visited_paths:
-                unvisited.append((dx, dy))
-        
-        return unvisited
+    # Walls and goal never change - render them once as the static layer
+    static_pixels = []
+    for y in range(maze_size):
+        for x in range(maze_size):
+            if grid.is_wall(x, y):
+                static_pixels += [(px, py, 139, 69, 19) for px, py in cell_pixels(x, y)]  # Brown for walls
+    static_pixels += [(px, py, 255, 0, 0) for px, py in cell_pixels(goal_x, goal_y)]    # Red goal
+    disp.retained_begin(static_pixels)
+    
+    # Draw every agent once at the start
+    drawn = [None] * len(agents)
+    finished = set()
+    scheduler = FrameScheduler(FRAME_TIME_MS / 1000.0)
     
     while True:
         current_time = time.time()
         elapsed = current_time - start_time
         
-        # Clear the display
-        disp.clear()
-
-        # Draw the maze scaled 2x (each maze cell becomes a 2x2 pixel block)
-        # Center with 1 pixel offset on all sides
-        for y in range(maze_size):
-            for x in range(maze_size):
-                if maze[y][x]:
-                    # Draw 2x2 block for wall (offset by 1 to center)
-                    disp.set_pixel(x * 2 + 1, y * 2 + 1, 139, 69, 19)        # Brown for walls
-                    disp.set_pixel(x * 2 + 2, y * 2 + 1, 139, 69, 19)
-                    disp.set_pixel(x * 2 + 1, y * 2 + 2, 139, 69, 19)
-                    disp.set_pixel(x * 2 + 2, y * 2 + 2, 139, 69, 19)
-
-        # Draw the goal as a 2x2 red square (always visible)
-        for dx in range(2):
-            for dy in range(2):
-                disp.set_pixel(goal_x * 2 + dx + 1, goal_y * 2 + dy + 1, 255, 0, 0)
-
-        # Draw the player as a 2x2 green square
-        for dx in range(2):
-            for dy in range(2):
-                disp.set_pixel(player_x * 2 + dx + 1, player_y * 2 + dy + 1, 0, 255, 0)
+        # Only agents that moved are redrawn: old cell becomes trail, then heads on top
+        moved = [i for i, agent in enumerate(agents) if agent.pos != drawn[i]]
+        if moved:
+            for i in moved:
+                if drawn[i] is not None:
+                    r, g, b = AGENT_COLORS[i % len(AGENT_COLORS)]
+                    x, y = drawn[i] % maze_size, drawn[i] // maze_size
+                    for px, py in cell_pixels(x, y):
+                        disp.set_pixel(px, py, r // 4, g // 4, b // 4)
+                drawn[i] = agents[i].pos
+            for i, agent in enumerate(agents):
+                r, g, b = AGENT_COLORS[i % len(AGENT_COLORS)]
+                for px, py in cell_pixels(agent.x, agent.y):
+                    disp.set_pixel(px, py, r, g, b)
 
         # Show the display
         disp.show()
 
-        # After initial display time, start moving the player one step at a time
+        # After initial display time, every agent takes one step
         if elapsed > display_maze_time and (current_time - last_move_time) >= move_interval:
-            # Try to move in current direction
-            next_x = player_x + player_dir_x
-            next_y = player_y + player_dir_y
-            
-            # Check if next position is valid (in bounds and not a wall)
-            can_move_forward = (0 <= next_x < maze_size and 0 <= next_y < maze_size 
-                               and not maze[next_y][next_x])
-            
-            if can_move_forward:
-                # Mark this path as visited
-                visited_paths.add((player_x, player_y, next_x, next_y))
-                
-                # Move forward
-                player_x, player_y = next_x, next_y
-                
-                # Check if reached goal
-                if player_x == goal_x and player_y == goal_y:
-                    reached_goal = True
-                    print(f"Goal reached in {elapsed:.1f} seconds!")
-                    time.sleep(3.0)
-                    return
-                
-                # Check if we're at an intersection (2+ unvisited moves excluding where we came from)
-                unvisited_moves = get_unvisited_moves(player_x, player_y, player_dir_x, player_dir_y)
-                
-                if len(unvisited_moves) >= 2:
-                    # At an intersection with unvisited choices - randomly pick a new direction
-                    player_dir_x, player_dir_y = random.choice(unvisited_moves)
-                elif len(unvisited_moves) == 1:
-                    # Only one unvisited path - take it
-                    player_dir_x, player_dir_y = unvisited_moves[0]
-            else:
-                # Can't move forward - we're at a dead end or wall
-                # Find unvisited directions (excluding where we came from)
-                unvisited_moves = get_unvisited_moves(player_x, player_y, player_dir_x, player_dir_y)
-                
-                if unvisited_moves:
-                    # Pick a new unvisited direction and move immediately
-                    player_dir_x, player_dir_y = random.choice(unvisited_moves)
-                    next_x = player_x + player_dir_x
-                    next_y = player_y + player_dir_y
-                    
-                    # Move in the new direction
-                    if 0 <= next_x < maze_size and 0 <= next_y < maze_size and not maze[next_y][next_x]:
-                        visited_paths.add((player_x, player_y, next_x, next_y))
-                        player_x, player_y = next_x, next_y
-                        
-                        # Check if reached goal
-                        if player_x == goal_x and player_y == goal_y:
-                            reached_goal = True
-                            print(f"Goal reached in {elapsed:.1f} seconds!")
-                            time.sleep(3.0)
-                            return
-                else:
-                    # All paths visited - find any valid move that isn't where we came from
-                    valid_moves = get_valid_moves(player_x, player_y)
-                    available_moves = [m for m in valid_moves 
-                                     if not (m[0] == -player_dir_x and m[1] == -player_dir_y)]
-                    
-                    if available_moves:
-                        player_dir_x, player_dir_y = random.choice(available_moves)
-                        next_x = player_x + player_dir_x
-                        next_y = player_y + player_dir_y
-                        
-                        if 0 <= next_x < maze_size and 0 <= next_y < maze_size and not maze[next_y][next_x]:
-                            visited_paths.add((player_x, player_y, next_x, next_y))
-                            player_x, player_y = next_x, next_y
-                            
-                            if player_x == goal_x and player_y == goal_y:
-                                reached_goal = True
-                                print(f"Goal reached in {elapsed:.1f} seconds!")
-                                time.sleep(3.0)
-                                return
-                    elif valid_moves:
-                        # Only option is to turn around
-                        player_dir_x, player_dir_y = random.choice(valid_moves)
-                        next_x = player_x + player_dir_x
-                        next_y = player_y + player_dir_y
-                        
-                        if 0 <= next_x < maze_size and 0 <= next_y < maze_size and not maze[next_y][next_x]:
-                            visited_paths.add((player_x, player_y, next_x, next_y))
-                            player_x, player_y = next_x, next_y
-                            
-                            if player_x == goal_x and player_y == goal_y:
-                                reached_goal = True
-                                print(f"Goal reached in {elapsed:.1f} seconds!")
-                                time.sleep(3.0)
-                                return
-            
+            for i, agent in enumerate(agents):
+                agent.step()
+                if agent.done and i not in finished:
+                    finished.add(i)
+                    print(f"  {agent.name} reached the goal in {agent.steps} steps ({elapsed:.1f}s)")
             last_move_time = current_time
+            
+            if len(finished) == len(agents):
+                print(f"Goal reached by all agents in {elapsed:.1f} seconds!")
+                time.sleep(3.0)
+                return
         
         # Check if runtime limit exceeded
-        if elapsed >= RUNTIME_SECONDS:
-            if reached_goal:
-                print(f"Goal reached in {elapsed:.1f} seconds!")
-            else:
-                print(f"Maze game runtime limit ({RUNTIME_SECONDS}s) reached - goal not found")
+        if elapsed >= runtime_seconds:
+            print(f"Maze game runtime limit ({runtime_seconds}s) reached - "
+                  f"{len(finished)}/{len(agents)} agents found the goal")
             time.sleep(3.0)
             return
 
         # Frame timing
-        time.sleep(FRAME_TIME_MS / 1000.0)
-    
-    while True:
-        current_time = time.time()
-        elapsed = current_time - start_time
-        
-        # Clear the display
-        disp.clear()
+        scheduler.wait()
 
-        # Draw the maze scaled 2x (each maze cell becomes a 2x2 pixel block)
-        # Center with 1 pixel offset on all sides
-        for y in range(maze_size):
-            for x in range(maze_size):
-                if maze[y][x]:
-                    # Draw 2x2 block for wall (offset by 1 to center)
-                    disp.set_pixel(x * 2 + 1, y * 2 + 1, 139, 69, 19)        # Brown for walls
-                    disp.set_pixel(x * 2 + 2, y * 2 + 1, 139, 69, 19)
-                    disp.set_pixel(x * 2 + 1, y * 2 + 2, 139, 69, 19)
-                    disp.set_pixel(x * 2 + 2, y * 2 + 2, 139, 69, 19)
-
-        # Draw the goal as a 2x2 red square (always visible)
-        for dx in range(2):
-            for dy in range(2):
-                disp.set_pixel(goal_x * 2 + dx + 1, goal_y * 2 + dy + 1, 255, 0, 0)
-
-        # Draw the player as a 2x2 green square
-        for dx in range(2):
-            for dy in range(2):
-                disp.set_pixel(player_x * 2 + dx + 1, player_y * 2 + dy + 1, 0, 255, 0)
 
-        # Show the display
-        disp.show()
+class ScrollingMaze:
+    """
+    Endless maze streamed from Eller's algorithm, walked by a solver.
 
-        # After initial display time, start moving the player one step at a time
-        if elapsed > display_maze_time and (current_time - last_move_time) >= move_interval:
-            # Try to move in current direction
-            next_x = player_x + player_dir_x
-            next_y = player_y + player_dir_y
-            
-            # Check if next position is valid (in bounds and not a wall)
-            can_move_forward = (0 <= next_x < maze_size and 0 <= next_y < maze_size 
-                               and not maze[next_y][next_x])
-            
-            if can_move_forward:
-                # Move forward
-                player_x, player_y = next_x, next_y
-                
-                # Check if reached goal
-                if player_x == goal_x and player_y == goal_y:
-                    reached_goal = True
-                    print(f"Goal reached in {elapsed:.1f} seconds!")
-                    time.sleep(3.0)
-                    return
-                
-                # Check if we're at an intersection (2+ valid moves excluding where we came from)
-                valid_moves = get_valid_moves(player_x, player_y)
-                # Filter out the direction we came from
-                available_moves = [m for m in valid_moves 
-                                 if not (m[0] == -player_dir_x and m[1] == -player_dir_y)]
-                
-                if len(available_moves) >= 2:
-                    # At an intersection with choices - randomly pick a new direction
-                    player_dir_x, player_dir_y = random.choice(available_moves)
-            else:
-                # Can't move forward - we're at a dead end or wall
-                # Find available directions (excluding where we came from)
-                valid_moves = get_valid_moves(player_x, player_y)
-                available_moves = [m for m in valid_moves 
-                                 if not (m[0] == -player_dir_x and m[1] == -player_dir_y)]
-                
-                if available_moves:
-                    # Pick a new direction and move immediately
-                    player_dir_x, player_dir_y = random.choice(available_moves)
-                    next_x = player_x + player_dir_x
-                    next_y = player_y + player_dir_y
-                    
-                    # Move in the new direction
-                    if 0 <= next_x < maze_size and 0 <= next_y < maze_size and not maze[next_y][next_x]:
-                        player_x, player_y = next_x, next_y
-                        
-                        # Check if reached goal
-                        if player_x == goal_x and player_y == goal_y:
-                            reached_goal = True
-                            print(f"Goal reached in {elapsed:.1f} seconds!")
-                            time.sleep(3.0)
-                            return
-                elif valid_moves:
-                    # Only option is to turn around
-                    player_dir_x, player_dir_y = random.choice(valid_moves)
-                    next_x = player_x + player_dir_x
-                    next_y = player_y + player_dir_y
-                    
-                    # Move in the new direction
-                    if 0 <= next_x < maze_size and 0 <= next_y < maze_size and not maze[next_y][next_x]:
-                        player_x, player_y = next_x, next_y
-                        
-                        # Check if reached goal
-                        if player_x == goal_x and player_y == goal_y:
-                            reached_goal = True
-                            print(f"Goal reached in {elapsed:.1f} seconds!")
-                            time.sleep(3.0)
-                            return
-            
-            last_move_time = current_time
-        
-        # Check if runtime limit exceeded
-        if elapsed >= RUNTIME_SECONDS:
-            if reached_goal:
-                print(f"Goal reached in {elapsed:.1f} seconds!")
-            else:
-                print(f"Maze game runtime limit ({RUNTIME_SECONDS}s) reached - goal not found")
-            time.sleep(3.0)
+    Only the visible rows, a few generated ahead and backtrack_rows above
+    the view are kept - the generator itself keeps one row of set state - so
+    memory is O(width) however long it runs.  The rows above are for dead
+    ends: in an Eller maze the way on from one can climb back up dozens of
+    rows (the view follows the player up and down).
+    Coordinates are maze pixels; y counts rows from the very first row ever
+    generated and keeps growing.
+    """
+
+    def __init__(self, width=31, view_rows=31, lookahead=16, follow_row=20,
+                 backtrack_rows=256, trail_length=200, rng=None):
+        self.width = width
+        self.view_rows = view_rows
+        self.lookahead = lookahead        # Rows generated below the view
+        self.follow_row = follow_row      # Player is kept at or above this view row
+        self.backtrack_rows = backtrack_rows  # Rows kept above the player / view
+
+        self._rows_source = maze_gen.eller_rows(width, rng)
+        self.rows = deque()
+        self.top = 0                      # Absolute y of rows[0]
+        self.view_top = 0                 # Absolute y of the first visible row
+
+        self.player_x, self.player_y = 1, 1
+        self.trail = deque(maxlen=trail_length)
+        self.path = deque()
+        self._climbing = False            # Following a route back up out of a dead end
+        self._fill()
+
+    def is_wall(self, x, y):
+        return self.rows[y - self.top][x] == maze_gen.WALL
+
+    def _fill(self):
+        """Generate rows down to the lookahead and drop rows well above the player"""
+        bottom = self.view_top + self.view_rows + self.lookahead
+        while self.top + len(self.rows) < bottom:
+            self.rows.append(next(self._rows_source))
+        route_top = min((y for _, y in self.path), default=self.player_y)
+        keep_from = min(self.view_top, self.player_y, route_top) - self.backtrack_rows
+        while self.top < keep_from:
+            self.rows.popleft()
+            self.top += 1
+        while self.trail and self.trail[0][1] < self.top:
+            self.trail.popleft()
+
+    def _plan(self, top):
+        """BFS over the kept rows from top down to the deepest reachable cell"""
+        start = (self.player_x, self.player_y)
+        parent = {start: None}
+        queue = deque([start])
+        deepest = start
+        top = max(top, self.top)
+        bottom = self.top + len(self.rows)
+        while queue:
+            x, y = queue.popleft()
+            if y > deepest[1]:
+                deepest = (x, y)
+            for nx, ny in ((x, y + 1), (x + 1, y), (x - 1, y), (x, y - 1)):
+                if (top <= ny < bottom and (nx, ny) not in parent
+                        and not self.is_wall(nx, ny)):
+                    parent[(nx, ny)] = (x, y)
+                    queue.append((nx, ny))
+
+        path = deque()
+        node = deepest
+        while node != start:
+            path.appendleft(node)
+            node = parent[node]
+        self.path = path
+
+    def step(self):
+        """Move the solver one cell and scroll the view to follow it"""
+        if not self.path:
+            self._climbing = False
+        if not self._climbing and (not self.path or
+                                   self.path[-1][1] < self.top + len(self.rows) - 2):
+            # Plan within sight (cheap) ...
+            self._plan(min(self.view_top, self.player_y))
+            if not self.path:
+                # ... unless that is a dead end: the way on climbs back up
+                # through the rows kept above the view
+                self._plan(self.top)
+                self._climbing = bool(self.path)
+
+        if not self.path:
+            # No way down within the kept rows: hold the view where it is
             return
+        self.trail.append((self.player_x, self.player_y))
+        self.player_x, self.player_y = self.path.popleft()
 
-        # Frame timing
-        time.sleep(FRAME_TIME_MS / 1000.0)
\ No newline at end of file
+        # Scroll down to follow the player, or back up while it backtracks
+        scroll_to = self.player_y - self.follow_row
+        if scroll_to > self.view_top:
+            self.view_top = scroll_to
+            self._fill()
+        elif self.player_y < self.view_top:
+            self.view_top = self.player_y
+
+    def get_pixels(self):
+        """Return list of pixels to draw: [(x, y, r, g, b), ...] in panel coordinates"""
+        pixels = []
+        for vy in range(self.view_rows):
+            row = self.rows[self.view_top + vy - self.top]
+            for x in range(self.width):
+                if row[x] == maze_gen.WALL:
+                    pixels.append((x * 2 + 1, vy * 2 + 1, 139, 69, 19))       # Brown for walls
+
+        for x, y in self.trail:
+            if self.view_top <= y < self.view_top + self.view_rows:
+                pixels.append((x * 2 + 1, (y - self.view_top) * 2 + 1, 0, 60, 0))
+
+        pixels.append((self.player_x * 2 + 1, (self.player_y - self.view_top) * 2 + 1, 0, 255, 0))
+        return pixels
+
+
+def PrepareScrollingMaze(width=64, height=64, **options):
+    """Build the scrolling maze ahead of time (options go to ScrollingMaze)"""
+    return ScrollingMaze(**options)
+
+
+def RunScrollingMaze(disp, state=None, runtime_seconds=SCROLL_RUNTIME_SECONDS):
+    """
+    Endless maze mode: the maze is generated row by row as it scrolls up
+    the panel, following a solver that keeps heading deeper.
+    (state: a ScrollingMaze built ahead of time)
+    """
+    print("Running Scrolling Maze")
+
+    scroll_maze = state if state is not None else ScrollingMaze()
+
+    def draw():
+        disp.clear()
+        # Each maze cell is a 2x2 block, offset by 1 to center it
+        for x, y, r, g, b in scroll_maze.get_pixels():
+            if y + 1 < disp.height:
+                disp.set_pixel(x, y, r, g, b)
+                disp.set_pixel(x + 1, y, r, g, b)
+                disp.set_pixel(x, y + 1, r, g, b)
+                disp.set_pixel(x + 1, y + 1, r, g, b)
+        disp.show()
+
+    # One player move per frame
+    scheduler = FrameScheduler(SCROLL_MOVE_MS / 1000.0)
+    scheduler.run(lambda dt: scroll_maze.step(), draw,
+                  duration=runtime_seconds or None)
+    print(f"Scrolling maze runtime limit ({runtime_seconds}s) reached "
+          f"- {scroll_maze.player_y} rows deep")
+    print(f"   {scheduler.summary()}")
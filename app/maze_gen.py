@@ -0,0 +1,337 @@
+"""
+Iterative maze generator engine.
+
+Mazes are stored as a flat bytearray of pixels (1 = wall, 0 = path) in the
+same layout maze.generate_maze always used: rooms sit on odd coordinates and
+the walls between them on even ones, so a W x H maze has (W-1)//2 x (H-1)//2
+rooms.  Nothing here recurses, so the size is only limited by memory.
+
+Algorithms:
+    backtracker - depth-first search with an explicit stack (long corridors)
+    wilson      - loop-erased random walks (uniform spanning tree, unbiased)
+    kruskal     - random wall order + union-find (many short dead ends)
+    eller       - one row at a time with only one row of set state
+
+Speed, 2001 x 2001 pixels (a million rooms), CPython 3.11 on one slow VM
+core - a desktop is about 2.5x faster:
+    eller        1.6 s
+    backtracker  5 s
+    wilson       8 s     (walks in pixel space, one getrandbits(2) per step)
+    kruskal     10 s     (a quarter of it shuffling two million walls, the
+                          rest the path-halving union-find loop)
+Panel-sized mazes take milliseconds with any of them.
+
+Usage:
+    python maze_gen.py --bench 2001 2001
+"""
+
+import argparse
+import random
+import time
+
+WALL = 1
+PATH = 0
+
+
+class MazeGrid:
+    """A generated maze: width x height pixels in a flat bytearray"""
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(b'\x01') * (width * height)
+
+    def is_wall(self, x, y):
+        return self.cells[y * self.width + x] == WALL
+
+    def to_rows(self):
+        """Return a 2D list (True = wall), the format maze.generate_maze returns"""
+        w = self.width
+        return [[c == WALL for c in self.cells[y * w:(y + 1) * w]] for y in range(self.height)]
+
+    def __str__(self):
+        w = self.width
+        return "\n".join(
+            "".join("#" if c else " " for c in self.cells[y * w:(y + 1) * w])
+            for y in range(self.height))
+
+
+def _room_counts(width, height):
+    if width < 3 or height < 3:
+        raise ValueError("maze must be at least 3x3 pixels")
+    return (width - 1) // 2, (height - 1) // 2
+
+
+# ---------------------------------------------------------------------------
+# Recursive backtracker (explicit stack)
+# ---------------------------------------------------------------------------
+def _backtracker(grid, rng):
+    cw, ch = _room_counts(grid.width, grid.height)
+    w = grid.width
+    cells = grid.cells
+
+    # Room-space bitmap with a one-room border marked as already visited,
+    # which removes every bounds check from the inner loop
+    rw = cw + 2
+    visited = bytearray(b'\x01') * (rw * (ch + 2))
+    for j in range(ch):
+        start = (j + 1) * rw + 1
+        visited[start:start + cw] = bytes(cw)
+
+    # (room step, pixel step) for each direction
+    dirs = ((1, 2), (-1, -2), (rw, 2 * w), (-rw, -2 * w))
+
+    room = rw + 1
+    pixel = w + 1
+    visited[room] = 1
+    cells[pixel] = PATH
+    stack = [(room, pixel)]
+    choice = rng.choice
+
+    while stack:
+        room, pixel = stack[-1]
+        options = [d for d in dirs if not visited[room + d[0]]]
+        if not options:
+            stack.pop()
+            continue
+        dr, dp = options[0] if len(options) == 1 else choice(options)
+        room += dr
+        visited[room] = 1
+        cells[pixel + dp // 2] = PATH
+        pixel += dp
+        cells[pixel] = PATH
+        stack.append((room, pixel))
+
+
+# ---------------------------------------------------------------------------
+# Wilson's algorithm (loop-erased random walk)
+# ---------------------------------------------------------------------------
+def _wilson(grid, rng):
+    cw, ch = _room_counts(grid.width, grid.height)
+    w = grid.width
+    cells = grid.cells
+
+    # The walk runs on pixel positions: a room is in the maze once its pixel
+    # is open, a move is two pixels and the pixel in between is the wall to
+    # carve.  Moves whose wall pixel lies on the outer border are rejected.
+    steps = (2, -2, 2 * w, -2 * w)
+    walls = (1, -1, w, -w)
+    outside = bytearray(len(cells))
+    for y in (0, 2 * ch):
+        outside[y * w:(y + 1) * w] = b'\x01' * w
+    for x in (0, 2 * cw):
+        outside[x::w] = b'\x01' * grid.height
+    # Direction last taken out of each room; overwriting it is what erases loops
+    exit_dir = bytearray(len(cells))
+    getrandbits = rng.getrandbits
+
+    rooms = [(2 * j + 1) * w + 2 * i + 1 for j in range(ch) for i in range(cw)]
+    cells[rooms[rng.randrange(len(rooms))]] = PATH
+
+    # The spanning tree is uniform whatever order the walks start in, so
+    # the rooms are simply taken in scan order
+    for start in rooms:
+        if not cells[start]:
+            continue
+
+        # Random walk until the maze is hit, remembering the last exit per room
+        pixel = start
+        while cells[pixel]:
+            d = getrandbits(2)
+            if outside[pixel + walls[d]]:
+                continue
+            exit_dir[pixel] = d
+            pixel += steps[d]
+
+        # Carve the loop-erased path
+        pixel = start
+        while cells[pixel]:
+            cells[pixel] = PATH
+            d = exit_dir[pixel]
+            cells[pixel + walls[d]] = PATH
+            pixel += steps[d]
+
+
+# ---------------------------------------------------------------------------
+# Kruskal's algorithm (union-find)
+# ---------------------------------------------------------------------------
+def _kruskal(grid, rng):
+    cw, ch = _room_counts(grid.width, grid.height)
+    w = grid.width
+    cells = grid.cells
+    total = cw * ch
+
+    for j in range(ch):
+        row = (2 * j + 1) * w
+        cells[row + 1:row + 2 * cw:2] = bytes(cw)
+
+    # Each candidate wall is encoded as room * 2 + (0 = east, 1 = south)
+    walls = [r * 2 for r in range(total) if r % cw != cw - 1]
+    walls += [r * 2 + 1 for r in range(total - cw)]
+    rng.shuffle(walls)
+
+    parent = list(range(total))
+    remaining = total - 1
+
+    for wall in walls:
+        a = wall >> 1
+        b = a + cw if wall & 1 else a + 1
+
+        # Find with path halving
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            continue
+        parent[b] = a
+
+        room = wall >> 1
+        pixel = (2 * (room // cw) + 1) * w + 2 * (room % cw) + 1
+        cells[pixel + w if wall & 1 else pixel + 1] = PATH
+
+        remaining -= 1
+        if remaining == 0:
+            break
+
+
+# ---------------------------------------------------------------------------
+# Eller's algorithm (row by row)
+# ---------------------------------------------------------------------------
+def eller_rows(width, rng=None, rows=None, merge_chance=0.5, down_chance=0.5):
+    """
+    Generate a maze one pixel row at a time.
+
+    Only the set labels of the current row are kept, so memory stays O(width)
+    no matter how many rows are produced.
+
+    Args:
+        width: Maze width in pixels
+        rng: random.Random instance (default: module random)
+        rows: Number of room rows, or None for an endless maze
+        merge_chance: Chance of joining two horizontal neighbours
+        down_chance: Chance of an extra passage down from a room
+
+    Yields:
+        bytearray pixel rows (1 = wall), starting with the top border.
+        A finite maze yields 2 * rows + 1 rows, ending with the bottom border.
+    """
+    rng = rng or random
+    cw = (width - 1) // 2
+    if cw < 1:
+        raise ValueError("maze must be at least 3 pixels wide")
+    rnd = rng.random
+
+    border = bytearray(b'\x01') * width
+    yield bytearray(border)
+
+    labels = list(range(cw))
+    next_label = cw
+    row_index = 0
+
+    while rows is None or row_index < rows:
+        last = rows is not None and row_index == rows - 1
+        room_row = bytearray(border)
+        for i in range(cw):
+            room_row[2 * i + 1] = PATH
+
+        members = {}
+        for i, label in enumerate(labels):
+            members.setdefault(label, []).append(i)
+
+        # Join horizontal neighbours that are not already connected
+        # (the smaller set is relabelled into the larger one)
+        for i in range(cw - 1):
+            a = labels[i]
+            b = labels[i + 1]
+            if a != b and (last or rnd() < merge_chance):
+                room_row[2 * i + 2] = PATH
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                moved = members.pop(b)
+                for k in moved:
+                    labels[k] = a
+                members[a].extend(moved)
+        yield room_row
+
+        if last:
+            yield bytearray(border)
+            return
+
+        # Every set needs at least one passage down
+        below = bytearray(border)
+        carried = [False] * cw
+        for label, group in members.items():
+            forced = group[0] if len(group) == 1 else rng.choice(group)
+            for i in group:
+                if i == forced or rnd() < down_chance:
+                    carried[i] = True
+                    below[2 * i + 1] = PATH
+        yield below
+
+        # Rooms without a passage from above start new sets
+        for i in range(cw):
+            if not carried[i]:
+                labels[i] = next_label
+                next_label += 1
+        row_index += 1
+
+
+def _eller(grid, rng):
+    cw, ch = _room_counts(grid.width, grid.height)
+    w = grid.width
+    for y, row in enumerate(eller_rows(w, rng, rows=ch)):
+        grid.cells[y * w:(y + 1) * w] = row
+
+
+ALGORITHMS = {
+    'backtracker': _backtracker,
+    'wilson': _wilson,
+    'kruskal': _kruskal,
+    'eller': _eller,
+}
+
+
+def generate(width, height, algorithm='backtracker', rng=None):
+    """
+    Generate a perfect maze (exactly one path between any two rooms).
+
+    Args:
+        width: Width of the maze in pixels (odd sizes use every column)
+        height: Height of the maze in pixels
+        algorithm: One of ALGORITHMS
+        rng: random.Random instance for reproducible mazes (default: module random)
+
+    Returns:
+        MazeGrid
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown maze algorithm: {algorithm}")
+    _room_counts(width, height)
+    grid = MazeGrid(width, height)
+    ALGORITHMS[algorithm](grid, rng or random)
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maze generator benchmark")
+    parser.add_argument('--bench', nargs=2, type=int, metavar=('WIDTH', 'HEIGHT'),
+                        default=(2001, 2001), help="maze size in pixels")
+    parser.add_argument('--algorithms', nargs='+', default=sorted(ALGORITHMS),
+                        choices=sorted(ALGORITHMS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--show', action='store_true', help="print the maze")
+    args = parser.parse_args(argv)
+
+    width, height = args.bench
+    for algorithm in args.algorithms:
+        start_time = time.perf_counter()
+        grid = generate(width, height, algorithm, random.Random(args.seed))
+        elapsed = time.perf_counter() - start_time
+        print(f"{algorithm:<12} {width}x{height} ({width * height} cells) in {elapsed:.3f}s")
+        if args.show:
+            print(grid)
+
+
+if __name__ == '__main__':
+    main()
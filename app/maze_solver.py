@@ -0,0 +1,190 @@
+"""
+Maze solvers working on maze_gen.MazeGrid.
+
+distance_map() runs one BFS from the goal per maze; after that every agent
+decides its next move in O(1) from flat arrays indexed by pixel
+(y * width + x), so many agents can be animated at once.
+
+Agents:
+    shortest      - follows the distance map downhill (optimal path)
+    wall_follower - keeps its right hand on the wall
+    tremaux       - Tremaux's algorithm with passage marks in a bytearray
+"""
+
+import random
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+
+from maze_gen import WALL
+
+UNREACHABLE = -1
+
+
+def distance_map(grid, goal_x, goal_y):
+    """
+    BFS distance (in steps) from every open cell to the goal.
+
+    Returns:
+        array('i') of grid.width * grid.height entries; walls and cells
+        that cannot reach the goal are UNREACHABLE.
+    """
+    w = grid.width
+    cells = grid.cells
+    dist = array('i', [UNREACHABLE]) * (w * grid.height)
+    goal = goal_y * w + goal_x
+    if cells[goal] == WALL:
+        raise ValueError("goal is inside a wall")
+
+    dist[goal] = 0
+    queue = deque([goal])
+    offsets = (-w, 1, w, -1)
+    while queue:
+        pos = queue.popleft()
+        d = dist[pos] + 1
+        for off in offsets:
+            nxt = pos + off
+            # Mazes are enclosed by a wall border, so no bounds checks needed
+            if dist[nxt] == UNREACHABLE and cells[nxt] != WALL:
+                dist[nxt] = d
+                queue.append(nxt)
+    return dist
+
+
+class Agent(ABC):
+    """Base solver: position, step count and goal detection"""
+
+    name = "agent"
+
+    def __init__(self, grid, dist, x, y, rng=None):
+        self.grid = grid
+        self.dist = dist
+        self.width = grid.width
+        self.pos = y * grid.width + x
+        self.rng = rng or random
+        self.steps = 0
+        # Headings clockwise: north, east, south, west
+        self.offsets = (-self.width, 1, self.width, -1)
+
+    @property
+    def x(self):
+        return self.pos % self.width
+
+    @property
+    def y(self):
+        return self.pos // self.width
+
+    @property
+    def done(self):
+        return self.dist[self.pos] == 0
+
+    def _open(self, heading):
+        return self.grid.cells[self.pos + self.offsets[heading]] != WALL
+
+    def _move(self, heading):
+        self.pos += self.offsets[heading]
+        self.steps += 1
+
+    @abstractmethod
+    def step(self):
+        """Advance one cell (no-op once the goal is reached)"""
+
+
+class ShortestPathAgent(Agent):
+    """Walks downhill on the distance map - always the optimal route"""
+
+    name = "shortest"
+
+    def step(self):
+        if self.done:
+            return
+        here = self.dist[self.pos]
+        for heading in range(4):
+            nxt = self.pos + self.offsets[heading]
+            if self.dist[nxt] == here - 1 and here > 0:
+                self._move(heading)
+                return
+
+
+class WallFollowerAgent(Agent):
+    """Right-hand rule: turn right when possible, else straight, left, back"""
+
+    name = "wall_follower"
+
+    def __init__(self, grid, dist, x, y, rng=None, hand='right'):
+        super().__init__(grid, dist, x, y, rng)
+        self.heading = 1                    # Start facing east
+        self.turn = 1 if hand == 'right' else 3
+
+    def step(self):
+        if self.done:
+            return
+        for change in (self.turn, 0, 4 - self.turn, 2):
+            heading = (self.heading + change) % 4
+            if self._open(heading):
+                self.heading = heading
+                self._move(heading)
+                return
+
+
+class TremauxAgent(Agent):
+    """
+    Tremaux's algorithm: every passage walked gets a mark (max 2).
+    Unmarked passages are preferred, a passage walked twice is never
+    taken again, and reaching an already visited cell along a new passage
+    means turning straight back.
+    """
+
+    name = "tremaux"
+
+    def __init__(self, grid, dist, x, y, rng=None):
+        super().__init__(grid, dist, x, y, rng)
+        # marks[pos * 4 + heading] for the passage leaving pos in that heading
+        self.marks = bytearray(grid.width * grid.height * 4)
+        self.visited = bytearray(grid.width * grid.height)
+        self.visited[self.pos] = 1
+        self.came_from = None               # Heading pointing back where we came from
+        self._arrived_at_visited = False
+
+    def _mark(self, heading):
+        marks = self.marks
+        nxt = self.pos + self.offsets[heading]
+        marks[self.pos * 4 + heading] += 1
+        marks[nxt * 4 + (heading + 2) % 4] += 1
+
+    def step(self):
+        if self.done:
+            return
+        base = self.pos * 4
+        back = self.came_from
+        options = [h for h in range(4) if h != back and self._open(h)
+                   and self.marks[base + h] < 2]
+
+        if back is not None and self.marks[base + back] == 1 and self._arrived_at_visited:
+            # New passage led somewhere already explored - go straight back
+            heading = back
+        elif options:
+            fewest = min(self.marks[base + h] for h in options)
+            best = [h for h in options if self.marks[base + h] == fewest]
+            heading = best[0] if len(best) == 1 else self.rng.choice(best)
+        else:
+            heading = back
+
+        self._mark(heading)
+        self._move(heading)
+        self._arrived_at_visited = self.visited[self.pos] == 1
+        self.visited[self.pos] = 1
+        self.came_from = (heading + 2) % 4
+
+
+AGENTS = {
+    'shortest': ShortestPathAgent,
+    'wall_follower': WallFollowerAgent,
+    'tremaux': TremauxAgent,
+}
+
+
+def make_agent(name, grid, dist, x, y, rng=None):
+    if name not in AGENTS:
+        raise ValueError(f"Unknown maze agent: {name}")
+    return AGENTS[name](grid, dist, x, y, rng)
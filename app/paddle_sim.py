@@ -0,0 +1,203 @@
+"""
+Headless self-play tournament for the Pong and Breakout AIs.
+
+Plays many PongGame / BreakoutGame matches without a Display and without any
+sleeping, spread across a process pool.  Every match gets its own seed, and
+every point of the parameter sweep plays the exact same seeds, so settings
+can be compared directly.
+
+Each game is given the same budget the panel gives it (GAME_TIME_SECONDS of
+fixed FRAME_TIME_MS steps), so the results match what the panel would show.
+
+Usage:
+    python paddle_sim.py --game pong --games 2000
+    python paddle_sim.py --game breakout --paddle-speed 1 2 3 --reaction-time 0.05 0.1 0.5
+    python paddle_sim.py --game pong --games 500 --seed 42 --json results.json
+"""
+
+import argparse
+import itertools
+import random
+import time
+from collections import Counter
+
+import breakout
+import pong
+import sim_common
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+DEFAULT_GAMES = 1000      # Matches per parameter combination
+DEFAULT_SEED = 1          # Base seed (match i uses DEFAULT_SEED + i)
+# ============================================================================
+
+GAMES = {
+    'pong': (pong.PongGame, int(pong.GAME_TIME_SECONDS * 1000 / pong.FRAME_TIME_MS)),
+    'breakout': (breakout.BreakoutGame,
+                 int(breakout.GAME_TIME_SECONDS * 1000 / breakout.FRAME_TIME_MS)),
+}
+
+
+# ---------------------------------------------------------------------------
+# Single match (runs inside a worker process)
+# ---------------------------------------------------------------------------
+def simulate_match(game_name, seed, paddle_speed, reaction_time, max_ticks=None):
+    """
+    Play one match to completion without a display.
+
+    Returns a dict with the final score and the length of every rally
+    (paddle hits between serves for Pong, paddle hits before the ball was
+    lost for Breakout).
+    """
+    random.seed(seed)
+    game_class, default_ticks = GAMES[game_name]
+    if max_ticks is None:
+        max_ticks = default_ticks
+    game = game_class(64, 64, paddle_speed=paddle_speed, reaction_time=reaction_time)
+
+    ticks = 0
+    if game_name == 'pong':
+        while ticks < max_ticks and not game.game_over:
+            game.update()
+            ticks += 1
+        return {
+            'game': game_name,
+            'params': (paddle_speed, reaction_time),
+            'seed': seed,
+            'ticks': ticks,
+            'winner': game.winner or "time limit",
+            'score': (game.left_score, game.right_score),
+            'rallies': game.rally_lengths,
+        }
+
+    while ticks < max_ticks and not game.game_over and not game.winner:
+        game.update()
+        ticks += 1
+    if game.winner:
+        outcome = "cleared"
+    elif game.game_over:
+        outcome = "ball lost"
+    else:
+        outcome = "time limit"
+    return {
+        'game': game_name,
+        'params': (paddle_speed, reaction_time),
+        'seed': seed,
+        'ticks': ticks,
+        'winner': outcome,
+        'score': (game.score,),
+        'rallies': [game.paddle_hits],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Aggregation / reporting
+# ---------------------------------------------------------------------------
+def _distribution(values):
+    values = sorted(values)
+    if not values:
+        return {'count': 0, 'mean': 0, 'median': 0, 'p90': 0, 'min': 0, 'max': 0}
+    return {
+        'count': len(values),
+        'mean': sum(values) / len(values),
+        'median': sim_common.percentile(values, 50),
+        'p90': sim_common.percentile(values, 90),
+        'min': values[0],
+        'max': values[-1],
+    }
+
+
+def summarize(results):
+    """Collapse per-match results into one summary dict per parameter combination."""
+    by_params = {}
+    for result in results:
+        by_params.setdefault(result['params'], []).append(result)
+
+    summary = {}
+    for (paddle_speed, reaction_time), matches in sorted(by_params.items()):
+        rallies = [r for m in matches for r in m['rallies']]
+        entry = {
+            'paddle_speed': paddle_speed,
+            'reaction_time': reaction_time,
+            'games': len(matches),
+            'outcomes': dict(Counter(m['winner'] for m in matches).most_common()),
+            'ticks': _distribution([m['ticks'] for m in matches]),
+            'rally_length': _distribution(rallies),
+            'rally_hist': dict(sorted(Counter(rallies).items())),
+        }
+        if len(matches[0]['score']) == 2:
+            # Pong: points per side and the winning margin
+            entry['left_points'] = _distribution([m['score'][0] for m in matches])
+            entry['right_points'] = _distribution([m['score'][1] for m in matches])
+            entry['score_hist'] = dict(Counter(
+                f"{m['score'][0]}-{m['score'][1]}" for m in matches).most_common())
+        else:
+            entry['score'] = _distribution([m['score'][0] for m in matches])
+            entry['score_hist'] = dict(sorted(Counter(m['score'][0] for m in matches).items()))
+        summary[f"speed={paddle_speed} reaction={reaction_time}"] = entry
+    return summary
+
+
+def print_summary(summary, top_scores=5):
+    def fmt(d):
+        return (f"mean {d['mean']:.1f}  median {d['median']}  p90 {d['p90']}"
+                f"  min {d['min']}  max {d['max']}")
+
+    for label, s in summary.items():
+        print("=" * 60)
+        print(f"{label}  ({s['games']} games)")
+        print("  Outcomes: " + ", ".join(f"{k} {v}" for k, v in s['outcomes'].items()))
+        print(f"  Ticks:        {fmt(s['ticks'])}")
+        print(f"  Rally length: {fmt(s['rally_length'])}  ({s['rally_length']['count']} rallies)")
+        if 'left_points' in s:
+            print(f"  Left points:  {fmt(s['left_points'])}")
+            print(f"  Right points: {fmt(s['right_points'])}")
+            common = list(s['score_hist'].items())[:top_scores]
+            print("  Most common scores: " + ", ".join(f"{k} ({v})" for k, v in common))
+        else:
+            print(f"  Score:        {fmt(s['score'])}")
+
+
+def run_tournament(game_name, games, paddle_speeds, reaction_times,
+                   seed=DEFAULT_SEED, max_ticks=None, workers=None):
+    """Run `games` seeded matches for every parameter combination and return the raw results."""
+    tasks = [(game_name, seed + i, paddle_speed, reaction_time, max_ticks)
+             for i in range(games)
+             for paddle_speed, reaction_time in itertools.product(paddle_speeds, reaction_times)]
+    return sim_common.run_tasks(simulate_match, tasks, workers, chunksize=8)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Pong/Breakout AI tournament")
+    parser.add_argument('--game', choices=sorted(GAMES), default='pong')
+    sim_common.add_arguments(parser, DEFAULT_GAMES, DEFAULT_SEED,
+                             "matches per parameter combination")
+    parser.add_argument('--paddle-speed', type=float, nargs='+', default=None,
+                        help="PADDLE_SPEED values to sweep (default: the game's own)")
+    parser.add_argument('--reaction-time', type=float, nargs='+', default=None,
+                        help="AI_REACTION_TIME values to sweep (default: the game's own)")
+    parser.add_argument('--max-ticks', type=int, default=None,
+                        help="tick limit per match (default: GAME_TIME_SECONDS worth)")
+    args = parser.parse_args(argv)
+
+    module = pong if args.game == 'pong' else breakout
+    paddle_speeds = args.paddle_speed or [module.PADDLE_SPEED]
+    reaction_times = args.reaction_time or [module.AI_REACTION_TIME]
+
+    start_time = time.time()
+    results = run_tournament(args.game, args.games, paddle_speeds, reaction_times,
+                             args.seed, args.max_ticks, args.workers)
+    elapsed = time.time() - start_time
+
+    summary = summarize(results)
+    print_summary(summary)
+    print("=" * 60)
+    print(f"{len(results)} {args.game} matches in {elapsed:.1f}s")
+
+    if args.json:
+        sim_common.write_json(summary, args.json)
+
+
+if __name__ == '__main__':
+    main()
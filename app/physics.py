@@ -0,0 +1,145 @@
+"""
+Fixed-timestep physics core shared by Pong and Breakout.
+
+The ball is a point swept along its whole motion each step and tested
+against axis-aligned boxes (paddles, bricks, walls) with the slab method, so
+it cannot tunnel through thin objects however fast it moves.  Game logic runs
+in fixed steps from FixedTimestep; rendering can run at any rate and
+interpolate between the last two steps.
+"""
+
+EPSILON = 1e-6      # Distance a ball is pushed off a surface after contact
+FAR = 1e9           # Extent used for wall boxes that are open on one side
+
+
+def sweep_aabb(x, y, dx, dy, left, top, right, bottom):
+    """
+    First contact of the segment (x, y) -> (x + dx, y + dy) with a box.
+
+    Returns:
+        (t, nx, ny): fraction of the segment travelled (0-1) and the normal
+        of the face that was hit, or None if the segment misses.  A point
+        that starts inside the box never collides with it, so a ball can
+        always leave a box it overlaps.
+    """
+    t_enter = float('-inf')
+    t_exit = float('inf')
+    nx = ny = 0
+
+    if dx == 0:
+        if not left <= x <= right:
+            return None
+    else:
+        t1 = (left - x) / dx
+        t2 = (right - x) / dx
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+            nx, ny = (-1 if dx > 0 else 1), 0
+        t_exit = min(t_exit, t2)
+
+    if dy == 0:
+        if not top <= y <= bottom:
+            return None
+    else:
+        t1 = (top - y) / dy
+        t2 = (bottom - y) / dy
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+            nx, ny = 0, (-1 if dy > 0 else 1)
+        t_exit = min(t_exit, t2)
+
+    if t_enter > t_exit or t_enter < 0 or t_enter > 1:
+        return None
+    return (t_enter, nx, ny)
+
+
+def first_hit(x, y, dx, dy, boxes):
+    """
+    Earliest contact among boxes given as (left, top, right, bottom, key).
+
+    Returns:
+        (t, nx, ny, key) or None
+    """
+    best = None
+    for left, top, right, bottom, key in boxes:
+        hit = sweep_aabb(x, y, dx, dy, left, top, right, bottom)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = (hit[0], hit[1], hit[2], key)
+    return best
+
+
+def move_ball(x, y, vx, vy, get_boxes, on_hit, max_bounces=4):
+    """
+    Move a ball by one (sub)step of velocity, resolving every contact on the way.
+
+    Args:
+        x, y, vx, vy: Ball state; the ball moves by (vx, vy) this call
+        get_boxes: get_boxes(x, y, dx, dy) -> boxes the segment may touch,
+                   as (left, top, right, bottom, key) tuples
+        on_hit: on_hit(key, nx, ny, x, y, vx, vy) -> (vx, vy) after contact
+        max_bounces: Contacts resolved before the rest of the step is dropped
+
+    Returns:
+        (x, y, vx, vy) at the end of the step
+    """
+    remaining = 1.0
+    for _ in range(max_bounces):
+        dx = vx * remaining
+        dy = vy * remaining
+        hit = first_hit(x, y, dx, dy, get_boxes(x, y, dx, dy))
+        if hit is None:
+            return x + dx, y + dy, vx, vy
+
+        t, nx, ny, key = hit
+        x += dx * t + nx * EPSILON
+        y += dy * t + ny * EPSILON
+        remaining *= (1.0 - t)
+        vx, vy = on_hit(key, nx, ny, x, y, vx, vy)
+    return x, y, vx, vy
+
+
+def reflect(nx, ny, vx, vy):
+    """Mirror a velocity off a surface with normal (nx, ny)"""
+    if nx:
+        vx = abs(vx) * nx
+    if ny:
+        vy = abs(vy) * ny
+    return vx, vy
+
+
+class FixedTimestep:
+    """
+    Turns variable real time into a whole number of fixed logic steps.
+
+    Call advance() with the real time elapsed since the last frame, run that
+    many logic steps, then render using alpha (0-1) to interpolate between
+    the previous and current step.
+    """
+
+    def __init__(self, step_seconds, max_steps=5):
+        self.step_seconds = step_seconds
+        self.max_steps = max_steps      # Cap per frame so a stall can't snowball
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_steps:
+            # Too far behind - drop the backlog instead of trying to catch up
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_seconds
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step_seconds)
+
+
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
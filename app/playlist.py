@@ -0,0 +1,242 @@
+"""
+Playlist engine for main.py.
+
+The effects to cycle through are listed in a JSON file (playlist.json):
+    {
+        "shuffle": false,
+        "effects": [
+            {"effect": "RunFire", "duration": 120},
+            {"effect": "RunSnakeGame", "params": {"obstacle_coverage": 10}},
+            {"effect": "RunMatrix", "weight": 0}
+        ]
+    }
+
+    effect:   name of a Run* function in the effect registry (main.EFFECTS)
+    duration: seconds, passed to the effect as runtime_seconds
+              (omitted = the effect's own default)
+    params:   keyword arguments for building the effect's state
+    weight:   0 disables the entry; with "shuffle" it is the relative chance
+              of the entry being picked next
+
+Each registry entry is (run, prepare): prepare(width, height, **params)
+builds the effect's state - maze generation, obstacle placement, colour
+LUTs, solving a game tree - and run(disp, state=..., runtime_seconds=...)
+plays it.  While one effect runs, a worker thread prepares the next one, so
+switching effects is immediate instead of leaving the panel dark.
+
+EffectRegistry holds the registry as module names and imports each effect
+module the first time it is needed (on that worker thread), so startup only
+pays for the modules the first effect uses.
+"""
+
+import importlib
+import json
+import random
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+
+class EffectRegistry(Mapping):
+    """
+    {name: (run, prepare)} that imports effect modules on first use.
+
+    Built from {name: (module, prepare attribute or None)}; the run function
+    is the module attribute called name.  on_import(module) is called once
+    for every module loaded (e.g. to add telemetry hooks).
+    """
+
+    def __init__(self, table, on_import=None):
+        self.table = dict(table)
+        self.on_import = on_import
+        self._resolved = {}
+        self._modules = set()       # Modules on_import has seen
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        module_name, prepare_name = self.table[name]
+        with self._lock:
+            if name not in self._resolved:
+                module = importlib.import_module(module_name)
+                if module_name not in self._modules:
+                    self._modules.add(module_name)
+                    if self.on_import:
+                        self.on_import(module)
+                prepare = getattr(module, prepare_name) if prepare_name else None
+                self._resolved[name] = (getattr(module, name), prepare)
+            return self._resolved[name]
+
+    def __contains__(self, name):
+        return name in self.table   # Without importing anything
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+
+class PlaylistEntry:
+    """One effect in the playlist"""
+
+    def __init__(self, effect, duration=None, params=None, weight=1):
+        self.effect = effect
+        self.duration = duration
+        self.params = params or {}
+        self.weight = weight
+
+    def __repr__(self):
+        return f"PlaylistEntry({self.effect!r}, duration={self.duration}, weight={self.weight})"
+
+
+class Playlist:
+    """Validated list of entries and the order to play them in"""
+
+    def __init__(self, entries, effects, shuffle=False, rng=None):
+        """
+        Args:
+            entries: PlaylistEntry list
+            effects: Registry {name: (run, prepare or None)}
+            shuffle: Pick entries at random by weight instead of in order
+            rng: random.Random to shuffle with
+
+        Raises:
+            ValueError: for unknown effects (arguments are checked by resolve())
+        """
+        for entry in entries:
+            if entry.effect not in effects:
+                raise ValueError(f"Unknown effect: {entry.effect}")
+            if entry.weight < 0:
+                raise ValueError(f"{entry.effect}: weight must be >= 0")
+        self.entries = [entry for entry in entries if entry.weight > 0]
+        if not self.entries:
+            raise ValueError("Playlist has no enabled effects")
+        self.effects = effects
+        self.shuffle = shuffle
+        self.rng = rng or random.Random()
+        self._index = -1
+
+    def resolve(self, entry):
+        """
+        (run, prepare) for entry, importing its module if needed.
+
+        Raises:
+            ValueError: if the effect does not take the entry's duration or params
+        """
+        import inspect          # Slow to import - not needed before the first effect
+        run, prepare = self.effects[entry.effect]
+        try:
+            if entry.duration is not None:
+                inspect.signature(run).bind_partial(runtime_seconds=entry.duration)
+            if entry.params:
+                if prepare is None:
+                    raise TypeError("takes no params")
+                inspect.signature(prepare).bind_partial(0, 0, **entry.params)
+        except TypeError as e:
+            raise ValueError(f"{entry.effect}: {e}") from None
+        return run, prepare
+
+    def remove(self, entry):
+        """
+        Stop playing entry (e.g. its effect cannot be prepared).
+
+        Raises:
+            ValueError: if no entries are left
+        """
+        i = self.entries.index(entry)
+        del self.entries[i]
+        if i <= self._index:
+            self._index -= 1
+        if not self.entries:
+            raise ValueError("Playlist has no effects left that can be prepared")
+
+    def next_entry(self):
+        """The entry to play after the previous one"""
+        if not self.shuffle:
+            self._index = (self._index + 1) % len(self.entries)
+            return self.entries[self._index]
+
+        # Weighted pick, never the same entry twice in a row (if there is a choice)
+        candidates = [i for i in range(len(self.entries)) if i != self._index] or [self._index]
+        weights = [self.entries[i].weight for i in candidates]
+        self._index = self.rng.choices(candidates, weights)[0]
+        return self.entries[self._index]
+
+
+def load(path, effects, rng=None):
+    """Read a playlist file (see the module docstring for the format)"""
+    with open(path) as f:
+        config = json.load(f)
+    entries = [PlaylistEntry(item['effect'], item.get('duration'), item.get('params'),
+                             item.get('weight', 1))
+               for item in config['effects']]
+    return Playlist(entries, effects, shuffle=config.get('shuffle', False), rng=rng)
+
+
+class PlaylistPlayer:
+    """Plays a Playlist, preparing each effect while the previous one runs"""
+
+    def __init__(self, playlist, disp, run_effect=None):
+        """
+        Args:
+            playlist: Playlist to play
+            disp: Display (its size is passed to the prepare functions)
+            run_effect: run_effect(run, **kwargs) - plays one effect;
+                        default is run(disp, **kwargs)
+        """
+        self.playlist = playlist
+        self.disp = disp
+        self.run_effect = run_effect or (lambda run, **kwargs: run(self.disp, **kwargs))
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prewarm")
+
+    def _build(self, entry):
+        run, prepare = self.playlist.resolve(entry)
+        kwargs = {}
+        if prepare is not None:
+            kwargs['state'] = prepare(self.disp.width, self.disp.height, **entry.params)
+        if entry.duration is not None:
+            kwargs['runtime_seconds'] = entry.duration
+        return run, kwargs
+
+    def prepare(self, entry):
+        """
+        Start importing and building entry's effect on the worker.
+
+        Returns:
+            Future of (run, kwargs for run)
+        """
+        return self._worker.submit(self._build, entry)
+
+    def play(self, count=None):
+        """
+        Play count effects (None = forever).  An entry that fails to
+        prepare is dropped from the playlist.
+
+        Raises:
+            ValueError: once every entry has been dropped
+        """
+        entry = self.playlist.next_entry()
+        pending = self.prepare(entry)
+        played = 0
+        while count is None or played < count:
+            try:
+                (run, kwargs), error = pending.result(), None
+            except Exception as e:
+                error = e
+            if error is not None:
+                print(f"Playlist: could not prepare {entry.effect}: {error!r} - dropped")
+                self.playlist.remove(entry)
+
+            # Start on the next effect before this one runs
+            next_entry = self.playlist.next_entry()
+            next_pending = self.prepare(next_entry)
+
+            if error is None:
+                self.run_effect(run, **kwargs)
+            played += 1
+            entry, pending = next_entry, next_pending
+
+        pending.cancel()
+
+    def close(self):
+        self._worker.shutdown(wait=True)
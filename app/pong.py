@@ -2,6 +2,10 @@ import random
 import time
 import math
 
+from physics import FAR, FixedTimestep, lerp, move_ball, reflect
+from scheduler import FrameScheduler
+from trajectory import predict_intercept
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -14,14 +18,21 @@ GAME_TIME_SECONDS = 120   # How long the game runs (in seconds)
 FRAME_TIME_MS = 50        # Time between frames (in milliseconds)
 WINNING_SCORE = 10        # First to N points wins (set to 0 to ignore score wins)
 BALL_SIZE = 2             # Ball size in pixels (1 = single pixel)
-AI_REACTION_TIME = 0.5    # AI reaction delay (seconds) before adjusting paddle
+AI_REACTION_TIME = 0.1    # How often (seconds of game time) the AI re-aims its paddle
+SUBSTEPS = 4              # Physics substeps per frame (collisions are swept either way)
+RENDER_TIME_MS = 20       # Time between drawn frames; the ball is interpolated between steps
 # ============================================================================
 
 class PongGame:
-    def __init__(self, width=64, height=64):
+    def __init__(self, width=64, height=64, paddle_speed=PADDLE_SPEED,
+                 reaction_time=AI_REACTION_TIME):
         self.width = width
         self.height = height
         
+        # AI tuning (defaults come from the parameters above)
+        self.paddle_speed = paddle_speed
+        self.reaction_time = reaction_time
+        
         # Paddle positions (x, y) - y is the top of the paddle
         self.left_paddle_y = (height - PADDLE_HEIGHT) // 2
         self.right_paddle_y = (height - PADDLE_HEIGHT) // 2
@@ -35,11 +46,16 @@ class PongGame:
         self.ball_y = height / 2.0
         self.ball_vx = random.choice([-BALL_SPEED, BALL_SPEED])
         self.ball_vy = (random.random() - 0.5) * BALL_SPEED
+        self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
         
         # Score
         self.left_score = 0
         self.right_score = 0
         
+        # Paddle hits in the current rally, and the length of every finished rally
+        self.rally = 0
+        self.rally_lengths = []
+        
         # Game state
         self.game_over = False
         self.winner = None  # "left", "right", or None
@@ -48,7 +64,9 @@ class PongGame:
         # AI state - stable targets to prevent jiggling
         self.left_target_y = self.left_paddle_y
         self.right_target_y = self.right_paddle_y
-        self.last_target_update_time = time.time()
+        # Game time advances by fixed steps so the AI does not depend on frame rate
+        self.sim_time = 0.0
+        self.last_target_update_time = self.sim_time
     
     def _clamp(self, value, min_val, max_val):
         """Clamp value to range"""
@@ -59,29 +77,10 @@ class PongGame:
         Predict where the ball will be when it reaches the paddle's x position.
         Returns the predicted y coordinate, or None if ball is moving away.
         """
-        paddle_x = self.left_paddle_x if is_left else self.right_paddle_x
-        
-        # Check if ball is moving toward this paddle
-        if is_left and self.ball_vx >= 0:
-            return None  # Ball moving right, away from left paddle
-        if not is_left and self.ball_vx <= 0:
-            return None  # Ball moving left, away from right paddle
-        
-        # Calculate frames until ball reaches paddle
-        dx = abs(paddle_x - self.ball_x)
-        frames_to_paddle = dx / abs(self.ball_vx) if self.ball_vx != 0 else 0
-        
-        # Predict ball y position at that time
-        predicted_y = self.ball_y + self.ball_vy * frames_to_paddle
-        
-        # Handle wall bounces (simple bouncing logic)
-        while predicted_y < 0 or predicted_y >= self.height:
-            if predicted_y < 0:
-                predicted_y = -predicted_y
-            elif predicted_y >= self.height:
-                predicted_y = 2 * self.height - predicted_y
-        
-        return predicted_y
+        # The ball is deflected at the paddle face, not its far edge
+        paddle_x = self.left_paddle_x + PADDLE_WIDTH if is_left else self.right_paddle_x
+        return predict_intercept(self.ball_x, self.ball_vx, self.ball_y, self.ball_vy,
+                                 paddle_x, 0, self.height)
     
     def _move_paddle(self, is_left):
         """Move paddle toward predicted ball position (only if ball approaching)"""
@@ -92,9 +91,9 @@ class PongGame:
         if predicted_y is None:
             return
         
-        # Update target position occasionally (0.1s) to prevent jiggling
-        current_time = time.time()
-        if current_time - self.last_target_update_time > 0.1:
+        # Update target position every reaction_time seconds to prevent jiggling
+        current_time = self.sim_time
+        if current_time - self.last_target_update_time > self.reaction_time:
             self.last_target_update_time = current_time
             
             # Aim for top-third of paddle for a looser target area
@@ -118,10 +117,10 @@ class PongGame:
         
         # Move smoothly toward target
         if current_y < target_y:
-            new_y = current_y + PADDLE_SPEED
+            new_y = current_y + self.paddle_speed
             new_y = min(new_y, target_y)
         elif current_y > target_y:
-            new_y = current_y - PADDLE_SPEED
+            new_y = current_y - self.paddle_speed
             new_y = max(new_y, target_y)
         else:
             new_y = current_y
@@ -134,84 +133,62 @@ class PongGame:
         else:
             self.right_paddle_y = new_y
     
-    def _check_paddle_collision(self):
-        """Check if ball collides with paddles, accounting for ball trajectory"""
-        ball_x = self.ball_x
-        ball_y = self.ball_y
-        prev_ball_x = ball_x - self.ball_vx
-        
-        # Left paddle collision - check if ball crossed into paddle area
-        if self.ball_vx < 0:  # Ball moving left
-            paddle_right = self.left_paddle_x + PADDLE_WIDTH
-            # Check if ball crossed from right of paddle to left of it
-            if prev_ball_x >= paddle_right and ball_x <= paddle_right:
-                # Check if ball is within paddle height
-                if self.left_paddle_y <= ball_y < self.left_paddle_y + PADDLE_HEIGHT:
-                    # Reflect ball
-                    self.ball_vx = abs(self.ball_vx)
-                    
-                    # Add spin based on where ball hit paddle
-                    hit_pos = (ball_y - self.left_paddle_y) / PADDLE_HEIGHT
-                    hit_pos = self._clamp(hit_pos, 0, 1)
-                    
-                    # Ball hits top of paddle = upward angle, bottom = downward
-                    angle_factor = (hit_pos - 0.5) * 1.2
-                    self.ball_vy = self.ball_vy + angle_factor * abs(self.ball_vx)
-                    
-                    # Cap vertical velocity to limit max angle (~37 degrees)
-                    max_vy = abs(self.ball_vx) * 0.75
-                    self.ball_vy = self._clamp(self.ball_vy, -max_vy, max_vy)
-                    
-                    # Speed up ball (up to max)
-                    speed = math.sqrt(self.ball_vx ** 2 + self.ball_vy ** 2)
-                    if speed < MAX_BALL_SPEED:
-                        scale = (speed + 0.5) / speed
-                        self.ball_vx *= scale
-                        self.ball_vy *= scale
-                    
-                    # Push ball away from paddle
-                    self.ball_x = paddle_right + 0.5
-        
-        # Right paddle collision - check if ball crossed into paddle area
-        if self.ball_vx > 0:  # Ball moving right
-            paddle_left = self.right_paddle_x
-            # Check if ball crossed from left of paddle to right of it
-            if prev_ball_x < paddle_left and ball_x >= paddle_left:
-                # Check if ball is within paddle height
-                if self.right_paddle_y <= ball_y < self.right_paddle_y + PADDLE_HEIGHT:
-                    # Reflect ball
-                    self.ball_vx = -abs(self.ball_vx)
-                    
-                    # Add spin based on where ball hit paddle
-                    hit_pos = (ball_y - self.right_paddle_y) / PADDLE_HEIGHT
-                    hit_pos = self._clamp(hit_pos, 0, 1)
-                    
-                    # Ball hits top of paddle = upward angle, bottom = downward
-                    angle_factor = (hit_pos - 0.5) * 1.2
-                    self.ball_vy = self.ball_vy + angle_factor * abs(self.ball_vx)
-                    
-                    # Cap vertical velocity to limit max angle (~37 degrees)
-                    max_vy = abs(self.ball_vx) * 0.75
-                    self.ball_vy = self._clamp(self.ball_vy, -max_vy, max_vy)
-                    
-                    # Speed up ball
-                    speed = math.sqrt(self.ball_vx ** 2 + self.ball_vy ** 2)
-                    if speed < MAX_BALL_SPEED:
-                        scale = (speed + 0.5) / speed
-                        self.ball_vx *= scale
-                        self.ball_vy *= scale
-                    
-                    # Push ball away from paddle
-                    self.ball_x = paddle_left - 0.5
+    def _ball_boxes(self, x, y, dx, dy):
+        """Everything the ball can bounce off: both walls and both paddles"""
+        return [
+            (-FAR, -FAR, FAR, 0, 'wall'),                       # Top wall
+            (-FAR, self.height, FAR, FAR, 'wall'),              # Bottom wall
+            (self.left_paddle_x, self.left_paddle_y,
+             self.left_paddle_x + PADDLE_WIDTH, self.left_paddle_y + PADDLE_HEIGHT, 'left'),
+            (self.right_paddle_x, self.right_paddle_y,
+             self.right_paddle_x + PADDLE_WIDTH, self.right_paddle_y + PADDLE_HEIGHT, 'right'),
+        ]
+    
+    def _on_ball_hit(self, key, nx, ny, x, y, vx, vy):
+        """Collision response for move_ball(): returns the new ball velocity"""
+        vx, vy = reflect(nx, ny, vx, vy)
+        if key == 'wall' or nx == 0:
+            # Walls and the top/bottom ends of a paddle just reflect
+            return vx, vy
+        
+        paddle_y = self.left_paddle_y if key == 'left' else self.right_paddle_y
+        
+        # Add spin based on where ball hit paddle
+        hit_pos = (y - paddle_y) / PADDLE_HEIGHT
+        hit_pos = self._clamp(hit_pos, 0, 1)
+        
+        # Ball hits top of paddle = upward angle, bottom = downward
+        angle_factor = (hit_pos - 0.5) * 1.2
+        vy = vy + angle_factor * abs(vx)
+        
+        # Cap vertical velocity to limit max angle (~37 degrees)
+        max_vy = abs(vx) * 0.75
+        vy = self._clamp(vy, -max_vy, max_vy)
+        
+        self.rally += 1
+        
+        # Speed up ball, never past the max
+        speed = math.hypot(vx, vy)
+        scale = min(speed + 0.5, MAX_BALL_SPEED) / speed
+        vx *= scale
+        vy *= scale
+        return vx, vy
     
-    def _check_wall_collision(self):
-        """Check if ball collides with top/bottom walls"""
-        if self.ball_y < 0:
-            self.ball_y = -self.ball_y
-            self.ball_vy = abs(self.ball_vy)
-        elif self.ball_y >= self.height:
-            self.ball_y = 2 * self.height - self.ball_y
-            self.ball_vy = -abs(self.ball_vy)
+    def _on_substep_hit(self, key, nx, ny, x, y, vx, vy):
+        """move_ball() sees substep velocities; the hit response works per frame"""
+        vx, vy = self._on_ball_hit(key, nx, ny, x, y, vx * SUBSTEPS, vy * SUBSTEPS)
+        return vx / SUBSTEPS, vy / SUBSTEPS
+    
+    def _move_ball(self):
+        """Sweep the ball through this frame in SUBSTEPS, bouncing off anything it meets"""
+        x, y = self.ball_x, self.ball_y
+        vx, vy = self.ball_vx, self.ball_vy
+        for _ in range(SUBSTEPS):
+            x, y, svx, svy = move_ball(x, y, vx / SUBSTEPS, vy / SUBSTEPS,
+                                       self._ball_boxes, self._on_substep_hit)
+            vx, vy = svx * SUBSTEPS, svy * SUBSTEPS
+        self.ball_x, self.ball_y = x, y
+        self.ball_vx, self.ball_vy = vx, vy
     
     def _check_scoring(self):
         """Check if ball went out of bounds (scoring)"""
@@ -229,6 +206,8 @@ class PongGame:
     
     def _reset_ball(self):
         """Reset ball to center with random direction"""
+        self.rally_lengths.append(self.rally)
+        self.rally = 0
         self.ball_x = self.width / 2.0
         self.ball_y = self.height / 2.0
         
@@ -241,22 +220,20 @@ class PongGame:
         self.ball_vy = BALL_SPEED * math.sin(angle)
     
     def update(self):
-        """Update game state"""
+        """Advance the game by one fixed step (FRAME_TIME_MS of game time)"""
         if self.game_over:
             return
+        self.sim_time += FRAME_TIME_MS / 1000.0
         
         # Move paddles (only the one the ball is approaching)
         self._move_paddle(is_left=True)
         self._move_paddle(is_left=False)
         
-        # Update ball position
-        self.ball_x += self.ball_vx
-        self.ball_y += self.ball_vy
-        
-        # Check collisions
-        self._check_wall_collision()
-        self._check_paddle_collision()
-        self._check_scoring()
+        # Move the ball, resolving wall and paddle bounces along the way
+        self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
+        self._move_ball()
+        if self._check_scoring():
+            self.prev_ball_x, self.prev_ball_y = self.ball_x, self.ball_y
         
         # Check win conditions
         if WINNING_SCORE > 0:
@@ -269,8 +246,14 @@ class PongGame:
                 self.winner = "right"
                 self.reason = f"Right wins {self.right_score}-{self.left_score}"
     
-    def get_pixels(self):
-        """Return list of pixels to draw: [(x, y, r, g, b), ...]"""
+    def get_pixels(self, alpha=1.0):
+        """
+        Return list of pixels to draw: [(x, y, r, g, b), ...]
+        
+        Args:
+            alpha: How far real time is between the previous and current
+                   step (0-1); the ball is drawn interpolated between them
+        """
         pixels = []
         
         # Draw left paddle - cyan (dimmed)
@@ -290,8 +273,8 @@ class PongGame:
                     pixels.append((x, y, 127, 0, 127))
         
         # Draw ball - gray (dimmed white)
-        ball_x = int(self.ball_x)
-        ball_y = int(self.ball_y)
+        ball_x = int(lerp(self.prev_ball_x, self.ball_x, alpha))
+        ball_y = int(lerp(self.prev_ball_y, self.ball_y, alpha))
         if 0 <= ball_x < self.width and 0 <= ball_y < self.height:
             pixels.append((ball_x, ball_y, 255, 255, 255))
         
@@ -303,33 +286,35 @@ class PongGame:
         return pixels
 
 
-def RunPongGame(disp):
-    """Main game loop for Pong game"""
+def RunPongGame(disp, state=None, runtime_seconds=GAME_TIME_SECONDS):
+    """Main game loop for Pong game (state: a PongGame built ahead of time)"""
     print("Running Pong Game")
     
     start_time = time.time()
-    game = PongGame(disp.width, disp.height)
+    game = state if state is not None else PongGame(disp.width, disp.height)
     
-    next_turn_time = time.time() + (FRAME_TIME_MS / 1000.0)
+    # Game logic runs in fixed FRAME_TIME_MS steps; drawing runs at RENDER_TIME_MS
+    clock = FixedTimestep(FRAME_TIME_MS / 1000.0)
+    scheduler = FrameScheduler(RENDER_TIME_MS / 1000.0, max_catch_up=0)
+    last_time = time.time()
     
     while True:
-        # Update game state
-        game.update()
+        # Run however many logic steps real time calls for
+        now = time.time()
+        for _ in range(clock.advance(now - last_time)):
+            game.update()
+        last_time = now
         
         # Clear and draw
         disp.clear()
-        pixel_list = game.get_pixels()
+        pixel_list = game.get_pixels(clock.alpha)
         for x, y, r, g, b in pixel_list:
             disp.set_pixel(x, y, r, g, b)
         
         disp.show()
         
-        # Frame timing
-        current_time = time.time()
-        sleep_time = next_turn_time - current_time
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-        next_turn_time = time.time() + (FRAME_TIME_MS / 1000.0)
+        # Frame timing (game steps catch up through the FixedTimestep instead)
+        scheduler.wait()
         
         # Check end conditions
         if game.game_over:
@@ -341,8 +326,8 @@ def RunPongGame(disp):
         
         # Check time limit
         elapsed = time.time() - start_time
-        if elapsed >= GAME_TIME_SECONDS:
-            print(f"Time limit ({GAME_TIME_SECONDS}s) reached")
+        if elapsed >= runtime_seconds:
+            print(f"Time limit ({runtime_seconds}s) reached")
             print(f"Final score: Left {game.left_score} - Right {game.right_score}")
             time.sleep(3.0)
             return
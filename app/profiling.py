@@ -0,0 +1,180 @@
+"""
+On-demand profiling of one effect.
+
+Selected from main.py's command line or the environment:
+    python main.py --profile RunSnakeGame --profile-seconds 30
+    LED_PROFILE=RunFire LED_PROFILE_MODE=sample python main.py
+
+The first time the chosen effect runs it is profiled for N seconds, then it
+carries on normally.  Output goes to PROFILE_DIR:
+    <effect>-<time>.pstats     cProfile stats (python -m pstats, snakeviz, ...)
+    <effect>-<time>.txt        the top functions by cumulative time
+    <effect>-<time>.folded     collapsed stacks from the sampling profiler
+                               (flamegraph.pl / speedscope / inferno)
+
+Modes: cprofile (exact call counts, slows the effect down), sample (a
+background thread reads the main thread's stack every few milliseconds,
+nearly free) or both.
+
+cProfile can only be switched off from the thread it profiles, so the
+profiler stops from a Display frame hook, i.e. at the end of a show() once
+the time is up (or when the effect returns, whichever is first).
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS (environment variables override these)
+# ============================================================================
+PROFILE_SECONDS = 30          # LED_PROFILE_SECONDS: how long to profile
+PROFILE_MODE = 'both'         # LED_PROFILE_MODE: cprofile, sample or both
+PROFILE_DIR = "profiles"      # LED_PROFILE_DIR: where the files go
+SAMPLE_INTERVAL = 0.005       # Seconds between stack samples
+# ============================================================================
+
+MODES = ('cprofile', 'sample', 'both')
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack into collapsed-stack counts"""
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def frame_label(frame):
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        stack = []
+        while frame is not None:
+            stack.append(self.frame_label(frame))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write_folded(self, path):
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class EffectProfiler:
+    """Profiles the first run of one effect for a fixed time"""
+
+    def __init__(self, effect_name, seconds=PROFILE_SECONDS, mode=PROFILE_MODE,
+                 out_dir=PROFILE_DIR, interval=SAMPLE_INTERVAL, clock=time.monotonic):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.effect_name = effect_name
+        self.seconds = seconds
+        self.mode = mode
+        self.out_dir = out_dir
+        self.interval = interval
+        self.clock = clock
+        self.done = False
+        self.outputs = []
+        self._profile = None
+        self._sampler = None
+        self._stop_at = None
+
+    def wants(self, effect):
+        return not self.done and effect.__name__ == self.effect_name
+
+    def start(self):
+        self._stop_at = self.clock() + self.seconds
+        if self.mode in ('sample', 'both'):
+            self._sampler = StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+        if self.mode in ('cprofile', 'both'):
+            import cProfile     # Only loaded when profiling (slow to import)
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        print(f"Profiling {self.effect_name} ({self.mode}) for {self.seconds}s")
+
+    def frame_hook(self):
+        if self._stop_at is not None and self.clock() >= self._stop_at:
+            self.stop()
+
+    def stop(self):
+        """Stop profiling and write the output files (call from the profiled thread)"""
+        if self._stop_at is None:
+            return
+        self._stop_at = None
+        self.done = True
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"{self.effect_name}-{time.strftime('%Y%m%d-%H%M%S')}")
+        if self._profile is not None:
+            import pstats
+            self._profile.dump_stats(base + ".pstats")
+            report = io.StringIO()
+            pstats.Stats(self._profile, stream=report).sort_stats('cumulative').print_stats(40)
+            with open(base + ".txt", 'w') as f:
+                f.write(report.getvalue())
+            self.outputs += [base + ".pstats", base + ".txt"]
+        if self._sampler is not None:
+            self._sampler.write_folded(base + ".folded")
+            self.outputs.append(base + ".folded")
+        self._profile = None
+        self._sampler = None
+        print("Profile written: " + ", ".join(self.outputs))
+
+    def run(self, effect, disp, **kwargs):
+        """Run effect(disp, **kwargs), profiling it until the time is up or it returns"""
+        disp.frame_hooks.append(self.frame_hook)
+        self.start()
+        try:
+            return effect(disp, **kwargs)
+        finally:
+            disp.frame_hooks.remove(self.frame_hook)
+            self.stop()
+
+
+def add_arguments(parser):
+    """Profiling options for main.py; defaults come from the environment"""
+    env = os.environ
+    parser.add_argument('--profile', metavar='EFFECT', default=env.get('LED_PROFILE'),
+                        help="profile this effect, e.g. RunSnakeGame (env LED_PROFILE)")
+    parser.add_argument('--profile-seconds', type=float,
+                        default=float(env.get('LED_PROFILE_SECONDS', PROFILE_SECONDS)),
+                        help="seconds to profile (default %(default)s)")
+    parser.add_argument('--profile-mode', choices=MODES,
+                        default=env.get('LED_PROFILE_MODE', PROFILE_MODE),
+                        help="cprofile, sample or both (default %(default)s)")
+    parser.add_argument('--profile-dir', default=env.get('LED_PROFILE_DIR', PROFILE_DIR),
+                        help="output directory (default %(default)s)")
+
+
+def from_args(args):
+    """EffectProfiler for the parsed options, or None when not profiling"""
+    if not args.profile:
+        return None
+    return EffectProfiler(args.profile, args.profile_seconds, args.profile_mode,
+                          args.profile_dir)
@@ -0,0 +1,328 @@
+"""
+Frame recordings: render an effect once, play it back for almost no CPU.
+
+Display.start_recording() writes every shown frame to a file; RunRecording
+plays the file back on the panel.  Expensive effects (ReactionDiffusion, a
+large Game of Life) can be recorded on a faster machine with a headless
+Display and replayed on the Pi at full rate:
+
+    python recording.py record ReactionDiffusion.RunReactionDiffusion rd.rec --seconds 120
+    python recording.py info rd.rec
+
+and in playlist.json:
+    {"effect": "RunRecording", "params": {"path": "rd.rec"}}
+
+File layout (little endian):
+    header   magic, width, height, frame count, index offset
+    frames   one after the other, each either
+               raw    height x width x 3 bytes
+               delta  runs of pixels that changed since the previous frame:
+                      run count (uint32), run starts and lengths (uint32
+                      pixel positions), then the runs' RGB bytes
+    index    per frame: time (seconds from the first frame), offset,
+             length, kind
+
+Every KEYFRAME_INTERVAL-th frame (and any frame a delta would not make
+smaller) is raw, so seeking never decodes more than one interval.  The
+player maps the file with mmap: a raw frame is a read-only NumPy view of
+the mapping (no copy, no decode), and Display.blit() copies it straight
+into the framebuffer.
+"""
+
+import argparse
+import importlib
+import mmap
+import struct
+import time
+
+import numpy as np
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+RECORDING_PATH = "recording.rec"  # Default file for RunRecording / the CLI
+KEYFRAME_INTERVAL = 60        # A raw frame at least this often (frames)
+MERGE_GAP = 2                 # Unchanged pixels between two runs that still
+                              # make them one run (cheaper than a new run)
+RUNTIME_SECONDS = 300         # How long RunRecording plays (looping the file)
+FRAME_TIME_MS = 50            # Frame time for recordings without one (a single frame)
+# ============================================================================
+
+MAGIC = b'LEDREC01'
+HEADER = struct.Struct('<8sHHIQ')      # magic, width, height, frames, index offset
+
+RAW, DELTA = 0, 1
+INDEX_DTYPE = np.dtype([('time', '<f8'), ('offset', '<u8'), ('length', '<u4'), ('kind', 'u1')])
+
+
+def _run_positions(starts, lengths):
+    """Pixel positions covered by runs, in order"""
+    total = int(lengths.sum())
+    first = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return first + np.arange(total, dtype=np.int64)
+
+
+def encode_delta(prev, frame, merge_gap=MERGE_GAP):
+    """Bytes of a delta frame turning prev into frame"""
+    changed = np.any(prev != frame, axis=2).ravel()
+    edges = np.diff(np.concatenate(([0], changed.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) > 1:
+        # Join runs separated by only a few unchanged pixels
+        keep = starts[1:] - ends[:-1] > merge_gap
+        starts = starts[np.concatenate(([True], keep))]
+        ends = ends[np.concatenate((keep, [True]))]
+    lengths = ends - starts
+    pixels = frame.reshape(-1, 3)[_run_positions(starts, lengths)]
+    return b''.join((struct.pack('<I', len(starts)),
+                     starts.astype('<u4').tobytes(), lengths.astype('<u4').tobytes(),
+                     pixels.tobytes()))
+
+
+def apply_delta(data, out):
+    """Apply a delta frame (bytes-like) to out (height x width x 3) in place"""
+    runs, = struct.unpack_from('<I', data)
+    starts = np.frombuffer(data, '<u4', runs, 4).astype(np.int64)
+    lengths = np.frombuffer(data, '<u4', runs, 4 + 4 * runs).astype(np.int64)
+    pixels = np.frombuffer(data, np.uint8, offset=4 + 8 * runs).reshape(-1, 3)
+    out.reshape(-1, 3)[_run_positions(starts, lengths)] = pixels
+
+
+class Recorder:
+    """Writes frames to a recording file"""
+
+    def __init__(self, path, width, height, compress=True,
+                 keyframe_interval=KEYFRAME_INTERVAL, clock=time.monotonic):
+        """
+        Args:
+            compress: Store frames as deltas where that is smaller
+            keyframe_interval: A raw frame at least this often
+            clock: Time source for the frame times
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.compress = compress
+        self.keyframe_interval = keyframe_interval
+        self.clock = clock
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, width, height, 0, 0))
+        self._index = []
+        self._prev = np.zeros((height, width, 3), dtype=np.uint8)
+        self._start = None
+        self.frames = 0
+        self.bytes_written = 0
+
+    def add(self, frame):
+        """Append a frame (height x width x 3 uint8)"""
+        now = self.clock()
+        if self._start is None:
+            self._start = now
+        data = frame
+        kind = RAW
+        if self.compress and self.frames % self.keyframe_interval:
+            delta = encode_delta(self._prev, frame)
+            if len(delta) < frame.nbytes:
+                data, kind = delta, DELTA
+        offset = self._file.tell()
+        self._file.write(data)
+        length = self._file.tell() - offset
+        self._index.append((now - self._start, offset, length, kind))
+        self._prev[:] = frame
+        self.frames += 1
+        self.bytes_written += length
+
+    def close(self):
+        """Write the index and the header; the file is complete after this"""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(np.array(self._index, dtype=INDEX_DTYPE).tobytes())
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, self.width, self.height,
+                                     len(self._index), index_offset))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Recording:
+    """A recording file, memory mapped for playback"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.width, self.height, count, index_offset = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a frame recording")
+        self.path = path
+        self.index = np.frombuffer(self._map, INDEX_DTYPE, count, index_offset)
+        self.frame_size = self.width * self.height * 3
+        self._scratch = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self._current = None            # Last frame returned and its number
+        self._position = -1
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def duration(self):
+        return float(self.index['time'][-1]) if len(self) else 0.0
+
+    def _raw(self, i):
+        return np.frombuffer(self._map, np.uint8, self.frame_size,
+                             int(self.index['offset'][i])).reshape(self.height, self.width, 3)
+
+    def frame(self, i):
+        """
+        Frame i (height x width x 3 uint8, read-only).
+
+        Raw frames are views of the file; decoded ones share a buffer that
+        the next call overwrites.  Playing in order decodes one frame per
+        call, anything else starts again from the last raw frame.
+        """
+        if i == self._position:
+            return self._current
+        if i != self._position + 1:
+            # Seek: decode from the last raw frame at or before i
+            raws = np.flatnonzero(self.index['kind'][:i + 1] == RAW)
+            self._position = int(raws[-1]) - 1
+        while self._position < i:
+            self._position += 1
+            entry = self.index[self._position]
+            if entry['kind'] == RAW:
+                self._current = self._raw(self._position)
+                continue
+            if self._current is not self._scratch:
+                self._scratch[:] = self._current
+            offset = int(entry['offset'])
+            apply_delta(memoryview(self._map)[offset:offset + int(entry['length'])],
+                        self._scratch)
+            self._current = self._scratch
+        return self._current
+
+    def close(self):
+        """Unmap the file (left to the garbage collector while frames from it are in use)"""
+        self.index = self._current = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Playback effect
+# ---------------------------------------------------------------------------
+def PrepareRecording(width, height, path=RECORDING_PATH):
+    """Open (map) a recording for RunRecording"""
+    recording = Recording(path)
+    if (recording.width, recording.height) != (width, height):
+        recording.close()
+        raise ValueError(f"{path} is {recording.width}x{recording.height}, "
+                         f"the panel is {width}x{height}")
+    return recording
+
+
+def RunRecording(disp, state=None, runtime_seconds=RUNTIME_SECONDS,
+                 clock=time.monotonic, sleep=time.sleep):
+    """
+    Play a recording with its original frame timing, looping it until
+    runtime_seconds are up.
+
+    Args:
+        disp: Display object with blit() and show() methods
+        state: Result of PrepareRecording() (the default file if None)
+        runtime_seconds: How long to play
+    """
+    recording = state if state is not None else PrepareRecording(disp.width, disp.height)
+    print(f"Playing {recording.path}: {len(recording)} frames, {recording.duration:.1f}s")
+    if not len(recording):
+        recording.close()
+        return
+
+    start = clock()
+    # Length of one pass: the last frame stays up for one average frame time
+    loop_time = recording.duration * len(recording) / max(1, len(recording) - 1)
+    times = recording.index['time'].copy()    # No views left when the file closes
+    if loop_time <= 0:
+        # No spacing to go by (a single frame): show one every FRAME_TIME_MS
+        times = np.arange(len(recording)) * (FRAME_TIME_MS / 1000.0)
+        loop_time = len(recording) * FRAME_TIME_MS / 1000.0
+    loop_start = start
+    i = 0
+    while True:
+        due = loop_start + times[i]
+        if due - start >= runtime_seconds:
+            break
+        delay = due - clock()
+        if delay > 0:
+            sleep(delay)
+        disp.blit(recording.frame(i))
+        disp.show()
+        i += 1
+        if i == len(recording):
+            i = 0
+            loop_start += loop_time
+    recording.close()
+
+
+# ---------------------------------------------------------------------------
+# Command line: record an effect with a headless display
+# ---------------------------------------------------------------------------
+def record_effect(effect, path, seconds, compress=True):
+    """Run effect ('module.Function') on a headless Display, recording it"""
+    from display import Display
+
+    module, name = effect.rsplit('.', 1)
+    run = getattr(importlib.import_module(module), name)
+    disp = Display(headless=True)
+    recorder = disp.start_recording(path, compress=compress)
+    try:
+        run(disp, runtime_seconds=seconds)
+    finally:
+        disp.stop_recording()
+    return recorder
+
+
+def print_info(path):
+    recording = Recording(path)
+    kinds = recording.index['kind']
+    size = int(recording.index['length'].sum())
+    raw_size = len(recording) * recording.frame_size
+    print(f"{path}: {recording.width}x{recording.height}, {len(recording)} frames, "
+          f"{recording.duration:.1f}s")
+    print(f"  raw frames: {int((kinds == RAW).sum())}, delta frames: {int((kinds == DELTA).sum())}")
+    print(f"  frame data: {size} bytes ({size / max(1, raw_size):.1%} of uncompressed)")
+    recording.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record effects for playback with RunRecording")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record = commands.add_parser('record', help="run an effect headless and record it")
+    record.add_argument('effect', help="run function, e.g. ReactionDiffusion.RunReactionDiffusion")
+    record.add_argument('path', nargs='?', default=RECORDING_PATH,
+                        help="output file (default %(default)s)")
+    record.add_argument('--seconds', type=float, default=60,
+                        help="how long to run the effect (default %(default)s)")
+    record.add_argument('--raw', action='store_true', help="store every frame uncompressed")
+    info = commands.add_parser('info', help="describe a recording")
+    info.add_argument('path')
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        start_time = time.time()
+        recorder = record_effect(args.effect, args.path, args.seconds, not args.raw)
+        print("=" * 50)
+        print(f"{recorder.frames} frames in {time.time() - start_time:.1f}s")
+    print_info(args.path)
+
+
+if __name__ == '__main__':
+    main()
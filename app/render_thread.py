@@ -0,0 +1,99 @@
+"""
+Optional render thread for Display.
+
+Without it, Display.show() pushes the frame and waits for SwapOnVSync on the
+caller's thread, so every effect's frame time is update + draw + vsync wait.
+With it, show() only copies the finished frame into a TripleBuffer and
+returns; the render thread owns the canvas, picks up the newest frame and
+swaps on vsync by itself, so the next frame can be simulated meanwhile.
+
+TripleBuffer keeps three slots: the producer always has a back slot to
+write into, the consumer always has a front slot it is presenting, and the
+ready slot holds the newest complete frame.  Neither side ever waits for the
+other to finish a frame: the copy into a slot happens outside any lock, and
+a frame that is replaced before the consumer picked it up is counted as
+dropped.
+
+The handoff is not strictly lock-free.  Python has no atomic exchange, so
+swapping the ready index with the back (or front) index, together with the
+fresh flag and the counters, is done under _swap_lock.  The lock is held
+for a handful of bytecodes, far less than the interpreter's thread switch
+interval, so with one producer and one consumer it is practically never
+contended and costs about as much as the GIL-held swap it protects.
+"""
+
+import threading
+
+
+class TripleBuffer:
+    """Newest-frame-wins handoff between one producer and one consumer"""
+
+    def __init__(self, size):
+        self._slots = [bytearray(size) for _ in range(3)]
+        self._extras = [None] * 3
+        self._back, self._ready, self._front = 0, 1, 2
+        self._fresh = False                 # Ready slot holds an unseen frame
+        self._swap_lock = threading.Lock()
+        self._available = threading.Event()
+        self.published = 0
+        self.dropped = 0
+
+    def publish(self, data, extra=None):
+        """Copy a finished frame (and any per-frame state) in and make it the newest"""
+        back = self._back
+        self._slots[back][:] = data
+        self._extras[back] = extra
+        with self._swap_lock:
+            self._back, self._ready = self._ready, back
+            if self._fresh:
+                self.dropped += 1
+            self._fresh = True
+            self.published += 1
+        self._available.set()
+
+    def acquire(self, timeout=None):
+        """
+        Take the newest frame.
+
+        Returns:
+            (buffer, extra), or None if nothing new arrived within timeout.
+            The buffer stays valid until the next acquire().
+        """
+        if not self._available.wait(timeout):
+            return None
+        with self._swap_lock:
+            self._available.clear()
+            if not self._fresh:
+                return None
+            self._front, self._ready = self._ready, self._front
+            self._fresh = False
+            front = self._front
+        return self._slots[front], self._extras[front]
+
+
+class RenderThread(threading.Thread):
+    """Presents frames from a TripleBuffer as they arrive"""
+
+    def __init__(self, handoff, present):
+        """
+        Args:
+            handoff: TripleBuffer the frames arrive through
+            present: present(buffer, extra) - draws a frame and swaps on vsync
+        """
+        super().__init__(name="render", daemon=True)
+        self.handoff = handoff
+        self.present = present
+        self.frames = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            item = self.handoff.acquire(timeout=0.1)
+            if item is None:
+                continue
+            self.present(*item)
+            self.frames += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
@@ -0,0 +1,136 @@
+"""
+Fixed-rate frame scheduler shared by the effect loops.
+
+Frames are paced against absolute deadlines (start + n * frame_time), so the
+time spent updating and drawing does not add up into drift.  Waiting is a
+sleep until just before the deadline followed by a short spin, which lands
+within a fraction of a millisecond where a plain time.sleep() can overshoot
+by several.
+
+When a frame runs late the scheduler lets the caller catch up by running a
+few extra updates before the next render; if it falls further behind than
+that, the missed frames are dropped and the schedule restarts from now
+instead of trying to make up for a stall.
+
+Usage:
+    scheduler = FrameScheduler(0.03)
+    scheduler.run(lambda dt: fire.update(), draw, duration=RUNTIME_SECONDS)
+    print(scheduler.summary())
+
+or, for loops with their own exit conditions:
+    scheduler = FrameScheduler(DELAY_MS / 1000.0)
+    while True:
+        ...update, draw, show...
+        scheduler.wait()
+"""
+
+import time
+
+SPIN_TIME = 0.001       # Seconds before a deadline to stop sleeping and spin
+MAX_CATCH_UP = 2        # Extra updates allowed per frame when running late
+
+
+class FrameScheduler:
+    """Paces a loop at a fixed frame time and keeps frame statistics"""
+
+    def __init__(self, frame_time, max_catch_up=MAX_CATCH_UP, spin_time=SPIN_TIME,
+                 clock=time.perf_counter, sleep=time.sleep):
+        """
+        Args:
+            frame_time: Seconds per frame (0 = unpaced, as fast as possible)
+            max_catch_up: Extra updates run before a render when behind;
+                          anything later than that is skipped
+            spin_time: Sleep until this long before a deadline, then spin
+            clock, sleep: Time source (seconds) and sleep function
+        """
+        self.frame_time = frame_time
+        self.max_catch_up = max_catch_up
+        self.spin_time = spin_time
+        self.clock = clock
+        self.sleep = sleep
+        self.start()
+
+    def start(self):
+        """Restart the schedule and the statistics from now"""
+        now = self.clock()
+        self.start_time = now
+        self.deadline = now + self.frame_time
+        self.frames = 0         # Frames finished with wait()
+        self.updates = 0        # Updates run by run()
+        self.late = 0           # Frames that missed their deadline
+        self.skipped = 0        # Frames dropped after falling too far behind
+
+    @property
+    def elapsed(self):
+        return self.clock() - self.start_time
+
+    @property
+    def fps(self):
+        """Achieved frame rate since start()"""
+        elapsed = self.elapsed
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    def wait(self):
+        """
+        Finish a frame: wait for its deadline.
+
+        Returns:
+            Number of updates due before the next render: 1 when on time,
+            more when catching up after a late frame.
+        """
+        self.frames += 1
+        now = self.clock()
+        remaining = self.deadline - now
+
+        if remaining > 0:
+            if remaining > self.spin_time:
+                self.sleep(remaining - self.spin_time)
+            while self.clock() < self.deadline:
+                pass
+            self.deadline += self.frame_time
+            return 1
+
+        if self.frame_time <= 0:
+            # Unpaced - just give other threads (e.g. the render thread) a turn
+            self.sleep(0)
+            self.deadline = now
+            return 1
+
+        self.late += 1
+        behind = int(-remaining / self.frame_time)      # Whole frames missed
+        if behind <= self.max_catch_up:
+            self.deadline += (behind + 1) * self.frame_time
+            return behind + 1
+
+        # Too far behind - drop the missed frames and carry on from now
+        self.skipped += behind
+        self.deadline = now + self.frame_time
+        return 1
+
+    def run(self, update, render, duration=None, frames=None, done=None):
+        """
+        Drive update(dt) and render() at the frame rate.
+
+        Stops after `duration` seconds, after `frames` frames, or as soon as
+        done() returns True - whichever comes first.
+        """
+        self.start()
+        steps = 1
+        while True:
+            for _ in range(steps):
+                update(self.frame_time)
+            self.updates += steps
+            render()
+            steps = self.wait()
+
+            if duration is not None and self.elapsed >= duration:
+                return
+            if frames is not None and self.frames >= frames:
+                return
+            if done is not None and done():
+                return
+
+    def summary(self):
+        target = f"{1.0 / self.frame_time:.1f}" if self.frame_time > 0 else "unpaced"
+        return (f"{self.frames} frames in {self.elapsed:.1f}s = {self.fps:.1f} fps "
+                f"(target {target}), {self.late} late, {self.skipped} skipped")
@@ -0,0 +1,47 @@
+"""
+Shared plumbing for the headless batch simulators (snake_sim.py,
+paddle_sim.py): the process pool, the common command line options and
+the summary helpers.
+"""
+
+import json
+from multiprocessing import Pool
+
+
+def run_tasks(simulate, tasks, workers=None, chunksize=4):
+    """
+    Run simulate(*task) for every task and return the results.
+
+    Args:
+        simulate: Module-level function (it is pickled for the workers)
+        workers: Worker processes (None = all cores, 1 = in-process, in order)
+    """
+    if workers == 1:
+        return [simulate(*task) for task in tasks]
+    with Pool(processes=workers) as pool:
+        return list(pool.starmap(simulate, tasks, chunksize=chunksize))
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def add_arguments(parser, default_games, default_seed, games_help):
+    """Options every simulator has: --games, --seed, --workers and --json"""
+    parser.add_argument('--games', type=int, default=default_games,
+                        help=f"{games_help} (default %(default)s)")
+    parser.add_argument('--seed', type=int, default=default_seed,
+                        help="base seed; game i uses seed+i (default %(default)s)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all cores, 1 = in-process)")
+    parser.add_argument('--json', metavar='PATH',
+                        help="also write the summary as JSON to PATH")
+
+
+def write_json(summary, path):
+    with open(path, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    print(f"Summary written to {path}")
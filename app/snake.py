@@ -4,6 +4,8 @@ from collections import deque
 import sys
 import heapq
 
+from scheduler import FrameScheduler
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -42,6 +44,11 @@ class SnakeGame:
         
         # Spawn initial fruit
         self._spawn_fruit()
+        
+        # Cells whose color changed since the last get_changed_pixels() call.
+        # Starts with everything dynamic so the first frame draws it all.
+        self._changed = set(self.snake)
+        self._changed.add(self.fruit_pos)
     
     def _spawn_fruit(self):
         """Spawn fruit at random empty location"""
@@ -333,7 +340,9 @@ class SnakeGame:
             self.reason = "Hit self"
             return
         
-        # Move snake
+        # Move snake (old head turns into body)
+        self._changed.add(self.snake[0])
+        self._changed.add(next_pos)
         self.snake.appendleft(next_pos)
         
         # Check if fruit eaten
@@ -343,13 +352,14 @@ class SnakeGame:
                 self.win = True
                 return
             self._spawn_fruit()
+            self._changed.add(self.fruit_pos)
             # Grow by 10 pixels
             for _ in range(9):  # Already added 1 above, so add 9 more
                 if self.snake:
                     self.snake.append(self.snake[-1])
         else:
             # Remove tail if no fruit eaten
-            self.snake.pop()
+            self._changed.add(self.snake.pop())
     
     def get_pixels(self):
         """Return list of pixels to draw: [(x, y, r, g, b), ...]"""
@@ -374,37 +384,65 @@ class SnakeGame:
             pixels.append((fx, fy, 255, 0, 0))
         
         return pixels
+    
+    def get_static_pixels(self):
+        """Return the pixels that never change during a game (the obstacles)"""
+        return [(x, y, 25, 50, 64) for x, y in self.obstacles]
+    
+    def get_changed_pixels(self):
+        """
+        Return only the pixels that changed since the last call: [(x, y, r, g, b), ...]
+        
+        Covers the new head, the old head (now body), the vacated tail cell
+        and a newly spawned fruit - a handful of cells per tick instead of
+        the whole board.  Obstacles are never included; draw them once from
+        get_static_pixels().
+        """
+        pixels = []
+        head = self.snake[0]
+        
+        for pos in self._changed:
+            x, y = pos
+            if pos == self.fruit_pos:
+                pixels.append((x, y, 255, 0, 0))
+            elif pos == head:
+                pixels.append((x, y, 0, 255, 0))
+            elif pos in self.snake:
+                # Tail cells can be stacked after growing, so a popped
+                # cell may still be part of the body
+                pixels.append((x, y, 0, 150, 0))
+            else:
+                pixels.append((x, y, 0, 0, 0))
+        
+        self._changed = set()
+        return pixels
 
 
-def RunSnakeGame(disp):
-    """Main game loop for snake game"""
+def RunSnakeGame(disp, state=None, runtime_seconds=MAX_GAME_TIME):
+    """Main game loop for snake game (state: a SnakeGame built ahead of time)"""
     print("Running Snake Game")
         
     start_time = time.time()
-    game = SnakeGame(disp.width, disp.height, START_LENGTH, NUM_FRUITS, OBSTACLE_COVERAGE)
+    game = state if state is not None else SnakeGame(disp.width, disp.height, START_LENGTH, NUM_FRUITS, OBSTACLE_COVERAGE)
     
-    next_turn_time = time.time() + (DELAY_MS / 1000.0)
+    # Obstacles are drawn once; after that only changed cells are drawn
+    disp.retained_begin(game.get_static_pixels())
+    
+    scheduler = FrameScheduler(DELAY_MS / 1000.0)
     
     while True:
         # Update game state
         game.update()
         
-        # Clear and draw
-        disp.clear()
-        pixel_list = game.get_pixels()
+        # Draw only what moved
+        pixel_list = game.get_changed_pixels()
         for x, y, r, g, b in pixel_list:
             disp.set_pixel(x, y, r, g, b)
         
         disp.show()
         
-        # Calculate remaining time to reach next turn time
-        current_time = time.time()
-        sleep_time = next_turn_time - current_time
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-        
-        # Set next turn time
-        next_turn_time = time.time() + (DELAY_MS / 1000.0)
+        # Wait for the next turn
+        scheduler.wait()
         
         # Check end conditions
         if game.game_over:
@@ -424,8 +462,8 @@ def RunSnakeGame(disp):
         
         # Check time limit
         elapsed = time.time() - start_time
-        if elapsed >= MAX_GAME_TIME:
-            print(f"Time limit ({MAX_GAME_TIME}s) reached")
+        if elapsed >= runtime_seconds:
+            print(f"Time limit ({runtime_seconds}s) reached")
             print(f"Fruits eaten: {game.fruits_eaten}/{game.num_fruits}")
             time.sleep(3.0)
             return
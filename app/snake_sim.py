@@ -0,0 +1,249 @@
+"""
+Headless batch simulator for the Snake AI.
+
+Runs many SnakeGame instances without a Display and without any sleeping,
+spread across a process pool.  Every game gets its own seed so obstacle maps
+are reproducible, and every strategy plays the exact same set of maps so the
+results can be compared directly.
+
+Usage:
+    python snake_sim.py --games 2000 --strategies astar greedy --workers 4
+    python snake_sim.py --games 500 --seed 42 --json results.json
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left
+from collections import Counter
+
+import sim_common
+from snake import (SnakeGame, START_LENGTH, NUM_FRUITS, DELAY_MS,
+                   MAX_GAME_TIME, OBSTACLE_COVERAGE)
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+DEFAULT_GAMES = 1000      # Games per strategy
+DEFAULT_SEED = 1          # Base seed (game i uses DEFAULT_SEED + i)
+# Same budget the panel gives a game: MAX_GAME_TIME seconds at DELAY_MS per move
+DEFAULT_MAX_TICKS = int(MAX_GAME_TIME * 1000 / DELAY_MS)
+# ============================================================================
+
+# Upper bounds (microseconds) of the planning latency histogram buckets.
+# Per-game histograms are merged instead of shipping every sample between
+# processes.  The last bucket catches everything slower.
+LATENCY_BUCKETS_US = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+                      10000, 20000, 50000, 100000, float('inf')]
+
+
+# ---------------------------------------------------------------------------
+# Strategies
+# ---------------------------------------------------------------------------
+class GreedySnakeGame(SnakeGame):
+    """Baseline: step to the safe neighbour closest to the fruit (no search)."""
+
+    def _find_best_move(self):
+        head = self.snake[0]
+        body = set(self.snake)
+        body.discard(self.snake[-1])
+        fx, fy = self.fruit_pos
+        best_move = None
+        best_distance = None
+        for neighbor in self._get_neighbors(head):
+            if neighbor in body:
+                continue
+            distance = abs(neighbor[0] - fx) + abs(neighbor[1] - fy)
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best_move = neighbor
+        return best_move
+
+
+class TailSafeSnakeGame(SnakeGame):
+    """A* toward the fruit, but only if the tail is still reachable afterwards."""
+
+    def _find_best_move(self):
+        head = self.snake[0]
+        fruit_obstacles = set(self.snake)
+        fruit_obstacles.discard(self.snake[-1])
+        path = self._astar_path_to_target(head, self.fruit_pos, fruit_obstacles)
+        if len(path) >= 2:
+            next_pos = path[1]
+            if self._can_reach_tail_after_move(next_pos, next_pos == self.fruit_pos):
+                return next_pos
+        return SnakeGame._find_best_move(self)
+
+
+STRATEGIES = {
+    'astar': SnakeGame,
+    'greedy': GreedySnakeGame,
+    'tailsafe': TailSafeSnakeGame,
+}
+
+
+# ---------------------------------------------------------------------------
+# Single game (runs inside a worker process)
+# ---------------------------------------------------------------------------
+def simulate_game(strategy, seed, max_ticks=DEFAULT_MAX_TICKS,
+                  width=64, height=64, obstacle_coverage=OBSTACLE_COVERAGE):
+    """
+    Play one game to completion without a display.
+
+    Returns a dict with the outcome and a latency histogram of the time
+    spent in _find_best_move() for every tick.
+    """
+    random.seed(seed)
+    game_class = STRATEGIES[strategy]
+    game = game_class(width, height, START_LENGTH, NUM_FRUITS, obstacle_coverage)
+
+    histogram = [0] * len(LATENCY_BUCKETS_US)
+    worst_us = 0.0
+
+    # Time the planner by wrapping the bound method on this instance only
+    plan = game._find_best_move
+
+    def timed_plan():
+        t0 = time.perf_counter()
+        move = plan()
+        us = (time.perf_counter() - t0) * 1e6
+        histogram[bisect_left(LATENCY_BUCKETS_US, us)] += 1
+        nonlocal worst_us
+        if us > worst_us:
+            worst_us = us
+        return move
+
+    game._find_best_move = timed_plan
+
+    ticks = 0
+    while ticks < max_ticks and not game.game_over and not game.win:
+        game.update()
+        ticks += 1
+
+    if game.win:
+        reason = "Won"
+    elif game.game_over:
+        reason = game.reason
+    else:
+        reason = "Tick limit"
+
+    return {
+        'strategy': strategy,
+        'seed': seed,
+        'fruits': game.fruits_eaten,
+        'ticks': ticks,
+        'reason': reason,
+        'latency_hist': histogram,
+        'latency_max_us': worst_us,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Aggregation / reporting
+# ---------------------------------------------------------------------------
+def _histogram_percentile(histogram, pct):
+    """
+    Return the bucket upper bound (us) containing the given percentile,
+    or None when it is in the last (unbounded) bucket - JSON has no Infinity.
+    """
+    total = sum(histogram)
+    if total == 0:
+        return 0
+    threshold = pct / 100.0 * total
+    running = 0
+    for bound, count in zip(LATENCY_BUCKETS_US, histogram):
+        running += count
+        if running >= threshold:
+            break
+    return None if bound == float('inf') else bound
+
+
+def summarize(results):
+    """Collapse per-game results into one summary dict per strategy."""
+    by_strategy = {}
+    for result in results:
+        by_strategy.setdefault(result['strategy'], []).append(result)
+
+    summary = {}
+    for strategy, games in by_strategy.items():
+        fruits = sorted(g['fruits'] for g in games)
+        ticks = sorted(g['ticks'] for g in games)
+        histogram = [0] * len(LATENCY_BUCKETS_US)
+        for g in games:
+            for i, count in enumerate(g['latency_hist']):
+                histogram[i] += count
+
+        summary[strategy] = {
+            'games': len(games),
+            'wins': sum(1 for g in games if g['reason'] == "Won"),
+            'fruits_mean': sum(fruits) / len(fruits),
+            'fruits_median': sim_common.percentile(fruits, 50),
+            'fruits_min': fruits[0],
+            'fruits_max': fruits[-1],
+            'ticks_mean': sum(ticks) / len(ticks),
+            'ticks_median': sim_common.percentile(ticks, 50),
+            'reasons': dict(Counter(g['reason'] for g in games).most_common()),
+            'latency_us': {
+                'p50': _histogram_percentile(histogram, 50),
+                'p90': _histogram_percentile(histogram, 90),
+                'p99': _histogram_percentile(histogram, 99),
+                'max': max(g['latency_max_us'] for g in games),
+            },
+            'latency_hist': histogram,
+        }
+    return summary
+
+
+def print_summary(summary):
+    def fmt_us(value):
+        return ">%dus" % LATENCY_BUCKETS_US[-2] if value is None else "<=%dus" % value
+
+    for strategy, s in summary.items():
+        print("=" * 50)
+        print(f"Strategy: {strategy}  ({s['games']} games, {s['wins']} wins)")
+        print(f"  Fruits: mean {s['fruits_mean']:.1f}  median {s['fruits_median']}"
+              f"  min {s['fruits_min']}  max {s['fruits_max']}")
+        print(f"  Ticks:  mean {s['ticks_mean']:.0f}  median {s['ticks_median']}")
+        print("  End reasons:")
+        for reason, count in s['reasons'].items():
+            print(f"    {reason:<24} {count:6d}  ({100.0 * count / s['games']:.1f}%)")
+        lat = s['latency_us']
+        print(f"  Planning latency: p50 {fmt_us(lat['p50'])}  p90 {fmt_us(lat['p90'])}"
+              f"  p99 {fmt_us(lat['p99'])}  max {lat['max']:.0f}us")
+
+
+def run_batch(strategies, games, seed=DEFAULT_SEED, max_ticks=DEFAULT_MAX_TICKS,
+              workers=None, obstacle_coverage=OBSTACLE_COVERAGE):
+    """Run `games` seeded games for every strategy and return the raw results."""
+    tasks = [(strategy, seed + i, max_ticks, 64, 64, obstacle_coverage)
+             for i in range(games) for strategy in strategies]
+    return sim_common.run_tasks(simulate_game, tasks, workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Snake AI batch simulator")
+    sim_common.add_arguments(parser, DEFAULT_GAMES, DEFAULT_SEED, "games per strategy")
+    parser.add_argument('--strategies', nargs='+', default=['astar'],
+                        choices=sorted(STRATEGIES), help="strategies to compare")
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS,
+                        help="tick limit per game (default %(default)s)")
+    parser.add_argument('--coverage', type=int, default=OBSTACLE_COVERAGE,
+                        help="obstacle coverage percent (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    start_time = time.time()
+    results = run_batch(args.strategies, args.games, args.seed, args.max_ticks,
+                        args.workers, args.coverage)
+    elapsed = time.time() - start_time
+
+    summary = summarize(results)
+    print_summary(summary)
+    print("=" * 50)
+    print(f"{len(results)} games in {elapsed:.1f}s")
+
+    if args.json:
+        sim_common.write_json(summary, args.json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Pre-rasterized sprites for shapes that are drawn over and over.
+
+A sprite is rasterized once into a list of pixel offsets (plus a bytearray
+mask of its bounding box) and cached, so drawing it again is just a stamp
+of known pixels - no Bresenham stepping or distance tests per frame.
+Display.draw_sprite() stamps a sprite at a position in one colour.
+
+Offsets are relative to the sprite's anchor: the centre for X/O/circle
+sprites, the panel origin for line sprites.
+"""
+
+from functools import lru_cache
+
+
+class Sprite:
+    """A fixed set of pixels relative to an anchor point"""
+
+    def __init__(self, points):
+        self.points = sorted(set(points))
+        if self.points:
+            xs = [x for x, _ in self.points]
+            ys = [y for _, y in self.points]
+            self.left, self.top = min(xs), min(ys)
+            self.width = max(xs) - self.left + 1
+            self.height = max(ys) - self.top + 1
+        else:
+            self.left = self.top = self.width = self.height = 0
+
+        # 1 = pixel set, row-major over the bounding box
+        self.mask = bytearray(self.width * self.height)
+        for x, y in self.points:
+            self.mask[(y - self.top) * self.width + (x - self.left)] = 1
+
+    def __len__(self):
+        return len(self.points)
+
+
+def line_points(x1, y1, x2, y2):
+    """Pixels of a line using Bresenham's algorithm (end point excluded)"""
+    points = []
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    x, y = x1, y1
+
+    # Determine direction of line
+    x_inc = 1 if x1 < x2 else -1
+    y_inc = 1 if y1 < y2 else -1
+
+    if dx > dy:
+        # Line is more horizontal than vertical
+        error = dx / 2
+        while x != x2:
+            points.append((int(x), int(y)))
+            error -= dy
+            if error < 0:
+                y += y_inc
+                error += dx
+            x += x_inc
+    else:
+        # Line is more vertical than horizontal
+        error = dy / 2
+        while y != y2:
+            points.append((int(x), int(y)))
+            error -= dx
+            if error < 0:
+                x += x_inc
+                error += dy
+            y += y_inc
+    return points
+
+
+@lru_cache(maxsize=None)
+def lines_sprite(lines):
+    """Sprite made of lines, given as a tuple of (x1, y1, x2, y2)"""
+    points = []
+    for x1, y1, x2, y2 in lines:
+        points.extend(line_points(x1, y1, x2, y2))
+    return Sprite(points)
+
+
+@lru_cache(maxsize=None)
+def x_sprite(height, line_width):
+    """'X' centred on the anchor (see Display.draw_x)"""
+    half_up = height // 2
+    half_down = height - half_up + 1  # Add 1 to account for center pixel
+
+    # The four corner points
+    x1, y1 = -half_up, -half_up        # Top-left
+    x2, y2 = half_down, half_down      # Bottom-right
+    x3, y3 = half_down, -half_up       # Top-right
+    x4, y4 = -half_up, half_down       # Bottom-left
+
+    # Multiple parallel lines create the line width
+    lines = []
+    for i in range(line_width):
+        offset = i - line_width // 2
+        lines.append((x1 + offset, y1, x2 + offset, y2))
+        lines.append((x1, y1 + offset, x2, y2 + offset))
+        lines.append((x3 - offset, y3, x4 - offset, y4))
+        lines.append((x3, y3 + offset, x4, y4 + offset))
+    return lines_sprite(tuple(lines))
+
+
+@lru_cache(maxsize=None)
+def ring_sprite(outer_radius, width):
+    """'O' centred on the anchor: outer circle minus inner circle (see Display.draw_o)"""
+    inner_radius = outer_radius - width
+    points = []
+    for y in range(-outer_radius, outer_radius + 1):
+        for x in range(-outer_radius, outer_radius + 1):
+            distance_squared = x * x + y * y
+            if inner_radius * inner_radius <= distance_squared < outer_radius * outer_radius:
+                points.append((x, y))
+    return Sprite(points)
+
+
+@lru_cache(maxsize=None)
+def circle_sprite(radius):
+    """Filled circle centred on the anchor (see Display.draw_circle)"""
+    points = []
+    for y in range(-radius, radius + 1):
+        for x in range(-radius, radius + 1):
+            if x * x + y * y < radius * radius:
+                points.append((x, y))
+    return Sprite(points)
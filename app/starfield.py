@@ -1,11 +1,13 @@
 import random
 import math
-import time
+
+from scheduler import FrameScheduler
 
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
 RUNTIME_SECONDS = 300  # How long the starfield runs (in seconds).
+FRAME_TIME_MS = 20     # Time between frames (in milliseconds)
 # ============================================================================
 class StarField:
     def __init__(self, width=64, height=64, num_stars=100, speed=2.0):
@@ -153,31 +155,20 @@ class StarField:
 
 
 
-def RunStarfield(disp):
+def RunStarfield(disp, state=None, runtime_seconds=RUNTIME_SECONDS):
 
     print("Running Starfield")
 
-    start_time = time.time()
-
-    starfield = StarField(disp.width, disp.height, num_stars=100, speed=2.0)
-
-    while True:
-        starfield.update()
-
-        pixel_list = starfield.get_pixels()
+    starfield = state if state is not None else StarField(disp.width, disp.height, num_stars=100, speed=2.0)
 
+    def draw():
         disp.clear()
-
         # Draw each pixel
-        for x, y, r, g, b in pixel_list:
+        for x, y, r, g, b in starfield.get_pixels():
             disp.set_pixel(x,y,r,g,b)
-
         disp.show()
-        time.sleep(.01)
-        
-        # Check if runtime limit exceeded
-        elapsed = time.time() - start_time
-        if elapsed >= RUNTIME_SECONDS:
-            print(f"Starfield runtime limit ({RUNTIME_SECONDS} seconds) reached")
-            return
 
+    scheduler = FrameScheduler(FRAME_TIME_MS / 1000.0)
+    scheduler.run(lambda dt: starfield.update(), draw, duration=runtime_seconds)
+    print(f"Starfield runtime limit ({runtime_seconds} seconds) reached")
+    print(f"   {scheduler.summary()}")
@@ -0,0 +1,284 @@
+"""
+Per-stage frame timing for the effects run by main.py.
+
+Telemetry wraps methods with timing hooks instead of changing the effects:
+instrument() wraps an effect class's update / pixel generation methods, and
+install() wraps the Display stages (show, overlay_render, text_render, the
+frame push and SwapOnVSync) and adds a frame hook that closes each frame.
+"draw" is the time from the last update/pixels call of a frame to the start
+of show(), i.e. the effect's own set_pixel/draw loop.
+
+Samples go into rolling per-effect, per-stage histograms and are exposed as:
+    - a periodic log line (every LOG_INTERVAL_SECONDS)
+    - a JSON file (JSON_PATH, rewritten on the same interval)
+    - a Prometheus text-format endpoint on localhost (PROMETHEUS_PORT)
+
+Usage (main.py):
+    stats = telemetry.Telemetry()
+    stats.install(disp)
+    stats.instrument(Fire, update='update', get_pixels='pixels')
+    stats.begin_effect("RunFire")
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+LOG_INTERVAL_SECONDS = 10     # Seconds between log lines / JSON writes (0 = never)
+JSON_PATH = "telemetry.json"  # Stats file (None = don't write)
+PROMETHEUS_PORT = 9108        # http://127.0.0.1:PORT/metrics (0 = no endpoint)
+WINDOW_FRAMES = 600           # Samples kept per stage for the rolling percentiles
+# ============================================================================
+
+# Upper bounds (seconds) of the cumulative histogram buckets
+BUCKETS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+           0.05, 0.1, 0.25, 0.5, 1.0, float('inf')]
+
+# Order used for log lines
+STAGES = ['update', 'pixels', 'draw', 'show', 'overlay', 'text', 'push', 'swap', 'frame']
+
+
+class StageHistogram:
+    """Rolling window of samples plus cumulative buckets for one stage"""
+
+    def __init__(self, window=WINDOW_FRAMES):
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, pct):
+        values = sorted(self.samples)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+    def summary(self):
+        window = list(self.samples)
+        mean = sum(window) / len(window) if window else 0.0
+        return {
+            'count': self.count,
+            'mean_ms': mean * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p90_ms': self.percentile(90) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': max(window) * 1000 if window else 0.0,
+        }
+
+
+class Telemetry:
+    """Collects stage timings per effect and publishes them"""
+
+    def __init__(self, log_interval=LOG_INTERVAL_SECONDS, json_path=JSON_PATH,
+                 port=PROMETHEUS_PORT, window=WINDOW_FRAMES, clock=time.perf_counter):
+        self.log_interval = log_interval
+        self.json_path = json_path
+        self.port = port
+        self.window = window
+        self.clock = clock
+
+        self.effect = "startup"
+        self.stages = {}            # (effect, stage) -> StageHistogram
+        self.frames = {}            # effect -> frames shown
+        self._lock = threading.Lock()
+        self._frame_start = None
+        self._last_work_end = None  # End of the last update/pixels call this frame
+        self._next_report = None
+        self._server = None
+
+    # ---- Recording ----
+    def record(self, stage, seconds, effect=None):
+        key = (effect or self.effect, stage)
+        with self._lock:
+            histogram = self.stages.get(key)
+            if histogram is None:
+                histogram = self.stages[key] = StageHistogram(self.window)
+            histogram.add(seconds)
+
+    def timed(self, func, stage):
+        """Wrap func so every call is recorded under stage"""
+        clock = self.clock
+        work = stage in ('update', 'pixels')
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            t0 = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                t1 = clock()
+                self.record(stage, t1 - t0)
+                if work:
+                    self._last_work_end = t1
+        wrapper.__wrapped_stage__ = stage
+        return wrapper
+
+    def instrument(self, cls, **methods):
+        """
+        Time methods of an effect class, e.g.
+        instrument(SnakeGame, update='update', get_changed_pixels='pixels')
+        """
+        for name, stage in methods.items():
+            func = getattr(cls, name)
+            if getattr(func, '__wrapped_stage__', None) is None:
+                setattr(cls, name, self.timed(func, stage))
+
+    def install(self, disp):
+        """Time the Display stages and close a frame on every show()"""
+        show = self.timed(disp.show, 'show')
+
+        def timed_show():
+            if self._last_work_end is not None:
+                self.record('draw', self.clock() - self._last_work_end)
+            show()
+
+        disp.show = timed_show
+        disp.overlay_render = self.timed(disp.overlay_render, 'overlay')
+        disp.text_render = self.timed(disp.text_render, 'text')
+        disp._push_frame = self.timed(disp._push_frame, 'push')
+        disp._swap = self.timed(disp._swap, 'swap')
+        disp.frame_hooks.append(self.end_frame)
+        # http.server is a slow import - keep it off the path to the first frame
+        threading.Thread(target=self.start_server, name="telemetry-start", daemon=True).start()
+
+    def begin_effect(self, name):
+        """Label everything recorded from now on with the effect's name"""
+        self.effect = name
+        self._frame_start = None
+        self._last_work_end = None
+
+    def end_frame(self):
+        now = self.clock()
+        if self._frame_start is not None:
+            self.record('frame', now - self._frame_start)
+        self._frame_start = now
+        self._last_work_end = None
+        self.frames[self.effect] = self.frames.get(self.effect, 0) + 1
+
+        if self.log_interval:
+            if self._next_report is None:
+                self._next_report = now + self.log_interval
+            elif now >= self._next_report:
+                self._next_report = now + self.log_interval
+                self.report()
+
+    # ---- Output ----
+    def fps(self, effect=None):
+        histogram = self.stages.get((effect or self.effect, 'frame'))
+        if histogram is None or not histogram.samples:
+            return 0.0
+        total = sum(histogram.samples)
+        return len(histogram.samples) / total if total > 0 else 0.0
+
+    def snapshot(self):
+        """All stats as a JSON-ready dict"""
+        with self._lock:
+            effects = {}
+            for (effect, stage), histogram in self.stages.items():
+                entry = effects.setdefault(effect, {'frames': self.frames.get(effect, 0),
+                                                    'fps': self.fps(effect), 'stages': {}})
+                entry['stages'][stage] = histogram.summary()
+        return {'time': time.time(), 'effect': self.effect, 'effects': effects}
+
+    def log_line(self):
+        parts = [f"[telemetry] {self.effect} {self.fps():.1f} fps"]
+        for stage in STAGES:
+            histogram = self.stages.get((self.effect, stage))
+            if histogram is not None and histogram.samples and stage != 'frame':
+                parts.append(f"{stage} {histogram.percentile(50) * 1000:.2f}/"
+                             f"{histogram.percentile(99) * 1000:.2f}ms")
+        return " | ".join(parts)
+
+    def report(self):
+        """Print the log line and rewrite the JSON file"""
+        print(self.log_line())
+        if self.json_path:
+            tmp_path = self.json_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(tmp_path, self.json_path)
+
+    def prometheus(self):
+        """Stats in the Prometheus text exposition format"""
+        lines = [
+            "# HELP led_stage_seconds Time spent in each frame stage",
+            "# TYPE led_stage_seconds histogram",
+        ]
+        with self._lock:
+            for (effect, stage), histogram in sorted(self.stages.items()):
+                labels = f'effect="{effect}",stage="{stage}"'
+                running = 0
+                for bound, count in zip(BUCKETS, histogram.buckets):
+                    running += count
+                    le = "+Inf" if bound == float('inf') else repr(bound)
+                    lines.append(f'led_stage_seconds_bucket{{{labels},le="{le}"}} {running}')
+                lines.append(f"led_stage_seconds_sum{{{labels}}} {histogram.total}")
+                lines.append(f"led_stage_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append("# HELP led_frames_total Frames shown per effect")
+            lines.append("# TYPE led_frames_total counter")
+            for effect, frames in sorted(self.frames.items()):
+                lines.append(f'led_frames_total{{effect="{effect}"}} {frames}')
+
+            lines.append("# HELP led_fps Frame rate over the rolling window")
+            lines.append("# TYPE led_fps gauge")
+            for effect in sorted(self.frames):
+                lines.append(f'led_fps{{effect="{effect}"}} {self.fps(effect):.3f}')
+        return "\n".join(lines) + "\n"
+
+    def start_server(self):
+        """Serve /metrics (Prometheus) and /stats.json on 127.0.0.1"""
+        if not self.port or self._server is not None:
+            return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body = telemetry.prometheus().encode()
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path == '/stats.json':
+                    body = json.dumps(telemetry.snapshot()).encode()
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass    # Keep scrapes out of the console
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._server.daemon_threads = True
+        thread = threading.Thread(target=self._server.serve_forever,
+                                  name="telemetry-http", daemon=True)
+        thread.start()
+        print(f"Telemetry: http://127.0.0.1:{self.server_port}/metrics")
+
+    @property
+    def server_port(self):
+        return self._server.server_address[1] if self._server else None
+
+    def stop_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+import bench_startup
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:       300 |        420 | json
+import time:        80 |         80 |     _heapq
+import time:       200 |        280 |   heapq
+import time:       500 |        780 | snake
+"""
+
+MAIN = """\
+from display import Display
+import telemetry
+import argparse, os
+
+EFFECTS = {
+    'RunFire': ('fire', 'Fire'),
+    'RunMazeGame': ('maze', 'PrepareMazeGame'),
+    'RunScrollingMaze': ('maze', 'PrepareScrollingMaze'),
+}
+
+def run_effect(effect):
+    import playlist
+"""
+
+class TestBenchStartup(unittest.TestCase):
+    def test_parse_importtime(self):
+        self.assertEqual(bench_startup.parse_importtime(IMPORTTIME), [
+            (120, 120, '_json', 1),
+            (300, 420, 'json', 0),
+            (80, 80, '_heapq', 2),
+            (200, 280, 'heapq', 1),
+            (500, 780, 'snake', 0),
+        ])
+
+    def test_modules_read_from_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'main.py')
+            with open(path, 'w') as f:
+                f.write(MAIN)
+            self.assertEqual(bench_startup.startup_modules(path),
+                             ['display', 'telemetry', 'argparse', 'os'])
+            self.assertEqual(bench_startup.effect_modules(path), ['fire', 'maze'])
+
+    def test_real_main_registry(self):
+        modules = bench_startup.effect_modules()
+        self.assertIn('ReactionDiffusion', modules)
+        self.assertNotIn('ReactionDiffusion', bench_startup.startup_modules())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+import correction
+from correction import ColorCorrection
+
+def frame():
+    return np.arange(64 * 64 * 3, dtype=np.uint32).reshape(64, 64, 3).astype(np.uint8)
+
+class TestLut(unittest.TestCase):
+    def test_gamma_and_brightness(self):
+        lut = correction.build_lut(gamma=2.0, brightness=0.5)
+        self.assertEqual(lut.shape, (3, 256))
+        self.assertEqual(lut[:, 255].tolist(), [128, 128, 128])
+        self.assertEqual(int(lut[0, 128]), round(127.5 * (128 / 255) ** 2))
+        self.assertEqual(int(lut[0, 0]), 0)
+
+    def test_per_channel(self):
+        lut = correction.build_lut(gamma=(1.0, 1.0, 2.0), white_balance=(1.0, 0.5, 1.0))
+        self.assertEqual(lut[:, 200].tolist(), [200, 100, round(255 * (200 / 255) ** 2)])
+
+    def test_scheduled_brightness(self):
+        for hour, night in [(21, False), (22, True), (3, True), (7, False)]:
+            with self.subTest(hour=hour):
+                level = correction.scheduled_brightness(hour, 1.0, 0.2, (22, 7))
+                self.assertEqual(level, 0.2 if night else 1.0)
+        self.assertEqual(correction.scheduled_brightness(13, 1.0, 0.2, (12, 14)), 0.2)
+
+class TestColorCorrection(unittest.TestCase):
+    def test_identity_returns_the_frame(self):
+        f = frame()
+        out = np.zeros_like(f)
+        self.assertIs(ColorCorrection().apply(f, out), f)
+        self.assertFalse(out.any())
+
+    def test_apply_matches_per_channel_lookup(self):
+        f = frame()
+        out = np.zeros_like(f)
+        corr = ColorCorrection(gamma=(2.2, 1.8, 1.0), brightness=0.7)
+        self.assertIs(corr.apply(f, out), out)
+        lut = corr.lut
+        for c in range(3):
+            self.assertTrue((out[..., c] == lut[c][f[..., c]]).all())
+
+    def test_runtime_brightness(self):
+        f = frame()
+        out = np.zeros_like(f)
+        corr = ColorCorrection()
+        corr.set_brightness(0.5)
+        self.assertEqual(corr.apply(f, out).max(), 128)
+        corr.set_brightness(3.0)                # Clamped
+        self.assertEqual(corr.brightness, 1.0)
+        self.assertIs(corr.apply(f, out), f)
+
+if __name__ == '__main__':
+    unittest.main()
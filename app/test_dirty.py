@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from dirty import CanvasTracker, dirty_rect
+
+def frame(h=4, w=6):
+    return np.zeros((h, w, 3), dtype=np.uint8)
+
+class TestDirtyRect(unittest.TestCase):
+    def test_identical(self):
+        self.assertIsNone(dirty_rect(frame(), frame()))
+
+    def test_bounding_box(self):
+        new = frame()
+        new[1, 2] = (1, 0, 0)
+        self.assertEqual(dirty_rect(frame(), new), (2, 1, 3, 2))
+        new[3, 0, 2] = 5
+        self.assertEqual(dirty_rect(frame(), new), (0, 1, 3, 4))
+
+class TestCanvasTracker(unittest.TestCase):
+    def test_each_canvas_is_diffed_against_its_own_contents(self):
+        tracker = CanvasTracker(6, 4)
+        a, b = frame(), frame()
+        b[0, 0] = 9
+
+        # Nothing known about either canvas yet
+        self.assertEqual(tracker.update(a), tracker.full)
+        tracker.swapped()
+        self.assertEqual(tracker.update(b), tracker.full)
+        tracker.swapped()
+
+        # Back on the first canvas, which still holds a
+        c = a.copy()
+        c[2, 4] = 1
+        self.assertEqual(tracker.update(c), (4, 2, 5, 3))
+        tracker.swapped()
+        # Second canvas holds b - c differs from it in two places
+        self.assertEqual(tracker.update(c), (0, 0, 5, 3))
+        tracker.swapped()
+        self.assertIsNone(tracker.update(c))
+        self.assertEqual(tracker.pixels_pushed, 2 * 24 + 1 + 15)
+
+    def test_invalidate(self):
+        tracker = CanvasTracker(6, 4, canvases=1)
+        tracker.update(frame())
+        tracker.invalidate()
+        self.assertEqual(tracker.update(frame()), tracker.full)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import sprites
+from display import Display
+
+RED = (200, 10, 0)
+
+def lit(disp):
+    ys, xs = np.nonzero(disp.frame.any(axis=2))
+    return set(zip(xs.tolist(), ys.tolist()))
+
+def on_panel(points, size=64):
+    return {(x, y) for x, y in points if 0 <= x < size and 0 <= y < size}
+
+def disc(cx, cy, radius, inner=0):
+    # Pixel centres with inner^2 <= d^2 < radius^2
+    return {(cx + x, cy + y)
+            for y in range(-radius, radius + 1) for x in range(-radius, radius + 1)
+            if inner * inner <= x * x + y * y < radius * radius}
+
+class TestDrawing(unittest.TestCase):
+
+    def setUp(self):
+        self.disp = Display(headless=True)
+
+    def test_headless_panel(self):
+        self.assertIsNone(self.disp.matrix)
+        self.assertEqual(self.disp.frame.shape, (64, 64, 3))
+        self.assertFalse(self.disp.frame.any())
+
+    def test_set_pixel_ignores_off_panel(self):
+        for x, y in ((-1, 0), (0, -1), (64, 5), (5, 64)):
+            self.disp.set_pixel(x, y, *RED)
+        self.assertEqual(lit(self.disp), set())
+        self.disp.set_pixel(63, 63, *RED)
+        self.assertEqual(self.disp.frame[63, 63].tolist(), list(RED))
+
+    def test_rectangle_is_clipped(self):
+        self.disp.draw_rectangle(-2, 60, 5, 10, RED)
+        self.assertEqual(lit(self.disp), {(x, y) for x in range(3) for y in range(60, 64)})
+        self.disp.clear()
+        self.disp.draw_rectangle(64, 0, 4, 4, RED)
+        self.disp.draw_rectangle(-5, -5, 5, 5, RED)
+        self.assertEqual(lit(self.disp), set())
+
+    def test_circle(self):
+        for cx, cy, radius in ((32, 32, 6), (0, 0, 5), (62, 3, 4), (-3, 40, 6)):
+            with self.subTest(center=(cx, cy), radius=radius):
+                self.disp.clear()
+                self.disp.draw_circle(cx, cy, radius, RED)
+                self.assertEqual(lit(self.disp), on_panel(disc(cx, cy, radius)))
+        self.assertEqual(self.disp.frame[40, 0].tolist(), list(RED))
+
+    def test_o_is_a_ring(self):
+        for cx, cy, radius, width in ((32, 32, 7, 2), (63, 63, 6, 3), (1, 30, 5, 1)):
+            with self.subTest(center=(cx, cy), radius=radius, width=width):
+                self.disp.clear()
+                self.disp.draw_o(cx, cy, radius, width, RED)
+                self.assertEqual(lit(self.disp),
+                                 on_panel(disc(cx, cy, radius, radius - width)))
+        self.disp.clear()
+        self.disp.draw_o(32, 32, 7, 2, RED)
+        self.assertFalse(self.disp.frame[32, 32].any())
+
+    def test_x_is_clipped(self):
+        points = sprites.x_sprite(12, 3).points
+        for cx, cy in ((32, 26), (2, 2), (60, 61)):
+            with self.subTest(center=(cx, cy)):
+                self.disp.clear()
+                self.disp.draw_x(cx, cy, 12, 3, RED)
+                self.assertEqual(lit(self.disp), on_panel((cx + x, cy + y) for x, y in points))
+
+    def test_line_is_clipped(self):
+        self.disp.draw_line(-10, 5, 70, 5, RED)
+        self.assertEqual(lit(self.disp), {(x, 5) for x in range(64)})
+        self.disp.clear()
+        self.disp.draw_line(60, 60, 70, 70, RED)
+        self.assertEqual(lit(self.disp), {(x, x) for x in range(60, 64)})
+
+if __name__ == '__main__':
+    unittest.main()
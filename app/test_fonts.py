@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import fonts
+import layers
+from fonts import BDFFont, Ticker
+from fakes import FakeClock
+
+# 3x4 font, one row below the baseline: 'A' fills its box, 'i' is one
+# column wide and shifted right by one
+BDF = """STARTFONT 2.1
+FONT -test-tiny
+SIZE 4 75 75
+FONTBOUNDINGBOX 3 4 0 -1
+STARTPROPERTIES 1
+DEFAULT_CHAR 63
+ENDPROPERTIES
+CHARS 3
+STARTCHAR A
+ENCODING 65
+DWIDTH 4 0
+BBX 3 4 0 -1
+BITMAP
+E0
+A0
+E0
+A0
+ENDCHAR
+STARTCHAR i
+ENCODING 105
+DWIDTH 3 0
+BBX 1 3 1 0
+BITMAP
+80
+80
+80
+ENDCHAR
+STARTCHAR question
+ENCODING 63
+DWIDTH 2 0
+BBX 1 1 0 0
+BITMAP
+80
+ENDCHAR
+ENDFONT
+"""
+
+def tiny_font():
+    return BDFFont.parse(BDF.splitlines())
+
+class TestBDFFont(unittest.TestCase):
+    def test_parse(self):
+        font = tiny_font()
+        self.assertEqual((font.height, font.ascent), (4, 3))
+        glyph = font.glyph('A')
+        self.assertEqual(glyph.bitmap.astype(int).tolist(),
+                         [[1, 1, 1], [1, 0, 1], [1, 1, 1], [1, 0, 1]])
+        self.assertEqual(glyph.advance, 4)
+        self.assertIs(font.glyph('Z'), font.default)
+
+    def test_render_places_glyphs_like_drawtext(self):
+        mask = tiny_font().render('Ai')
+        self.assertEqual(mask.shape, (4, 7))
+        # 'i' sits on the baseline: rows 0-2, column 4 + 1
+        self.assertEqual(np.flatnonzero(mask[:, 5]).tolist(), [0, 1, 2])
+        self.assertFalse(mask[:, 4].any() or mask[:, 6].any())
+
+    def test_load_parses_once(self):
+        with tempfile.TemporaryDirectory() as font_dir:
+            with open(os.path.join(font_dir, 'tiny.bdf'), 'w') as f:
+                f.write(BDF)
+            font = fonts.load('tiny.bdf', font_dir)
+            self.assertIs(fonts.load('tiny.bdf', font_dir), font)
+
+class TestTextStrip(unittest.TestCase):
+    def test_cached_rgba_strip(self):
+        font = tiny_font()
+        strip = fonts.text_strip(font, 'A', (10, 20, 30))
+        self.assertEqual(strip.shape, (4, 4, 4))
+        self.assertEqual(strip[0, 0].tolist(), [10, 20, 30, 255])
+        self.assertEqual(strip[1, 1].tolist(), [0, 0, 0, 0])
+        self.assertIs(fonts.text_strip(font, 'A', (10, 20, 30)), strip)
+        self.assertFalse(strip.flags.writeable)
+
+class TestTicker(unittest.TestCase):
+    def test_slides_a_window_over_the_strip(self):
+        clock = FakeClock()
+        font = tiny_font()
+        ticker = Ticker(font, 'A', (255, 0, 0), y=3, width=8, speed=2.0, gap=2, clock=clock)
+        self.assertEqual(ticker.period, 6)
+        layer = layers.Layer(8, 4)
+
+        ticker.draw(layer)
+        lit = layer.rgba[0, :, 3].astype(bool).tolist()
+        self.assertEqual(lit, [1, 1, 1, 0, 0, 0, 1, 1])     # Repeats after the gap
+
+        clock.now = 1.0                                     # 2 pixels left
+        ticker.draw(layer)
+        lit = layer.rgba[0, :, 3].astype(bool).tolist()
+        self.assertEqual(lit, [1, 0, 0, 0, 1, 1, 1, 0])
+
+        clock.now = 3.0                                     # One full period
+        ticker.draw(layer)
+        self.assertEqual(ticker.offset(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import numpy as np
+import layers
+import sprites
+from layers import Compositor, Layer
+
+def base_frame(value=100, h=4, w=6):
+    return np.full((h, w, 3), value, dtype=np.uint8)
+
+class TestBlendModes(unittest.TestCase):
+    def flat(self, blend, rgb, alpha=255, opacity=1.0, base=100):
+        comp = Compositor(6, 4)
+        layer = comp.add('l', opacity=opacity, blend=blend)
+        layer.clear(rgb, alpha)
+        return comp.flatten(base_frame(base))[0, 0].tolist()
+
+    def test_normal(self):
+        self.assertEqual(self.flat('normal', (200, 0, 50)), [200, 0, 50])
+        self.assertEqual(self.flat('normal', (200, 0, 50), alpha=0), [100, 100, 100])
+        self.assertEqual(self.flat('normal', (200, 0, 50), opacity=0.5), [150, 50, 75])
+
+    def test_add_saturates(self):
+        self.assertEqual(self.flat('add', (200, 50, 0)), [255, 150, 100])
+        self.assertEqual(self.flat('add', (200, 50, 0), alpha=0), [100, 100, 100])
+
+    def test_multiply(self):
+        self.assertEqual(self.flat('multiply', (255, 0, 51)), [100, 0, 20])
+        self.assertEqual(self.flat('multiply', (255, 0, 51), opacity=0.0), [100, 100, 100])
+
+    def test_mask_replaces_outside_the_stencil(self):
+        comp = Compositor(6, 4)
+        board = comp.add('board', blend='mask')
+        board.set_color((0, 0, 100))
+        board.fill_alpha(0, 0, 2, 4)            # Hole in the two left columns
+        out = comp.flatten(base_frame(200))
+        self.assertTrue((out[:, :2] == 200).all())
+        self.assertTrue((out[:, 2:] == (0, 0, 100)).all())
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Layer(4, 4, blend='screen')
+
+class TestCompositor(unittest.TestCase):
+    def test_no_visible_layers(self):
+        comp = Compositor(6, 4)
+        self.assertIsNone(comp.flatten(base_frame()))
+        comp.add('hidden').visible = False
+        self.assertIsNone(comp.flatten(base_frame()))
+
+    def test_z_order(self):
+        comp = Compositor(6, 4)
+        comp.add('top', z=5).clear((0, 255, 0), 255)
+        comp.add('bottom', z=1).clear((255, 0, 0), 255)
+        self.assertEqual(comp.flatten(base_frame())[0, 0].tolist(), [0, 255, 0])
+        comp.get('top').z = 0
+        self.assertEqual(comp.flatten(base_frame())[0, 0].tolist(), [255, 0, 0])
+
+    def test_flattens_only_when_something_changed(self):
+        comp = Compositor(6, 4)
+        layer = comp.add('chips')
+        layer.set_pixel(1, 1, (255, 0, 0))
+        frame = base_frame(0)
+
+        comp.flatten(frame)
+        comp.flatten(frame)
+        self.assertEqual(comp.flattens, 1)
+
+        layer.set_pixel(2, 2, (0, 255, 0))      # Layer drawn into
+        out = comp.flatten(frame)
+        self.assertEqual(comp.flattens, 2)
+        self.assertEqual(out[2, 2].tolist(), [0, 255, 0])
+
+        frame[0, 0] = (9, 9, 9)                 # Frame under the layers changed
+        self.assertEqual(comp.flatten(frame)[0, 0].tolist(), [9, 9, 9])
+        self.assertEqual(comp.flattens, 3)
+
+        layer.opacity = 0.5                     # Re-configured
+        comp.flatten(frame)
+        self.assertEqual(comp.flattens, 4)
+
+        comp.remove('chips')
+        self.assertIsNone(comp.flatten(frame))
+
+    def test_base_frame_is_not_modified(self):
+        comp = Compositor(6, 4)
+        comp.add('l').clear((255, 255, 255), 255)
+        frame = base_frame(7)
+        comp.flatten(frame)
+        self.assertTrue((frame == 7).all())
+
+class TestLayerDrawing(unittest.TestCase):
+    def test_draw_sprite_and_clipping(self):
+        layer = Layer(8, 8)
+        layer.dirty = False
+        layer.draw_sprite(sprites.circle_sprite(2), 0, 0, (10, 20, 30))
+        self.assertTrue(layer.dirty)
+        self.assertEqual(layer.rgba[0, 0].tolist(), [10, 20, 30, 255])
+        self.assertEqual(layer.rgba[7, 7].tolist(), [0, 0, 0, 0])
+
+        layer.fill_rect(6, 6, 10, 10, (1, 2, 3), 128)
+        self.assertEqual(layer.rgba[7, 7].tolist(), [1, 2, 3, 128])
+        layer.set_pixel(20, 0, (1, 1, 1))       # Off the layer - ignored
+
+    def test_blit(self):
+        layer = Layer(4, 4)
+        image = np.full((2, 2, 4), 9, dtype=np.uint8)
+        layer.blit(image, 3, -1)
+        self.assertEqual(layer.rgba[0, 3].tolist(), [9, 9, 9, 9])
+        self.assertEqual(int(layer.rgba[..., 3].astype(bool).sum()), 1)
+
+    def test_sprite_mask_matches_sprite(self):
+        sprite = sprites.ring_sprite(5, 2)
+        mask = layers.sprite_mask(sprite)
+        self.assertEqual(mask.shape, (sprite.height, sprite.width))
+        self.assertEqual(int(mask.sum()), len(sprite))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import random
+import unittest
+from maze import ScrollingMaze
+
+class TestScrollingMaze(unittest.TestCase):
+
+    def setUp(self):
+        self.maze = ScrollingMaze(rng=random.Random(11))
+
+    def test_memory_stays_bounded(self):
+        for _ in range(3000):
+            self.maze.step()
+        self.assertLessEqual(len(self.maze.rows), self.maze.view_rows + self.maze.lookahead
+                             + 2 * self.maze.backtrack_rows)
+
+    def test_solver_heads_down_on_open_cells(self):
+        start_y = self.maze.player_y
+        for _ in range(1000):
+            self.maze.step()
+            self.assertFalse(self.maze.is_wall(self.maze.player_x, self.maze.player_y))
+            self.assertGreaterEqual(self.maze.player_y, self.maze.view_top)
+        self.assertGreater(self.maze.player_y, start_y + 200)
+
+    def test_climbs_out_of_dead_ends_without_jumping(self):
+        # Seed 5 leads into a dead end whose way on starts far above the view
+        maze = ScrollingMaze(rng=random.Random(5))
+        scrolled_up = False
+        for _ in range(2000):
+            x, y, view_top = maze.player_x, maze.player_y, maze.view_top
+            maze.step()
+            self.assertEqual(abs(maze.player_x - x) + abs(maze.player_y - y), 1)
+            scrolled_up = scrolled_up or maze.view_top < view_top
+        self.assertTrue(scrolled_up)
+
+    def test_pixels_stay_on_panel(self):
+        for _ in range(500):
+            self.maze.step()
+        for x, y, r, g, b in self.maze.get_pixels():
+            self.assertTrue(0 <= x < 63 and 0 <= y < 63)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+from itertools import islice
+from maze_gen import ALGORITHMS, generate, eller_rows, WALL, PATH
+
+class TestMazeGen(unittest.TestCase):
+
+    def check_perfect(self, grid):
+        # Every room is open, every room is reachable and the passages form
+        # a tree (rooms - 1 openings between rooms), i.e. exactly one path.
+        w, h = grid.width, grid.height
+        cw, ch = (w - 1) // 2, (h - 1) // 2
+        for j in range(ch):
+            for i in range(cw):
+                self.assertFalse(grid.is_wall(2 * i + 1, 2 * j + 1))
+
+        for x in range(w):
+            self.assertTrue(grid.is_wall(x, 0))
+            self.assertTrue(grid.is_wall(x, h - 1))
+        for y in range(h):
+            self.assertTrue(grid.is_wall(0, y))
+            self.assertTrue(grid.is_wall(w - 1, y))
+
+        openings = 0
+        for j in range(ch):
+            for i in range(cw):
+                x, y = 2 * i + 1, 2 * j + 1
+                if i + 1 < cw and not grid.is_wall(x + 1, y):
+                    openings += 1
+                if j + 1 < ch and not grid.is_wall(x, y + 1):
+                    openings += 1
+        self.assertEqual(openings, cw * ch - 1)
+
+        seen = {(1, 1)}
+        stack = [(1, 1)]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if not grid.is_wall(x + dx, y + dy):
+                    nxt = (x + 2 * dx, y + 2 * dy)
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+        self.assertEqual(len(seen), cw * ch)
+
+    def test_all_algorithms_make_perfect_mazes(self):
+        for algorithm in ALGORITHMS:
+            for width, height in [(31, 31), (3, 3), (41, 17), (64, 64)]:
+                with self.subTest(algorithm=algorithm, size=(width, height)):
+                    self.check_perfect(generate(width, height, algorithm, random.Random(7)))
+
+    def test_seeded_generation_is_reproducible(self):
+        for algorithm in ALGORITHMS:
+            a = generate(51, 51, algorithm, random.Random(3))
+            b = generate(51, 51, algorithm, random.Random(3))
+            self.assertEqual(a.cells, b.cells)
+
+    def test_large_maze_does_not_recurse(self):
+        grid = generate(1001, 1001, 'backtracker', random.Random(1))
+        self.assertEqual(grid.cells[1001 + 1], PATH)
+
+    def test_to_rows(self):
+        rows = generate(11, 9, 'kruskal', random.Random(1)).to_rows()
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(len(rows[0]), 11)
+        self.assertTrue(all(rows[0]))
+
+    def test_endless_eller_rows(self):
+        rows = list(islice(eller_rows(21, random.Random(5)), 1001))
+        self.assertTrue(all(len(row) == 21 for row in rows))
+        self.assertTrue(all(c == WALL for c in rows[0]))
+        # Every wall row below the top border has at least one passage down
+        for row in rows[2::2]:
+            self.assertIn(PATH, row)
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            generate(31, 31, 'prim')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+from maze_gen import ALGORITHMS, generate
+from maze_solver import AGENTS, Agent, UNREACHABLE, distance_map, make_agent
+
+class TestMazeSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = generate(31, 31, 'backtracker', random.Random(5))
+        self.dist = distance_map(self.grid, 29, 29)
+
+    def test_distance_map(self):
+        w = self.grid.width
+        self.assertEqual(self.dist[29 * w + 29], 0)
+        for y in range(self.grid.height):
+            for x in range(w):
+                d = self.dist[y * w + x]
+                if self.grid.is_wall(x, y):
+                    self.assertEqual(d, UNREACHABLE)
+                else:
+                    # Perfect maze: every open cell reaches the goal
+                    self.assertGreaterEqual(d, 0)
+
+    def test_goal_in_wall(self):
+        with self.assertRaises(ValueError):
+            distance_map(self.grid, 0, 0)
+
+    def test_shortest_path_length_is_exact(self):
+        agent = make_agent('shortest', self.grid, self.dist, 1, 1)
+        expected = self.dist[self.grid.width + 1]
+        while not agent.done:
+            agent.step()
+        self.assertEqual(agent.steps, expected)
+
+    def test_all_agents_reach_goal(self):
+        for algorithm in ALGORITHMS:
+            grid = generate(41, 41, algorithm, random.Random(9))
+            dist = distance_map(grid, 39, 39)
+            open_cells = grid.cells.count(0)
+            for name in AGENTS:
+                with self.subTest(algorithm=algorithm, agent=name):
+                    agent = make_agent(name, grid, dist, 1, 1, random.Random(1))
+                    # Each passage is walked at most twice by these solvers
+                    for _ in range(4 * open_cells):
+                        if agent.done:
+                            break
+                        agent.step()
+                        self.assertFalse(grid.is_wall(agent.x, agent.y))
+                    self.assertTrue(agent.done)
+                    self.assertGreaterEqual(agent.steps, dist[grid.width + 1])
+
+    def test_agent_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Agent(self.grid, self.dist, 1, 1)
+
+    def test_unknown_agent(self):
+        with self.assertRaises(ValueError):
+            make_agent('random', self.grid, self.dist, 1, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import paddle_sim
+from breakout import BreakoutGame
+from pong import PongGame
+
+def outcomes(results):
+    return sorted((r['params'], r['seed'], r['ticks'], r['winner'], r['score'],
+                   tuple(r['rallies'])) for r in results)
+
+class TestTournament(unittest.TestCase):
+    def test_seeded_matches_are_reproducible(self):
+        for game in paddle_sim.GAMES:
+            with self.subTest(game=game):
+                first = paddle_sim.run_tournament(game, 2, [1.0], [0.0], seed=3,
+                                                  max_ticks=400, workers=1)
+                second = paddle_sim.run_tournament(game, 2, [1.0], [0.0], seed=3,
+                                                   max_ticks=400, workers=1)
+                self.assertEqual(outcomes(first), outcomes(second))
+
+    def test_every_parameter_combination_is_played(self):
+        results = paddle_sim.run_tournament('pong', 3, [0.8, 1.2], [0.0, 0.2],
+                                            seed=1, max_ticks=200, workers=1)
+        self.assertEqual(len(results), 12)
+        summary = paddle_sim.summarize(results)
+        self.assertEqual(sorted(summary), ["speed=0.8 reaction=0.0", "speed=0.8 reaction=0.2",
+                                           "speed=1.2 reaction=0.0", "speed=1.2 reaction=0.2"])
+        for entry in summary.values():
+            self.assertEqual(entry['games'], 3)
+            self.assertEqual(sum(entry['outcomes'].values()), 3)
+            self.assertEqual(entry['ticks']['max'], 200)
+
+    def test_breakout_summary(self):
+        results = paddle_sim.run_tournament('breakout', 2, [1.0], [0.0],
+                                            seed=1, max_ticks=300, workers=1)
+        entry = paddle_sim.summarize(results)["speed=1.0 reaction=0.0"]
+        self.assertEqual(entry['games'], 2)
+        self.assertEqual(entry['score']['count'], 2)
+        self.assertEqual(entry['rally_length']['count'], 2)
+
+class TestRallies(unittest.TestCase):
+    def test_pong_counts_paddle_hits(self):
+        game = PongGame(64, 64)
+        y = game.left_paddle_y + 1
+        game._on_ball_hit('left', 1, 0, game.left_paddle_x, y, -1.0, 0.0)
+        game._on_ball_hit('wall', 0, 1, 30, 0, -1.0, -0.5)
+        y = game.right_paddle_y + 1
+        game._on_ball_hit('right', -1, 0, game.right_paddle_x, y, 1.0, 0.0)
+        self.assertEqual(game.rally, 2)
+
+        game._reset_ball()
+        self.assertEqual((game.rally, game.rally_lengths), (0, [2]))
+
+    def test_breakout_counts_paddle_hits(self):
+        game = BreakoutGame(64, 64)
+        x = game.paddle_x + 1
+        game._on_ball_hit('paddle', 0, -1, x, game.paddle_y, 0.5, 1.0)
+        game._on_ball_hit('paddle', 1, 0, game.paddle_x, game.paddle_y + 1, -0.5, 1.0)
+        game._on_ball_hit('wall', 0, 1, 30, 0, 0.5, -1.0)
+        self.assertEqual(game.paddle_hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
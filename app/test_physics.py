@@ -0,0 +1,118 @@
+import math
+import random
+import unittest
+import breakout
+import pong
+from physics import FixedTimestep, move_ball, reflect, sweep_aabb
+
+class TestSweep(unittest.TestCase):
+
+    def test_hits_near_face(self):
+        t, nx, ny = sweep_aabb(0, 5, 20, 0, 10, 0, 12, 10)
+        self.assertAlmostEqual(t, 0.5)
+        self.assertEqual((nx, ny), (-1, 0))
+
+        t, nx, ny = sweep_aabb(5, 20, 0, -20, 0, 5, 10, 10)
+        self.assertAlmostEqual(t, 0.5)
+        self.assertEqual((nx, ny), (0, 1))
+
+    def test_misses(self):
+        self.assertIsNone(sweep_aabb(0, 20, 20, 0, 10, 0, 12, 10))    # Passes below
+        self.assertIsNone(sweep_aabb(0, 5, 5, 0, 10, 0, 12, 10))      # Stops short
+        self.assertIsNone(sweep_aabb(15, 5, 20, 0, 10, 0, 12, 10))    # Moving away
+        self.assertIsNone(sweep_aabb(11, 5, 1, 0, 10, 0, 12, 10))     # Starts inside
+
+    def test_thin_box_cannot_be_tunnelled(self):
+        # A 0.1 pixel wall crossed in a single 1000 pixel step
+        hit = sweep_aabb(0, 0.5, 1000, 0, 500, 0, 500.1, 1)
+        self.assertIsNotNone(hit)
+        self.assertAlmostEqual(hit[0], 0.5)
+
+    def test_move_ball_bounces_and_keeps_distance(self):
+        boxes = [(10, -100, 11, 100, 'wall')]
+        x, y, vx, vy = move_ball(0, 0, 14, 0, lambda *_: boxes,
+                                 lambda key, nx, ny, x, y, vx, vy: reflect(nx, ny, vx, vy))
+        self.assertEqual((vx, vy), (-14, 0))
+        self.assertAlmostEqual(x, 6, places=4)
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def test_accumulates_steps(self):
+        clock = FixedTimestep(0.05)
+        self.assertEqual(clock.advance(0.02), 0)
+        self.assertAlmostEqual(clock.alpha, 0.4)
+        self.assertEqual(clock.advance(0.04), 1)
+        self.assertEqual(clock.advance(0.1), 2)
+
+    def test_drops_backlog_after_stall(self):
+        clock = FixedTimestep(0.05, max_steps=5)
+        self.assertEqual(clock.advance(10.0), 5)
+        self.assertEqual(clock.advance(0.01), 0)
+
+
+class TestNoTunnelling(unittest.TestCase):
+
+    def test_fast_breakout_ball_hits_first_brick(self):
+        random.seed(1)
+        game = breakout.BreakoutGame(64, 64)
+        game.paddle_x = -100                    # Keep the paddle out of the way
+        left, top = game._brick_origin(breakout.BRICK_ROWS - 1, 3)
+        game.ball_x, game.ball_y = left + 2.5, 50.0
+        game.ball_vx, game.ball_vy = 0.0, -200.0
+        game._move_ball()
+
+        self.assertFalse(game.bricks[breakout.BRICK_ROWS - 1][3])
+        self.assertEqual(game.bricks_remaining, breakout.BRICK_ROWS * breakout.BRICK_COLS - 1)
+        self.assertGreater(game.ball_vy, 0)
+
+    def test_fast_pong_ball_is_returned_by_paddle(self):
+        random.seed(1)
+        game = pong.PongGame(64, 64)
+        game.ball_x = 32.0
+        game.ball_y = game.right_paddle_y + pong.PADDLE_HEIGHT / 2.0
+        game.ball_vx, game.ball_vy = 150.0, 0.0
+        game._move_ball()
+
+        self.assertLess(game.ball_vx, 0)
+        self.assertLess(game.ball_x, game.right_paddle_x)
+
+    def test_breakout_ball_stays_in_play_area(self):
+        random.seed(7)
+        game = breakout.BreakoutGame(64, 64)
+        for _ in range(2000):
+            if game.game_over or game.winner:
+                break
+            game.update()
+            self.assertGreaterEqual(game.ball_x, 0)
+            self.assertLessEqual(game.ball_x, 64)
+            self.assertGreaterEqual(game.ball_y, 0)
+
+class TestHitResponse(unittest.TestCase):
+    # Hits are resolved per substep, but spin and speed-up are per-frame values
+
+    def test_breakout_ai_keeps_the_ball_in_play(self):
+        for seed in (1, 2, 3):
+            with self.subTest(seed=seed):
+                random.seed(seed)
+                game = breakout.BreakoutGame(64, 64)
+                for _ in range(3000):
+                    game.update()
+                    self.assertLessEqual(math.hypot(game.ball_vx, game.ball_vy),
+                                         breakout.MAX_BALL_SPEED + 1e-9)
+                self.assertFalse(game.game_over)
+                self.assertGreater(game.paddle_hits, 50)
+
+    def test_pong_ball_never_exceeds_max_speed(self):
+        random.seed(4)
+        game = pong.PongGame(64, 64)
+        for _ in range(5000):
+            if game.game_over:
+                break
+            game.update()
+            self.assertLessEqual(math.hypot(game.ball_vx, game.ball_vy),
+                                 pong.MAX_BALL_SPEED + 1e-9)
+        self.assertGreater(max(game.rally_lengths), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import playlist
+from playlist import Playlist, PlaylistEntry, PlaylistPlayer
+
+class FakeDisplay:
+    width = 64
+    height = 32
+
+def RunPlain(disp, state=None, runtime_seconds=10):
+    pass
+
+def PreparePlain(width, height, size=1):
+    return ('plain', width, height, size)
+
+def RunNoState(disp):
+    pass
+
+EFFECTS = {
+    'RunPlain': (RunPlain, PreparePlain),
+    'RunOther': (RunPlain, PreparePlain),
+    'RunNoState': (RunNoState, None),
+}
+
+class TestPlaylist(unittest.TestCase):
+    def test_in_order_skipping_disabled_entries(self):
+        entries = [PlaylistEntry('RunPlain'), PlaylistEntry('RunOther', weight=0),
+                   PlaylistEntry('RunNoState')]
+        plist = Playlist(entries, EFFECTS)
+        order = [plist.next_entry().effect for _ in range(5)]
+        self.assertEqual(order, ['RunPlain', 'RunNoState', 'RunPlain', 'RunNoState', 'RunPlain'])
+
+    def test_shuffle_follows_weights_without_repeats(self):
+        entries = [PlaylistEntry('RunPlain', weight=3), PlaylistEntry('RunOther', weight=1),
+                   PlaylistEntry('RunNoState', weight=0)]
+        plist = Playlist(entries, EFFECTS, shuffle=True, rng=random.Random(5))
+        order = [plist.next_entry().effect for _ in range(200)]
+        self.assertNotIn('RunNoState', order)
+        self.assertTrue(all(a != b for a, b in zip(order, order[1:])))
+
+    def test_single_entry_repeats(self):
+        plist = Playlist([PlaylistEntry('RunPlain')], EFFECTS, shuffle=True)
+        self.assertEqual([plist.next_entry().effect for _ in range(3)], ['RunPlain'] * 3)
+
+    def test_validation(self):
+        for entry in [PlaylistEntry('RunMissing'), PlaylistEntry('RunPlain', weight=-1)]:
+            with self.subTest(entry=entry):
+                with self.assertRaises(ValueError):
+                    Playlist([entry], EFFECTS)
+        with self.assertRaises(ValueError):
+            Playlist([PlaylistEntry('RunPlain', weight=0)], EFFECTS)
+
+    def test_resolve_checks_arguments(self):
+        bad = [
+            PlaylistEntry('RunPlain', params={'colour': 3}),
+            PlaylistEntry('RunNoState', params={'size': 3}),
+            PlaylistEntry('RunNoState', duration=5),
+        ]
+        for entry in bad:
+            with self.subTest(entry=entry):
+                with self.assertRaises(ValueError):
+                    Playlist([entry], EFFECTS).resolve(entry)
+        entry = PlaylistEntry('RunPlain', duration=5, params={'size': 2})
+        self.assertEqual(Playlist([entry], EFFECTS).resolve(entry), (RunPlain, PreparePlain))
+
+    def test_load(self):
+        config = {'shuffle': True, 'effects': [
+            {'effect': 'RunPlain', 'duration': 30, 'params': {'size': 4}, 'weight': 2},
+            {'effect': 'RunNoState'},
+        ]}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'playlist.json')
+            with open(path, 'w') as f:
+                json.dump(config, f)
+            plist = playlist.load(path, EFFECTS)
+        self.assertTrue(plist.shuffle)
+        first = plist.entries[0]
+        self.assertEqual((first.effect, first.duration, first.params, first.weight),
+                         ('RunPlain', 30, {'size': 4}, 2))
+        self.assertEqual(plist.entries[1].weight, 1)
+
+    def test_shipped_playlist_matches_main_registry_names(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'playlist.json')
+        with open(path) as f:
+            names = [item['effect'] for item in json.load(f)['effects']]
+        self.assertIn('RunFire', names)
+        self.assertEqual(len(names), len(set(names)))
+
+class TestEffectRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with open(os.path.join(self.tmp.name, 'lazy_effect_mod.py'), 'w') as f:
+            f.write("def RunLazy(disp, state=None):\n    pass\n"
+                    "def RunLazyToo(disp):\n    pass\n"
+                    "class LazyState:\n    def __init__(self, width, height):\n        pass\n")
+        sys.path.insert(0, self.tmp.name)
+        self.addCleanup(sys.path.remove, self.tmp.name)
+        self.addCleanup(sys.modules.pop, 'lazy_effect_mod', None)
+
+    def test_imports_on_first_use_only(self):
+        imported = []
+        registry = playlist.EffectRegistry({
+            'RunLazy': ('lazy_effect_mod', 'LazyState'),
+            'RunLazyToo': ('lazy_effect_mod', None),
+        }, on_import=lambda module: imported.append(module.__name__))
+
+        # Building a playlist only checks names
+        Playlist([PlaylistEntry('RunLazy'), PlaylistEntry('RunLazyToo')], registry)
+        self.assertEqual(sorted(registry), ['RunLazy', 'RunLazyToo'])
+        self.assertNotIn('lazy_effect_mod', sys.modules)
+
+        run, prepare = registry['RunLazy']
+        self.assertEqual((run.__name__, prepare.__name__), ('RunLazy', 'LazyState'))
+        run, prepare = registry['RunLazyToo']
+        self.assertEqual((run.__name__, prepare), ('RunLazyToo', None))
+        self.assertEqual(imported, ['lazy_effect_mod'])
+
+    def test_missing_module_is_an_import_error(self):
+        registry = playlist.EffectRegistry({'RunNothing': ('no_such_effect_module', None)})
+        self.assertIn('RunNothing', registry)
+        with self.assertRaises(ImportError):
+            registry['RunNothing']
+
+class TestPlaylistPlayer(unittest.TestCase):
+    def test_passes_prepared_state_and_duration(self):
+        calls = []
+
+        def run_effect(run, **kwargs):
+            calls.append((run.__name__, kwargs))
+
+        entries = [PlaylistEntry('RunPlain', duration=7, params={'size': 3}),
+                   PlaylistEntry('RunNoState')]
+        player = PlaylistPlayer(Playlist(entries, EFFECTS), FakeDisplay(), run_effect)
+        player.play(count=3)
+        player.close()
+
+        self.assertEqual(calls, [
+            ('RunPlain', {'state': ('plain', 64, 32, 3), 'runtime_seconds': 7}),
+            ('RunNoState', {}),
+            ('RunPlain', {'state': ('plain', 64, 32, 3), 'runtime_seconds': 7}),
+        ])
+
+    def test_next_effect_is_prepared_while_current_runs(self):
+        next_started = threading.Event()
+        main_thread = threading.get_ident()
+        prepared_on = []
+
+        def PrepareFirst(width, height):
+            return 'first'
+
+        def PrepareSecond(width, height):
+            prepared_on.append(threading.get_ident())
+            next_started.set()
+            return 'second'
+
+        def RunFirst(disp, state=None):
+            # The second effect is built while this one is still running
+            self.assertTrue(next_started.wait(2.0))
+
+        effects = {'RunFirst': (RunFirst, PrepareFirst), 'RunSecond': (RunPlain, PrepareSecond)}
+        entries = [PlaylistEntry('RunFirst'), PlaylistEntry('RunSecond')]
+        player = PlaylistPlayer(Playlist(entries, effects), FakeDisplay())
+        player.play(count=1)
+        player.close()
+        self.assertEqual(len(prepared_on), 1)
+        self.assertNotEqual(prepared_on[0], main_thread)
+
+    def test_failed_prepare_is_skipped(self):
+        def PrepareBroken(width, height):
+            raise RuntimeError("no maze today")
+
+        ran = []
+        effects = {'RunBroken': (RunPlain, PrepareBroken), 'RunPlain': (RunPlain, PreparePlain)}
+        entries = [PlaylistEntry('RunBroken'), PlaylistEntry('RunPlain')]
+        player = PlaylistPlayer(Playlist(entries, effects), FakeDisplay(),
+                                lambda run, **kwargs: ran.append(kwargs['state']))
+        with mock.patch('builtins.print'):
+            player.play(count=2)
+        player.close()
+        self.assertEqual(ran, [('plain', 64, 32, 1)])
+
+    def test_failed_entries_are_dropped(self):
+        attempts = []
+
+        def PrepareBroken(width, height):
+            attempts.append(width)
+            raise RuntimeError("no maze today")
+
+        ran = []
+        effects = {'RunBroken': (RunPlain, PrepareBroken), 'RunPlain': (RunPlain, PreparePlain)}
+        entries = [PlaylistEntry('RunBroken'), PlaylistEntry('RunPlain')]
+        player = PlaylistPlayer(Playlist(entries, effects), FakeDisplay(),
+                                lambda run, **kwargs: ran.append(kwargs['state']))
+        with mock.patch('builtins.print'):
+            player.play(count=4)
+        player.close()
+        self.assertEqual(attempts, [64])
+        self.assertEqual(len(ran), 3)
+
+    def test_every_entry_failing_raises(self):
+        entries = [PlaylistEntry('RunPlain', params={'bogus': 1}),
+                   PlaylistEntry('RunOther', params={'bogus': 2})]
+        ran = []
+        player = PlaylistPlayer(Playlist(entries, EFFECTS), FakeDisplay(),
+                                lambda run, **kwargs: ran.append(run))
+        with mock.patch('builtins.print') as printed:
+            with self.assertRaises(ValueError):
+                player.play()
+        player.close()
+        self.assertEqual(ran, [])
+        self.assertEqual(printed.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
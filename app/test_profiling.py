@@ -0,0 +1,127 @@
+import argparse
+import os
+import pstats
+import tempfile
+import time
+import unittest
+from unittest import mock
+import profiling
+from fakes import FakeClock
+
+class FakeDisplay:
+    def __init__(self):
+        self.frame_hooks = []
+
+    def show(self):
+        for hook in list(self.frame_hooks):
+            hook()
+
+def busy(ms):
+    end = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < end:
+        pass
+
+class TestEffectProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.clock = FakeClock()
+
+    def profiler(self, mode):
+        return profiling.EffectProfiler("RunBusy", seconds=1.0, mode=mode,
+                                        out_dir=self.tmp.name, interval=0.001,
+                                        clock=self.clock)
+
+    def test_stops_from_frame_hook_after_time_is_up(self):
+        profiler = self.profiler('cprofile')
+        shown_while_profiling = []
+
+        def RunBusy(disp):
+            for frame in range(5):
+                busy(1)
+                self.clock.now += 0.4
+                disp.show()
+                shown_while_profiling.append(profiler._stop_at is not None)
+
+        disp = FakeDisplay()
+        with mock.patch('builtins.print'):
+            profiler.run(RunBusy, disp)
+
+        # 0.4, 0.8 still running; stopped at 1.2
+        self.assertEqual(shown_while_profiling, [True, True, False, False, False])
+        self.assertEqual(disp.frame_hooks, [])
+        self.assertTrue(profiler.done)
+        names = sorted(os.path.basename(p).rsplit('.', 1)[1] for p in profiler.outputs)
+        self.assertEqual(names, ['pstats', 'txt'])
+        stats = pstats.Stats(profiler.outputs[0])
+        self.assertTrue(any(func[2] == 'busy' for func in stats.stats))
+
+    def test_sample_mode_writes_collapsed_stacks(self):
+        profiler = self.profiler('sample')
+
+        def RunBusy(disp):
+            busy(60)
+
+        with mock.patch('builtins.print'):
+            profiler.run(RunBusy, FakeDisplay())
+
+        self.assertEqual(len(profiler.outputs), 1)
+        with open(profiler.outputs[0]) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertGreater(int(count), 0)
+        # Root first, leaf last: the effect calls busy()
+        stacks = [line.rsplit(' ', 1)[0].split(';') for line in lines]
+        busy_stacks = [s for s in stacks if any(f.startswith('busy (') for f in s)]
+        self.assertTrue(busy_stacks)
+        for frames in busy_stacks:
+            names = [f.split(' ', 1)[0] for f in frames]
+            self.assertLess(names.index('RunBusy'), names.index('busy'))
+
+    def test_profiles_only_the_first_run(self):
+        profiler = self.profiler('both')
+
+        def RunBusy(disp):
+            busy(5)
+
+        def RunOther(disp):
+            pass
+
+        self.assertTrue(profiler.wants(RunBusy))
+        self.assertFalse(profiler.wants(RunOther))
+        with mock.patch('builtins.print'):
+            profiler.run(RunBusy, FakeDisplay())
+        self.assertEqual(len(profiler.outputs), 3)
+        self.assertFalse(profiler.wants(RunBusy))
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            profiling.EffectProfiler("RunFire", mode='perf')
+
+class TestArguments(unittest.TestCase):
+    def parse(self, argv, env):
+        parser = argparse.ArgumentParser()
+        with mock.patch.dict(os.environ, env, clear=True):
+            profiling.add_arguments(parser)
+        return parser.parse_args(argv)
+
+    def test_off_by_default(self):
+        self.assertIsNone(profiling.from_args(self.parse([], {})))
+
+    def test_environment_defaults(self):
+        args = self.parse([], {'LED_PROFILE': 'RunFire', 'LED_PROFILE_SECONDS': '5',
+                               'LED_PROFILE_MODE': 'sample'})
+        profiler = profiling.from_args(args)
+        self.assertEqual((profiler.effect_name, profiler.seconds, profiler.mode),
+                         ('RunFire', 5.0, 'sample'))
+
+    def test_command_line_overrides_environment(self):
+        args = self.parse(['--profile', 'RunSnakeGame', '--profile-mode', 'cprofile'],
+                          {'LED_PROFILE': 'RunFire'})
+        profiler = profiling.from_args(args)
+        self.assertEqual((profiler.effect_name, profiler.mode), ('RunSnakeGame', 'cprofile'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import recording
+from display import Display
+from recording import Recorder, Recording
+from fakes import FakeClock
+
+def make_frames(count, h=8, w=16, seed=1):
+    # A moving dot over a static background, with an occasional full change
+    rng = np.random.default_rng(seed)
+    background = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        frame = background.copy()
+        frame[i % h, (3 * i) % w] = (255, 255, 255)
+        if i == count // 2:
+            frame = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+class TestDelta(unittest.TestCase):
+    def test_round_trip(self):
+        prev, frame = make_frames(2)
+        frame[0, :5] = 1                         # Runs with small gaps get merged
+        frame[0, 7] = 2
+        frame[7, 15] = 3
+        out = prev.copy()
+        recording.apply_delta(recording.encode_delta(prev, frame), out)
+        self.assertTrue((out == frame).all())
+
+    def test_identical_frames(self):
+        frame = make_frames(1)[0]
+        delta = recording.encode_delta(frame, frame)
+        self.assertEqual(len(delta), 4)
+        out = frame.copy()
+        recording.apply_delta(delta, out)
+        self.assertTrue((out == frame).all())
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, 'test.rec')
+
+    def record(self, frames, **kwargs):
+        clock = FakeClock()
+        with Recorder(self.path, 16, 8, clock=clock, **kwargs) as recorder:
+            for frame in frames:
+                recorder.add(frame)
+                clock.now += 0.05
+        return recorder
+
+    def test_frames_come_back_in_order_and_by_seeking(self):
+        frames = make_frames(30)
+        recorder = self.record(frames, keyframe_interval=10)
+        self.assertLess(recorder.bytes_written, 30 * frames[0].nbytes / 2)
+
+        rec = Recording(self.path)
+        self.addCleanup(rec.close)
+        self.assertEqual((rec.width, rec.height, len(rec)), (16, 8, 30))
+        self.assertAlmostEqual(rec.duration, 29 * 0.05)
+        kinds = rec.index['kind'].tolist()
+        self.assertEqual(kinds[0], recording.RAW)
+        self.assertEqual(kinds[10], recording.RAW)
+        self.assertEqual(kinds[15], recording.RAW)   # Delta would be bigger
+        self.assertEqual(kinds[11], recording.DELTA)
+
+        for i, frame in enumerate(frames):
+            self.assertTrue((rec.frame(i) == frame).all(), i)
+        for i in (27, 3, 3, 14, 0):
+            self.assertTrue((rec.frame(i) == frames[i]).all(), i)
+
+    def test_raw_frames_are_views_of_the_file(self):
+        frames = make_frames(3)
+        self.record(frames, compress=False)
+        rec = Recording(self.path)
+        self.addCleanup(rec.close)
+        frame = rec.frame(1)
+        self.assertFalse(frame.flags.writeable)
+        self.assertFalse(frame.flags.owndata)
+        self.assertTrue((frame == frames[1]).all())
+        del frame
+
+    def test_not_a_recording(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            Recording(self.path)
+
+class FakeDisplay:
+    width, height = 16, 8
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.shown = []                         # (time, first pixel)
+
+    def blit(self, image, x=0, y=0):
+        self.image = image.copy()
+
+    def show(self):
+        self.shown.append((round(self.clock.now, 3), int(self.image[0, 0, 0])))
+
+class TestRunRecording(unittest.TestCase):
+    def test_loops_with_the_recorded_timing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'loop.rec')
+            clock = FakeClock()
+            with Recorder(path, 16, 8, clock=clock) as recorder:
+                for value in (1, 2, 3):
+                    recorder.add(np.full((8, 16, 3), value, dtype=np.uint8))
+                    clock.now += 0.05
+
+            clock = FakeClock()
+            disp = FakeDisplay(clock)
+            state = recording.PrepareRecording(16, 8, path)
+            recording.RunRecording(disp, state, runtime_seconds=0.3,
+                                   clock=clock, sleep=clock.sleep)
+            self.assertEqual(disp.shown, [(0.0, 1), (0.05, 2), (0.1, 3),
+                                          (0.15, 1), (0.2, 2), (0.25, 3)])
+
+    def test_single_frame_is_paced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'still.rec')
+            with Recorder(path, 16, 8) as recorder:
+                recorder.add(np.full((8, 16, 3), 7, dtype=np.uint8))
+
+            clock = FakeClock()
+            disp = FakeDisplay(clock)
+            state = recording.PrepareRecording(16, 8, path)
+            recording.RunRecording(disp, state, runtime_seconds=0.2,
+                                   clock=clock, sleep=clock.sleep)
+            step = recording.FRAME_TIME_MS / 1000.0
+            self.assertEqual(disp.shown, [(round(i * step, 3), 7) for i in range(4)])
+
+class TestDisplayRecording(unittest.TestCase):
+    def test_record_and_play_back_headless(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'disp.rec')
+            disp = Display(headless=True)
+            disp.start_recording(path)
+            for i in range(5):
+                disp.clear()
+                disp.draw_rectangle(i, i, 4, 4, (10 * i, 0, 200))
+                disp.show()
+            disp.stop_recording()
+
+            shown = []
+            player = Display(headless=True)
+            player.frame_hooks.append(lambda: shown.append(player.frame.copy()))
+            clock = FakeClock()
+            state = recording.PrepareRecording(64, 64, path)
+            recording.RunRecording(player, state, runtime_seconds=0.01,
+                                   clock=clock, sleep=clock.sleep)
+            self.assertGreaterEqual(len(shown), 1)
+            self.assertEqual(shown[0][0, 0].tolist(), [0, 0, 200])
+            self.assertEqual(shown[0][4, 4].tolist(), [0, 0, 0])
+
+    def test_size_mismatch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'small.rec')
+            with Recorder(path, 16, 8):
+                pass
+            with self.assertRaises(ValueError):
+                recording.PrepareRecording(64, 64, path)
+
+if __name__ == '__main__':
+    unittest.main()
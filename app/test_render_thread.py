@@ -0,0 +1,54 @@
+import time
+import unittest
+from render_thread import RenderThread, TripleBuffer
+
+class TestTripleBuffer(unittest.TestCase):
+
+    def test_newest_frame_wins(self):
+        handoff = TripleBuffer(4)
+        handoff.publish(b'\x01' * 4, 'first')
+        handoff.publish(b'\x02' * 4, 'second')
+        buf, extra = handoff.acquire(timeout=0)
+        self.assertEqual(bytes(buf), b'\x02' * 4)
+        self.assertEqual(extra, 'second')
+        self.assertEqual((handoff.published, handoff.dropped), (2, 1))
+
+    def test_acquire_without_new_frame_times_out(self):
+        handoff = TripleBuffer(4)
+        self.assertIsNone(handoff.acquire(timeout=0.01))
+        handoff.publish(b'\x01' * 4)
+        self.assertIsNotNone(handoff.acquire(timeout=0))
+        self.assertIsNone(handoff.acquire(timeout=0.01))
+
+    def test_front_buffer_untouched_by_later_publishes(self):
+        handoff = TripleBuffer(4)
+        handoff.publish(b'\x01' * 4)
+        front, _ = handoff.acquire(timeout=0)
+        for value in range(2, 10):
+            handoff.publish(bytes([value]) * 4)
+            self.assertEqual(bytes(front), b'\x01' * 4)
+
+    def test_no_torn_frames_across_threads(self):
+        handoff = TripleBuffer(1024)
+        seen = []
+
+        def present(buf, extra):
+            # Every byte of a frame carries the frame number
+            seen.append((len(set(buf)), buf[0], extra))
+
+        renderer = RenderThread(handoff, present)
+        renderer.start()
+        for frame in range(1, 200):
+            handoff.publish(bytes([frame % 256]) * 1024, frame % 256)
+        time.sleep(0.2)
+        renderer.stop()
+
+        self.assertTrue(seen)
+        for distinct, value, extra in seen:
+            self.assertEqual(distinct, 1)
+            self.assertEqual(value, extra)
+        self.assertEqual(seen[-1][1], 199)
+        self.assertEqual(renderer.frames + handoff.dropped, handoff.published)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from scheduler import FrameScheduler
+from fakes import FakeClock
+
+class TestFrameScheduler(unittest.TestCase):
+
+    def setUp(self):
+        # Time only moves when the scheduler sleeps or the test does work;
+        # every reading costs a little so the spin loop terminates
+        self.time = FakeClock(start=100.0, tick=1e-5)
+
+    def make(self, frame_time, **kwargs):
+        return FrameScheduler(frame_time, clock=self.time, sleep=self.time.sleep, **kwargs)
+
+    def test_absolute_deadlines_do_not_drift(self):
+        scheduler = self.make(0.05)
+        for frame in range(1, 101):
+            self.time.now += 0.013       # Work of varying cost per frame
+            self.assertEqual(scheduler.wait(), 1)
+            self.assertAlmostEqual(self.time.now, scheduler.start_time + frame * 0.05, delta=1e-3)
+        self.assertEqual(scheduler.late, 0)
+        self.assertAlmostEqual(scheduler.fps, 20.0, delta=0.1)
+
+    def test_sleeps_then_spins(self):
+        scheduler = self.make(0.05, spin_time=0.002)
+        scheduler.wait()
+        self.assertAlmostEqual(self.time.sleeps[0], 0.048, delta=1e-3)
+
+    def test_catches_up_when_slightly_late(self):
+        scheduler = self.make(0.05, max_catch_up=2)
+        self.time.now += 0.12           # This frame's deadline and the next one passed
+        self.assertEqual(scheduler.wait(), 2)
+        self.assertEqual(scheduler.late, 1)
+        self.assertEqual(scheduler.skipped, 0)
+        self.assertGreater(scheduler.deadline, self.time.now)
+
+    def test_skips_after_long_stall(self):
+        scheduler = self.make(0.05, max_catch_up=2)
+        self.time.now += 1.0
+        self.assertEqual(scheduler.wait(), 1)
+        self.assertEqual(scheduler.skipped, 19)
+        self.assertAlmostEqual(scheduler.deadline - self.time.now, 0.05, delta=1e-3)
+
+    def test_unpaced_never_sleeps_for_long(self):
+        scheduler = self.make(0)
+        for _ in range(10):
+            scheduler.wait()
+        self.assertTrue(all(s == 0 for s in self.time.sleeps))
+
+    def test_run_stops_on_frames_and_passes_dt(self):
+        scheduler = self.make(0.02)
+        dts = []
+        renders = []
+        scheduler.run(dts.append, lambda: renders.append(1), frames=25)
+        self.assertEqual(len(renders), 25)
+        self.assertEqual(set(dts), {0.02})
+        self.assertEqual(scheduler.updates, 25)
+
+    def test_run_stops_on_duration_and_done(self):
+        scheduler = self.make(0.1)
+        scheduler.run(lambda dt: None, lambda: None, duration=1.0)
+        self.assertEqual(scheduler.frames, 10)
+
+        count = []
+        scheduler.run(lambda dt: count.append(1), lambda: None, done=lambda: len(count) >= 3)
+        self.assertEqual(scheduler.frames, 3)
+
+if __name__ == '__main__':
+    unittest.main()
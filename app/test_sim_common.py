@@ -0,0 +1,28 @@
+import argparse
+import unittest
+import sim_common
+
+def add(a, b):
+    return a + b
+
+class TestSimCommon(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(11))
+        self.assertEqual(sim_common.percentile(values, 50), 5)
+        self.assertEqual(sim_common.percentile(values, 90), 9)
+        self.assertEqual(sim_common.percentile(values, 100), 10)
+        self.assertEqual(sim_common.percentile([], 50), 0)
+
+    def test_run_tasks_in_process_and_pooled(self):
+        tasks = [(i, 10 * i) for i in range(5)]
+        self.assertEqual(sim_common.run_tasks(add, tasks, workers=1), [0, 11, 22, 33, 44])
+        self.assertEqual(sim_common.run_tasks(add, tasks, workers=2), [0, 11, 22, 33, 44])
+
+    def test_common_arguments(self):
+        parser = argparse.ArgumentParser()
+        sim_common.add_arguments(parser, 100, 7, "games")
+        args = parser.parse_args(['--workers', '1'])
+        self.assertEqual((args.games, args.seed, args.workers, args.json), (100, 7, 1, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import random
+import unittest
+from snake import SnakeGame
+
+class TestSnakeChangedPixels(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1234)
+        self.game = SnakeGame(32, 32, start_length=5, num_fruits=5, obstacle_coverage=5)
+
+    def full_frame(self):
+        # What a clear-and-redraw of get_pixels() would leave on the panel
+        frame = {}
+        for x, y, r, g, b in self.game.get_pixels():
+            frame[(x, y)] = (r, g, b)
+        return frame
+
+    def test_static_pixels_are_obstacles(self):
+        static = self.game.get_static_pixels()
+        self.assertEqual({(x, y) for x, y, _, _, _ in static}, self.game.obstacles)
+
+    def test_deltas_match_full_redraw(self):
+        frame = {}
+        for x, y, r, g, b in self.game.get_static_pixels():
+            frame[(x, y)] = (r, g, b)
+
+        for _ in range(400):
+            for x, y, r, g, b in self.game.get_changed_pixels():
+                frame[(x, y)] = (r, g, b)
+            lit = {pos: color for pos, color in frame.items() if color != (0, 0, 0)}
+            self.assertEqual(lit, self.full_frame())
+
+            if self.game.game_over or self.game.win:
+                break
+            self.game.update()
+
+    def test_no_changes_without_update(self):
+        self.game.get_changed_pixels()
+        self.assertEqual(self.game.get_changed_pixels(), [])
+
+if __name__ == '__main__':
+    unittest.main()
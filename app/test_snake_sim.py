@@ -0,0 +1,88 @@
+import json
+import random
+import unittest
+import snake_sim
+from snake import SnakeGame
+from snake_sim import GreedySnakeGame, TailSafeSnakeGame
+
+def outcomes(results):
+    # Everything but the timings, which differ from run to run
+    return sorted((r['strategy'], r['seed'], r['fruits'], r['ticks'], r['reason'])
+                  for r in results)
+
+def make_game(game_class):
+    random.seed(3)
+    # Snake (5,5) (4,5) (3,5), heading right, no obstacles
+    return game_class(10, 10, start_length=3, num_fruits=5, obstacle_coverage=0)
+
+def fake_result(strategy, fruits, reason, histogram):
+    return {'strategy': strategy, 'seed': 0, 'fruits': fruits, 'ticks': 10 * fruits,
+            'reason': reason, 'latency_hist': histogram, 'latency_max_us': 5.0}
+
+class TestRunBatch(unittest.TestCase):
+    def test_seeded_games_are_reproducible(self):
+        first = snake_sim.run_batch(['greedy', 'astar'], 3, seed=7, max_ticks=150, workers=1)
+        second = snake_sim.run_batch(['greedy', 'astar'], 3, seed=7, max_ticks=150, workers=1)
+        self.assertEqual(len(first), 6)
+        self.assertEqual(outcomes(first), outcomes(second))
+
+    def test_worker_processes_play_the_same_games(self):
+        serial = snake_sim.run_batch(['greedy'], 4, seed=1, max_ticks=100, workers=1)
+        pooled = snake_sim.run_batch(['greedy'], 4, seed=1, max_ticks=100, workers=2)
+        self.assertEqual(outcomes(serial), outcomes(pooled))
+
+class TestSummarize(unittest.TestCase):
+    def test_per_strategy_stats(self):
+        buckets = len(snake_sim.LATENCY_BUCKETS_US)
+        fast = [0] * buckets
+        fast[0] = 10                            # Every plan <= 10us
+        results = [fake_result('greedy', 4, "Won", fast),
+                   fake_result('greedy', 2, "Hit obstacle", fast),
+                   fake_result('astar', 6, "Tick limit", fast)]
+        summary = snake_sim.summarize(results)
+
+        greedy = summary['greedy']
+        self.assertEqual((greedy['games'], greedy['wins']), (2, 1))
+        self.assertEqual((greedy['fruits_min'], greedy['fruits_max'], greedy['fruits_mean']),
+                         (2, 4, 3.0))
+        self.assertEqual(greedy['reasons'], {"Won": 1, "Hit obstacle": 1})
+        self.assertEqual(greedy['latency_us']['p99'], 10)
+        self.assertEqual(greedy['latency_hist'][0], 20)
+        self.assertEqual(summary['astar']['games'], 1)
+
+    def test_overflow_bucket_is_valid_json(self):
+        slow = [0] * len(snake_sim.LATENCY_BUCKETS_US)
+        slow[0] = 90
+        slow[-1] = 10                           # Slower than the last bound
+        summary = snake_sim.summarize([fake_result('astar', 1, "Won", slow)])
+        latency = summary['astar']['latency_us']
+        self.assertEqual(latency['p50'], 10)
+        self.assertIsNone(latency['p99'])
+        json.dumps(summary, allow_nan=False)
+
+class TestStrategies(unittest.TestCase):
+    def test_greedy_steps_toward_the_fruit(self):
+        game = make_game(GreedySnakeGame)
+        game.fruit_pos = (5, 0)
+        self.assertEqual(game._find_best_move(), (5, 4))
+        game.fruit_pos = (9, 5)
+        self.assertEqual(game._find_best_move(), (6, 5))
+
+    def test_greedy_never_steps_into_its_body(self):
+        game = make_game(GreedySnakeGame)
+        game.fruit_pos = (0, 5)                 # Straight behind the snake
+        self.assertIn(game._find_best_move(), [(5, 4), (5, 6)])
+
+    def test_tailsafe_follows_a_safe_path_to_the_fruit(self):
+        game = make_game(TailSafeSnakeGame)
+        game.fruit_pos = (8, 5)
+        self.assertEqual(game._find_best_move(), (6, 5))
+
+    def test_tailsafe_falls_back_when_the_fruit_is_unreachable(self):
+        game = make_game(TailSafeSnakeGame)
+        game.fruit_pos = (8, 8)
+        game.obstacles = {(7, 8), (9, 8), (8, 7), (8, 9)}
+        self.assertEqual(game._find_best_move(), SnakeGame._find_best_move(game))
+
+if __name__ == '__main__':
+    unittest.main()
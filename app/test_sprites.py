@@ -0,0 +1,53 @@
+import unittest
+import sprites
+
+def reference_x(cx, cy, height, line_width):
+    # Display.draw_x as it was: 4 * line_width separate Bresenham lines
+    half_up = height // 2
+    half_down = height - half_up + 1
+    x1, y1 = cx - half_up, cy - half_up
+    x2, y2 = cx + half_down, cy + half_down
+    x3, y3 = cx + half_down, cy - half_up
+    x4, y4 = cx - half_up, cy + half_down
+    points = set()
+    for i in range(line_width):
+        offset = i - line_width // 2
+        points.update(sprites.line_points(x1 + offset, y1, x2 + offset, y2))
+        points.update(sprites.line_points(x1, y1 + offset, x2, y2 + offset))
+        points.update(sprites.line_points(x3 - offset, y3, x4 - offset, y4))
+        points.update(sprites.line_points(x3, y3 + offset, x4, y4 + offset))
+    return points
+
+class TestSprites(unittest.TestCase):
+
+    def test_line_points(self):
+        self.assertEqual(sprites.line_points(0, 0, 4, 0), [(0, 0), (1, 0), (2, 0), (3, 0)])
+        self.assertEqual(sprites.line_points(2, 5, 2, 2), [(2, 5), (2, 4), (2, 3)])
+        self.assertEqual(sprites.line_points(0, 0, 3, 3), [(0, 0), (1, 1), (2, 2)])
+
+    def test_x_sprite_matches_line_drawing(self):
+        for height, line_width in ((10, 3), (6, 1), (12, 4)):
+            sprite = sprites.x_sprite(height, line_width)
+            shifted = {(32 + dx, 26 + dy) for dx, dy in sprite.points}
+            self.assertEqual(shifted, reference_x(32, 26, height, line_width))
+
+    def test_ring_sprite(self):
+        sprite = sprites.ring_sprite(7, 2)
+        for dx, dy in sprite.points:
+            self.assertTrue(25 <= dx * dx + dy * dy < 49)
+        self.assertNotIn((0, 0), sprite.points)
+        self.assertIn((6, 0), sprite.points)
+
+    def test_mask_matches_points(self):
+        sprite = sprites.circle_sprite(4)
+        self.assertEqual(sum(sprite.mask), len(sprite))
+        self.assertEqual(len(sprite.mask), sprite.width * sprite.height)
+        self.assertEqual((sprite.left, sprite.top, sprite.width), (-3, -3, 7))
+
+    def test_sprites_are_cached(self):
+        self.assertIs(sprites.x_sprite(10, 3), sprites.x_sprite(10, 3))
+        lines = ((0, 0, 5, 0), (0, 1, 5, 1))
+        self.assertIs(sprites.lines_sprite(lines), sprites.lines_sprite(lines))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import os
+import socket
+import tempfile
+import unittest
+import urllib.request
+import telemetry
+from fakes import FakeClock
+
+class FakeDisplay:
+    # Same hook points as display.Display, without the matrix
+    def __init__(self, clock):
+        self.clock = clock
+        self.frame_hooks = []
+
+    def overlay_render(self):
+        self.clock.now += 0.0002
+
+    def text_render(self):
+        self.clock.now += 0.0003
+
+    def _push_frame(self, buf):
+        self.clock.now += 0.0004
+
+    def _swap(self):
+        self.clock.now += 0.005
+
+    def show(self):
+        self.text_render()
+        self.overlay_render()
+        self._push_frame(b'')
+        self._swap()
+        for hook in self.frame_hooks:
+            hook()
+
+def make_effect_class():
+    # A fresh class per test: instrument() patches the class itself
+    class Effect:
+        def __init__(self, clock):
+            self.clock = clock
+
+        def update(self):
+            self.clock.now += 0.002
+
+        def get_pixels(self):
+            self.clock.now += 0.001
+            return []
+    return Effect
+
+class TestTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.stats = telemetry.Telemetry(log_interval=0, json_path=None, port=0, clock=self.clock)
+        self.disp = FakeDisplay(self.clock)
+        self.stats.install(self.disp)
+        self.effect_class = make_effect_class()
+        self.stats.instrument(self.effect_class, update='update', get_pixels='pixels')
+        self.stats.begin_effect("RunTest")
+
+    def run_frames(self, count):
+        effect = self.effect_class(self.clock)
+        for _ in range(count):
+            effect.update()
+            effect.get_pixels()
+            self.clock.now += 0.004          # The effect's own drawing loop
+            self.disp.show()
+            self.clock.now += 0.0121         # Frame pacing sleep
+
+    def test_stage_times(self):
+        self.run_frames(50)
+        stages = self.stats.snapshot()['effects']['RunTest']['stages']
+        expected = {'update': 2.0, 'pixels': 1.0, 'draw': 4.0, 'overlay': 0.2,
+                    'text': 0.3, 'push': 0.4, 'swap': 5.0, 'show': 5.9, 'frame': 25.0}
+        for stage, ms in expected.items():
+            self.assertAlmostEqual(stages[stage]['p50_ms'], ms, places=3, msg=stage)
+        self.assertEqual(stages['frame']['count'], 49)
+        self.assertAlmostEqual(self.stats.fps(), 40.0, places=3)
+
+    def test_instrument_twice_does_not_double_wrap(self):
+        self.stats.instrument(self.effect_class, update='update')
+        self.run_frames(3)
+        self.assertEqual(self.stats.stages[("RunTest", 'update')].count, 3)
+
+    def test_prometheus_format(self):
+        self.run_frames(10)
+        text = self.stats.prometheus()
+        self.assertIn('led_stage_seconds_bucket{effect="RunTest",stage="swap",le="+Inf"} 10', text)
+        self.assertIn('led_stage_seconds_count{effect="RunTest",stage="update"} 10', text)
+        self.assertIn('led_frames_total{effect="RunTest"} 10', text)
+
+    def test_report_writes_json(self):
+        self.run_frames(5)
+        with tempfile.TemporaryDirectory() as tmp:
+            self.stats.json_path = os.path.join(tmp, "stats.json")
+            self.stats.log_line()
+            self.stats.report()
+            with open(self.stats.json_path) as f:
+                data = json.load(f)
+        self.assertEqual(data['effect'], "RunTest")
+        self.assertEqual(data['effects']['RunTest']['frames'], 5)
+
+    def test_http_endpoint(self):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        self.stats.port = port
+        self.stats.start_server()
+        try:
+            self.run_frames(3)
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                self.assertIn(b'led_frames_total{effect="RunTest"} 3', response.read())
+        finally:
+            self.stats.stop_server()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from trajectory import reflect, predict_intercept
+
+class TestTrajectory(unittest.TestCase):
+
+    def test_reflect_inside_range_unchanged(self):
+        self.assertEqual(reflect(10.5, 0, 64), 10.5)
+        self.assertEqual(reflect(64, 0, 64), 64)
+
+    def test_reflect_single_and_multiple_bounces(self):
+        self.assertAlmostEqual(reflect(-3, 0, 64), 3)
+        self.assertAlmostEqual(reflect(70, 0, 64), 58)
+        self.assertAlmostEqual(reflect(128 + 5, 0, 64), 5)
+        self.assertAlmostEqual(reflect(-128 - 5, 0, 64), 5)
+        self.assertAlmostEqual(reflect(64 * 7 + 1, 0, 64), 63)
+
+    def test_moving_away_returns_none(self):
+        self.assertIsNone(predict_intercept(30, 1.5, 10, 1, 4, 0, 64))
+        self.assertIsNone(predict_intercept(30, 0, 10, 1, 60, 0, 64))
+
+    def test_matches_step_simulation(self):
+        # Step the ball one frame at a time with the games' wall bounce rule
+        rng = random.Random(42)
+        height = 64
+        for _ in range(500):
+            vx = rng.choice([-1, 1]) * rng.uniform(0.5, 4.0)
+            vy = rng.uniform(-4.0, 4.0)
+            frames = rng.randint(1, 200)
+            x, y = 100.0, rng.uniform(0, height - 1)
+            target = x + vx * frames
+
+            predicted = predict_intercept(x, vx, y, vy, target, 0, height)
+
+            sim_y, sim_vy = y, vy
+            for _ in range(frames):
+                sim_y += sim_vy
+                if sim_y < 0:
+                    sim_y = -sim_y
+                    sim_vy = abs(sim_vy)
+                elif sim_y >= height:
+                    sim_y = 2 * height - sim_y
+                    sim_vy = -abs(sim_vy)
+            self.assertAlmostEqual(predicted, sim_y, places=6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+import transitions
+from transitions import Transition
+from fakes import FakeClock
+
+def frames(h=8, w=16):
+    a = np.zeros((h, w, 3), dtype=np.uint8)
+    b = np.full((h, w, 3), 200, dtype=np.uint8)
+    return a, b, np.empty_like(a)
+
+class TestBlends(unittest.TestCase):
+    def test_fade(self):
+        a, b, out = frames()
+        for t, expected in [(0.0, 0), (0.5, 100), (0.25, 50)]:
+            with self.subTest(t=t):
+                transitions.fade(a, b, t, out)
+                self.assertTrue((out == expected).all())
+        a[:] = 255
+        b[:] = 255
+        transitions.fade(a, b, 0.7, out)
+        self.assertTrue((out >= 254).all())    # No uint8 overflow
+
+    def test_wipe(self):
+        a, b, out = frames()
+        transitions.wipe(a, b, 0.25, out)
+        self.assertTrue((out[:, :4] == 200).all())
+        self.assertTrue((out[:, 4:] == 0).all())
+
+    def test_dissolve_switches_pixels_in_a_fixed_order(self):
+        a, b, out = frames()
+        switched = []
+        for t in (0.1, 0.5, 0.9):
+            transitions.dissolve(a, b, t, out)
+            mask = out[..., 0] == 200
+            self.assertTrue((out[mask] == 200).all() and (out[~mask] == 0).all())
+            self.assertEqual(mask.sum(), int(t * 8 * 16))
+            switched.append(mask)
+        # Pixels that switched stay switched
+        self.assertTrue((switched[1] >= switched[0]).all())
+        self.assertTrue((switched[2] >= switched[1]).all())
+
+    def test_dissolve_rank_is_a_permutation(self):
+        rank = transitions.dissolve_rank(64, 64)
+        self.assertEqual(sorted(rank.ravel().tolist()), list(range(64 * 64)))
+        self.assertIs(transitions.dissolve_rank(64, 64), rank)
+
+class TestTransition(unittest.TestCase):
+    def test_runs_for_its_duration_from_the_first_blend(self):
+        clock = FakeClock()
+        a, b, out = frames()
+        transition = Transition(a, 'fade', duration=1.0, clock=clock)
+        a[:] = 50                               # Start frame was copied
+
+        clock.now = 10.0
+        self.assertTrue(transition.blend(b, out))
+        self.assertTrue((out == 0).all())
+        clock.now = 10.5
+        self.assertTrue(transition.blend(b, out))
+        self.assertTrue((out == 100).all())
+        clock.now = 11.0
+        self.assertFalse(transition.blend(b, out))
+
+    def test_kinds(self):
+        a, _, _ = frames()
+        self.assertIn(Transition(a, 'random').kind, transitions.KINDS)
+        with self.assertRaises(ValueError):
+            Transition(a, 'spin')
+
+if __name__ == '__main__':
+    unittest.main()
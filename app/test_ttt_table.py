@@ -0,0 +1,67 @@
+import random
+import unittest
+import ttt_table
+from ttt_table import EMPTY, X, O
+
+def brute_force_score(cells, player):
+    # Plain minimax with the same win-fast/lose-slow scoring as the table
+    if ttt_table.winner(cells) is not None:
+        return -10
+    if EMPTY not in cells:
+        return 0
+    opponent = O if player == X else X
+    best = None
+    for i in range(9):
+        if cells[i] == EMPTY:
+            cells[i] = player
+            score = -brute_force_score(cells, opponent)
+            cells[i] = EMPTY
+            score += -1 if score > 0 else (1 if score < 0 else 0)
+            best = score if best is None else max(best, score)
+    return best
+
+class TestTTTTable(unittest.TestCase):
+
+    def test_every_legal_position_is_enumerated(self):
+        self.assertEqual(len(ttt_table.build()), 5478)
+
+    def test_encode_round_trip(self):
+        cells = [X, O, EMPTY, EMPTY, X, EMPTY, O, EMPTY, EMPTY]
+        self.assertEqual(ttt_table.decode(ttt_table.encode(cells)), cells)
+
+    def test_empty_board_is_a_draw(self):
+        self.assertEqual(ttt_table.score(0), 0)
+        self.assertEqual(len(ttt_table.best_moves(0)), 9)
+
+    def test_matches_brute_force_minimax(self):
+        rng = random.Random(5)
+        codes = [c for c, (_, moves) in ttt_table.build().items() if moves]
+        for code in rng.sample(codes, 150):
+            cells = ttt_table.decode(code)
+            player = ttt_table.to_move(cells)
+            with self.subTest(code=code):
+                self.assertEqual(ttt_table.score(code), brute_force_score(cells, player))
+                for move in ttt_table.best_moves(code):
+                    cells[move] = player
+                    child = -ttt_table.score(ttt_table.encode(cells))
+                    cells[move] = EMPTY
+                    child += -1 if child > 0 else (1 if child < 0 else 0)
+                    self.assertEqual(child, ttt_table.score(code))
+
+    def test_table_never_loses_to_random_play(self):
+        rng = random.Random(9)
+        for game in range(300):
+            cells = [EMPTY] * 9
+            table_player = X if game % 2 else O
+            player = X
+            while ttt_table.winner(cells) is None and EMPTY in cells:
+                if player == table_player:
+                    move = rng.choice(ttt_table.best_moves(ttt_table.encode(cells)))
+                else:
+                    move = rng.choice([i for i in range(9) if cells[i] == EMPTY])
+                cells[move] = player
+                player = O if player == X else X
+            self.assertIn(ttt_table.winner(cells), (None, table_player))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Closed-form ball trajectory prediction shared by Pong and Breakout.
+
+Bounces between two parallel walls are "unfolded": instead of stepping the
+ball and reflecting it at every wall, the straight-line position is folded
+back into the playfield with modular arithmetic.  The cost is O(1) however
+fast the ball moves or however many bounces happen on the way.
+"""
+
+
+def reflect(value, low, high):
+    """
+    Fold a straight-line coordinate back between two walls at low and high
+    (mirror reflection at each wall, any number of times).
+    """
+    span = high - low
+    if span <= 0:
+        return low
+    period = 2 * span
+    m = (value - low) % period
+    if m > span:
+        m = period - m
+    return low + m
+
+
+def predict_intercept(pos, vel, cross_pos, cross_vel, target, low, high):
+    """
+    Predict where the ball crosses a line perpendicular to its main axis.
+
+    Args:
+        pos, vel: Ball position and velocity along the main axis
+                  (x for Pong paddles, y for the Breakout paddle)
+        cross_pos, cross_vel: Position and velocity along the bouncing axis
+        target: Main-axis coordinate of the paddle line
+        low, high: Walls the ball bounces between on the cross axis
+
+    Returns:
+        Cross-axis coordinate at the intercept, or None if the ball is not
+        moving toward the target.
+    """
+    distance = target - pos
+    if vel == 0 or distance * vel < 0:
+        return None
+    steps = distance / vel
+    return reflect(cross_pos + cross_vel * steps, low, high)
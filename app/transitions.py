@@ -0,0 +1,116 @@
+"""
+Transitions between effects.
+
+A Transition keeps the last frame of the outgoing effect and blends it with
+each new frame of the incoming one until its time is up:
+    fade      crossfade (integer alpha blend)
+    wipe      the new effect slides in from the left
+    dissolve  pixels switch over in a random order
+
+All three are whole-array NumPy operations on (height, width, 3) uint8
+frames and write into a preallocated output frame, so a 64x64 blend costs
+tens of microseconds.  The dissolve order is a random permutation turned
+into a per-pixel rank once per panel size; each frame is then a single
+comparison against the number of pixels that should have switched.
+
+Usage (Display does this in show()):
+    transition = Transition(last_frame, 'dissolve', 1.0)
+    while transition.blend(new_frame, out):
+        ...present out instead of new_frame...
+"""
+
+import random
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# ============================================================================
+# USER-ADJUSTABLE PARAMETERS
+# ============================================================================
+TRANSITION_SECONDS = 1.0      # Default transition length
+# ============================================================================
+
+KINDS = ('fade', 'wipe', 'dissolve')
+
+
+def fade(a, b, t, out):
+    """out = a * (1 - t) + b * t"""
+    k = int(t * 256)
+    blended = a.astype(np.uint16) * (256 - k)
+    blended += b.astype(np.uint16) * k
+    np.right_shift(blended, 8, out=blended)
+    out[:] = blended
+
+
+def wipe(a, b, t, out):
+    """Columns left of t * width come from b, the rest from a"""
+    edge = int(round(t * a.shape[1]))
+    out[:, :edge] = b[:, :edge]
+    out[:, edge:] = a[:, edge:]
+
+
+@lru_cache(maxsize=None)
+def dissolve_rank(height, width):
+    """Position of every pixel in a random order (one order per panel size)"""
+    order = np.random.default_rng().permutation(height * width)
+    rank = np.empty(height * width, dtype=np.int32)
+    rank[order] = np.arange(height * width, dtype=np.int32)
+    return rank.reshape(height, width)
+
+
+def dissolve(a, b, t, out, rank=None):
+    """The first t * (width * height) pixels of the dissolve order come from b"""
+    if rank is None:
+        rank = dissolve_rank(*a.shape[:2])
+    np.copyto(out, a)
+    np.copyto(out, b, where=(rank < int(t * rank.size))[..., None])
+
+
+BLENDS = {'fade': fade, 'wipe': wipe, 'dissolve': dissolve}
+
+
+class Transition:
+    """Blends from one frame into the frames that follow it"""
+
+    def __init__(self, start_frame, kind='fade', duration=TRANSITION_SECONDS,
+                 clock=time.monotonic):
+        """
+        Args:
+            start_frame: Last frame of the outgoing effect (copied)
+            kind: One of KINDS, or 'random'
+            duration: Seconds, counted from the first blended frame
+            clock: Time source
+        """
+        if kind == 'random':
+            kind = random.choice(KINDS)
+        if kind not in BLENDS:
+            raise ValueError(f"Unknown transition: {kind}")
+        self.kind = kind
+        self.start_frame = np.array(start_frame, dtype=np.uint8)
+        self.duration = duration
+        self.clock = clock
+        self.start_time = None
+
+    def progress(self):
+        """0.0 -> 1.0 over the duration (starting with the first blend)"""
+        now = self.clock()
+        if self.start_time is None:
+            self.start_time = now
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, (now - self.start_time) / self.duration)
+
+    def blend(self, frame, out):
+        """
+        Write the blended frame into out.
+
+        Returns:
+            False once the transition is over (out is left untouched; show
+            frame itself from now on)
+        """
+        t = self.progress()
+        if t >= 1.0:
+            return False
+        BLENDS[self.kind](self.start_frame, frame, t, out)
+        return True
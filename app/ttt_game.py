@@ -2,6 +2,9 @@ from display import Display
 import time
 import random
 
+import sprites
+import ttt_table
+
 # ============================================================================
 # USER-ADJUSTABLE PARAMETERS
 # ============================================================================
@@ -47,12 +50,34 @@ text_color = (175,175,175)
 
 brd_color  = (125,125,125)
 
+# Board lines (x1, y1, x2, y2), each two pixels thick
+BOARD_LINES = (
+    #Left Vertical
+    (32-(18//2),   2, 32-(18//2),   52),
+    (32-(18//2)-1, 2, 32-(18//2)-1, 52),
+    #Right Vertical
+    (32+(18//2),   2, 32+(18//2),   52),
+    (32+(18//2)+1, 2, 32+(18//2)+1, 52),
+    #Upper Horizontal
+    (8, 26+(18//2),   58, 26+(18//2)),
+    (8, 26+(18//2)+1, 58, 26+(18//2)+1),
+    #Lower Horizontal
+    (8, 26-(18//2),   58, 26-(18//2)),
+    (8, 26-(18//2)+1, 58, 26-(18//2)+1),
+)
+
+
+
+def ttt_Prepare( width=64, height=64 ):
+    """Solve the whole game tree up front so every move is a lookup"""
+    return ttt_table.build()
 
 
-def ttt_RunGame( disp ):
+def ttt_RunGame( disp, state=None, runtime_seconds=RUNTIME_SECONDS ):
     """
-    Run multiple TicTacToe games for RUNTIME_SECONDS.
+    Run multiple TicTacToe games for runtime_seconds.
     Games get progressively faster as time goes on.
+    state is the solved table from ttt_Prepare() (solved here if not given).
     """
 
     random.seed(time.time())
@@ -65,13 +90,16 @@ def ttt_RunGame( disp ):
     disp.text_loadFont('8x13B.bdf')
     #disp.text_loadFont('9x15B.bdf')
 
+    if state is None:
+        ttt_Prepare()
+
     start_time = time.time()
 
     while True:
         # Check if runtime limit exceeded
         elapsed = time.time() - start_time
-        if elapsed >= RUNTIME_SECONDS:
-            print(f"TTT runtime limit ({RUNTIME_SECONDS} seconds) reached after {game_count} games")
+        if elapsed >= runtime_seconds:
+            print(f"TTT runtime limit ({runtime_seconds} seconds) reached after {game_count} games")
             time.sleep(3.0)
             return
 
@@ -136,22 +164,8 @@ def Clear_Board():
             game_board[col][row] = None
 
 def Draw_Board(disp):
-    
-    #Left Vertical
-    disp.draw_line( 32-(18/2),   2, 32-(18/2),   52, brd_color)
-    disp.draw_line( 32-(18/2)-1, 2, 32-(18/2)-1, 52, brd_color)
-
-    #Right Vertical
-    disp.draw_line( 32+(18/2),   2, 32+(18/2),   52, brd_color)
-    disp.draw_line( 32+(18/2)+1, 2, 32+(18/2)+1, 52, brd_color)
-
-    #Upper Horizontal
-    disp.draw_line( 8, 26+(18/2),   58, 26+(18/2),   brd_color)
-    disp.draw_line( 8, 26+(18/2)+1, 58, 26+(18/2)+1, brd_color)
-
-    #Lower Horizontal
-    disp.draw_line( 8, 26-(18/2),   58, 26-(18/2),   brd_color)
-    disp.draw_line( 8, 26-(18/2)+1, 58, 26-(18/2)+1, brd_color)
+    # Rasterized once, then stamped every frame
+    disp.draw_sprite(sprites.lines_sprite(BOARD_LINES), 0, 0, brd_color)
 
 def Check_For_Winner():
 
@@ -194,156 +208,25 @@ def Check_for_Draw():
 def Get_Next_Move(turn):
     """
     AI move generator that never loses!
-    Uses minimax algorithm with strategic priorities and optimizations
-    """
-    # Special rule #1: If turn=0 and board is empty, take center
-    if turn == 0 and Get_Piece_Count() == 0:
-        game_board[1][1] = 'X'
-        return
-    
-    # Early game optimization: Use strategic priorities before full minimax
-    piece_count = Get_Piece_Count()
-    if piece_count <= 4:
-        move = get_strategic_move(turn)
-        if move:
-            col, row = move
-            piece = 'X' if turn == 0 else 'O'
-            game_board[col][row] = piece
-            return
-    
-    # Find the best move using minimax for mid/late game
-    best_move = find_best_move(turn)
-    
-    if best_move:
-        col, row = best_move
-        if turn == 0:
-            game_board[col][row] = 'X'
-        else:
-            game_board[col][row] = 'O'
-
-
-def get_strategic_move(turn):
-    """
-    Fast strategic move selection for early game
-    Returns (col, row) or None if no strategic move found
+    Looks the position up in the precomputed game tree (ttt_table) and
+    plays one of the optimal moves at random
     """
     piece = 'X' if turn == 0 else 'O'
-    opponent = 'O' if turn == 0 else 'X'
-    
-    # Priority 1: Win immediately if possible
-    for col in range(3):
-        for row in range(3):
-            if game_board[col][row] is None:
-                game_board[col][row] = piece
-                if Check_For_Winner() == piece:
-                    game_board[col][row] = None
-                    return (col, row)
-                game_board[col][row] = None
-    
-    # Priority 2: Block opponent win
-    for col in range(3):
-        for row in range(3):
-            if game_board[col][row] is None:
-                game_board[col][row] = opponent
-                if Check_For_Winner() == opponent:
-                    game_board[col][row] = None
-                    return (col, row)
-                game_board[col][row] = None
-    
-    # Priority 3: Take corners
-    corners = [(0,0), (0,2), (2,0), (2,2)]
-    available_corners = [pos for pos in corners if game_board[pos[0]][pos[1]] is None]
-    if available_corners:
-        return random.choice(available_corners)
-    
-    # Priority 4: Take edges
-    edges = [(0,1), (1,0), (1,2), (2,1)]
-    available_edges = [pos for pos in edges if game_board[pos[0]][pos[1]] is None]
-    if available_edges:
-        return random.choice(available_edges)
-    
-    return None
-
 
-def Get_Piece_Count():
-    sum = 0
+    # Board -> base-3 code (cell index = row * 3 + col, see diagram above)
+    code = 0
     for col in range(3):
         for row in range(3):
-            if game_board[col][row] is not None:
-                sum += 1
-    return sum
+            cell = game_board[col][row]
+            if cell is not None:
+                code += (ttt_table.X if cell == 'X' else ttt_table.O) * ttt_table.POWERS[row * 3 + col]
 
+    # Special rule #1: If turn=0 and board is empty, take center
+    if turn == 0 and code == 0:
+        game_board[1][1] = 'X'
+        return
 
-def find_best_move(turn):
-    """
-    Find the best move using minimax algorithm with alpha-beta pruning
-    Returns (col, row) tuple of best move
-    """
-    current_player = 'X' if turn == 0 else 'O'
-    best_score = float('-inf')
-    best_move = None
-    
-    # Try all empty squares
-    for col in range(3):
-        for row in range(3):
-            if game_board[col][row] is None:
-                # Make the move
-                game_board[col][row] = current_player
-                
-                # Evaluate this move with alpha-beta pruning
-                score = minimax_ab(current_player, False, 0, float('-inf'), float('inf'))
-                
-                # Undo the move
-                game_board[col][row] = None
-                
-                # Update best move if this is better
-                if score > best_score:
-                    best_score = score
-                    best_move = (col, row)
-    
-    return best_move
-
-
-def minimax_ab(player, is_maximizing, depth, alpha, beta):
-    """
-    Minimax with alpha-beta pruning for faster evaluation
-    """
-    winner = Check_For_Winner()
-    
-    # Terminal states
-    if winner == player:
-        return 10 - depth
-    elif winner is not None:
-        return -10 + depth
-    elif Check_for_Draw():
-        return 0
-    
-    if is_maximizing:
-        max_score = float('-inf')
-        current_piece = player
-        for col in range(3):
-            for row in range(3):
-                if game_board[col][row] is None:
-                    game_board[col][row] = current_piece
-                    score = minimax_ab(player, False, depth + 1, alpha, beta)
-                    game_board[col][row] = None
-                    max_score = max(score, max_score)
-                    alpha = max(alpha, score)
-                    if beta <= alpha:
-                        break  # Alpha-beta pruning
-        return max_score
-    else:
-        min_score = float('inf')
-        opponent_piece = 'O' if player == 'X' else 'X'
-        for col in range(3):
-            for row in range(3):
-                if game_board[col][row] is None:
-                    game_board[col][row] = opponent_piece
-                    score = minimax_ab(player, True, depth + 1, alpha, beta)
-                    game_board[col][row] = None
-                    min_score = min(score, min_score)
-                    beta = min(beta, score)
-                    if beta <= alpha:
-                        break  # Alpha-beta pruning
-        return min_score
-
+    moves = ttt_table.best_moves(code)
+    if moves:
+        row, col = divmod(random.choice(moves), 3)
+        game_board[col][row] = piece
@@ -0,0 +1,117 @@
+"""
+Precomputed tic-tac-toe game tree.
+
+Every position reachable from the empty board (5,478 of them, X moving
+first) is solved once, the first time a move is asked for, and the set of
+optimal moves for each is kept in a lookup table.  After that, choosing a
+move is a dictionary lookup instead of a minimax search.
+
+Positions are encoded as base-3 integers: cell i (0-8, row-major, as in the
+ttt_game board diagram) contributes EMPTY/X/O * 3**i.
+
+Scores follow the old minimax: a win is worth more the sooner it comes and a
+loss costs less the later it comes, so the table prefers quick wins and
+stalls losses.
+"""
+
+EMPTY = 0
+X = 1
+O = 2
+
+LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8),      # Rows
+         (0, 3, 6), (1, 4, 7), (2, 5, 8),      # Columns
+         (0, 4, 8), (2, 4, 6))                 # Diagonals
+
+POWERS = tuple(3 ** i for i in range(9))
+
+# code -> (score for the player to move, tuple of optimal cells)
+_table = {}
+
+
+def encode(cells):
+    """Base-3 code for a sequence of 9 cells (EMPTY, X or O)"""
+    code = 0
+    for i, cell in enumerate(cells):
+        code += cell * POWERS[i]
+    return code
+
+
+def decode(code):
+    """List of 9 cells for a base-3 code"""
+    cells = []
+    for _ in range(9):
+        code, cell = divmod(code, 3)
+        cells.append(cell)
+    return cells
+
+
+def winner(cells):
+    """X, O or None"""
+    for a, b, c in LINES:
+        if cells[a] != EMPTY and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return None
+
+
+def to_move(cells):
+    """Whose turn it is in a position reached with X moving first"""
+    return X if cells.count(X) == cells.count(O) else O
+
+
+def _solve(code, cells, player):
+    """Negamax over the whole tree below `code`, filling _table as it goes"""
+    entry = _table.get(code)
+    if entry is not None:
+        return entry[0]
+
+    if winner(cells) is not None:
+        # The previous player just completed a line
+        entry = (-10, ())
+    elif EMPTY not in cells:
+        entry = (0, ())
+    else:
+        opponent = O if player == X else X
+        best_score = None
+        best_moves = []
+        for i in range(9):
+            if cells[i] != EMPTY:
+                continue
+            cells[i] = player
+            score = -_solve(code + player * POWERS[i], cells, opponent)
+            cells[i] = EMPTY
+            # Results further away are worth less (win fast, lose slow)
+            if score > 0:
+                score -= 1
+            elif score < 0:
+                score += 1
+            if best_score is None or score > best_score:
+                best_score = score
+                best_moves = [i]
+            elif score == best_score:
+                best_moves.append(i)
+        entry = (best_score, tuple(best_moves))
+
+    _table[code] = entry
+    return entry[0]
+
+
+def build():
+    """Solve every reachable position (only does work the first time)"""
+    if not _table:
+        _solve(0, [EMPTY] * 9, X)
+    return _table
+
+
+def best_moves(code):
+    """
+    Optimal cells (0-8) for the player to move in position `code`.
+
+    Returns an empty tuple for finished games.  Raises KeyError for codes
+    that cannot be reached with X moving first.
+    """
+    return build()[code][1]
+
+
+def score(code):
+    """Game value for the player to move: >0 win, 0 draw, <0 loss"""
+    return build()[code][0]